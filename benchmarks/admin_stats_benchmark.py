@@ -0,0 +1,97 @@
+"""Time the dashboard KPIs: the old per-widget queries against ReportsModel.get_admin_stats.
+
+Run from the project root:  python -m benchmarks.admin_stats_benchmark [--finances 1000000]
+"""
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+from models.db_manager import DBManager, close_all_pools
+from models.migrations import migrate
+from models.reports_model import ReportsModel
+
+
+def create_database(path, clients, finances, invitations):
+    migrate(path)
+    rng = random.Random(42)
+    with sqlite3.connect(path) as conn:
+        conn.executemany(
+            "INSERT INTO clients (client_code, name, phone, subscription_type, start_date, end_date, amount_remaining, freeze_days) "
+            "VALUES (?, ?, ?, 'Normal', DATE('now', ?), DATE('now', ?), ?, ?)",
+            [(f"CL{i:07d}", f"Client {i}", f"+2010{i:08d}", f"-{rng.randrange(400)} day", f"{rng.randrange(-200, 200)} day",
+              rng.choice([0, 0, 0, 150]), rng.choice([0] * 9 + [14])) for i in range(clients)]
+        )
+        conn.executemany(
+            "INSERT INTO finances (client_id, category, amount, description, created_at, recorded_by) "
+            "VALUES (?, ?, ?, '', DATETIME('now', ?), 1)",
+            ((rng.randrange(1, clients + 1), rng.choice(['payment', 'payment', 'payment', 'expense']),
+              rng.randrange(50, 2000), f"-{rng.randrange(730 * 24 * 60)} minute") for _ in range(finances))
+        )
+        conn.executemany(
+            "INSERT INTO invitations (client_id, friend_name, tagged) VALUES (?, ?, ?)",
+            ((rng.randrange(1, clients + 1), f"Friend {i}", rng.randrange(2)) for i in range(invitations))
+        )
+        conn.commit()
+    migrate(path)
+    with sqlite3.connect(path) as conn:
+        conn.execute("ANALYZE")
+
+
+def legacy_admin_stats(db):
+    # What DashboardWindow.get_admin_stats used to do
+    total_clients = len(db.fetchall("SELECT client_code, name, phone, subscription_type, start_date, end_date FROM clients"))
+    db.fetchone("SELECT COUNT(*) FROM clients WHERE end_date >= DATE('now') AND freeze_days = 0")
+    db.fetchone("SELECT COUNT(*) FROM clients WHERE freeze_days > 0")
+    db.fetchone("SELECT COUNT(*) FROM clients WHERE end_date BETWEEN DATE('now') AND DATE('now', '+7 day')")
+    revenue = sum([float(row[3]) for row in db.fetchall("SELECT * FROM finances") if row[2] == 'payment'])
+    total_invites = len(db.fetchall("SELECT * FROM invitations"))
+    tagged_invites = len([i for i in db.fetchall("SELECT * FROM invitations") if i[5]])
+    db.fetchone("SELECT COUNT(*) FROM clients WHERE amount_remaining > 0 AND end_date >= DATE('now')")
+    db.fetchone("SELECT SUM(amount) FROM finances WHERE category='payment' AND DATE(created_at)=DATE('now')")
+    return total_clients, revenue, total_invites, tagged_invites
+
+
+def best_of(repeat, func):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--clients', type=int, default=50000)
+    parser.add_argument('--finances', type=int, default=1000000)
+    parser.add_argument('--invitations', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'stats.db')
+        create_database(path, args.clients, args.finances, args.invitations)
+        db = DBManager(path)
+        model = ReportsModel()
+        model.db = db
+
+        legacy = legacy_admin_stats(db)
+        stats = model.get_admin_stats()
+        assert legacy == (stats.total_clients, stats.revenue, stats.total_invites, stats.tagged_invites)
+
+        legacy_time = best_of(args.repeat, lambda: legacy_admin_stats(db))
+        new_time = best_of(args.repeat, model.get_admin_stats)
+        close_all_pools()
+
+    print(f"{args.clients} clients, {args.finances} finance rows, {args.invitations} invitations")
+    print(f"legacy get_admin_stats: {legacy_time * 1000:9.1f} ms")
+    print(f"ReportsModel.get_admin_stats: {new_time * 1000:9.1f} ms")
+    print(f"speedup: {legacy_time / new_time:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""Compare connect-per-statement against the pooled DBManager.
+
+Run from the project root:  python -m benchmarks.db_pool_benchmark
+"""
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+
+from models.db_manager import DBManager, close_all_pools
+
+SCHEMA_PATH = os.path.join(os.path.dirname(__file__), '../db/schema.sql')
+
+
+def create_database(path, clients=2000):
+    with sqlite3.connect(path) as conn:
+        with open(SCHEMA_PATH, 'r', encoding='utf-8') as f:
+            conn.executescript(f.read())
+        conn.executemany(
+            "INSERT INTO clients (client_code, name, phone, subscription_type, start_date, end_date) VALUES (?, ?, ?, ?, ?, ?)",
+            [(f"CL{i:06d}", f"Client {i}", f"+2010{i:08d}", 'Normal', '2025-01-01', '2025-12-31') for i in range(clients)]
+        )
+        conn.commit()
+
+
+def run_legacy(path, statements):
+    # The previous DBManager behaviour: one sqlite3.connect() per statement
+    start = time.perf_counter()
+    for i in range(statements):
+        with sqlite3.connect(path) as conn:
+            conn.execute("SELECT name FROM clients WHERE id = ?", (i % 2000 + 1,)).fetchone()
+    return statements / (time.perf_counter() - start)
+
+
+def run_pooled(path, statements):
+    start = time.perf_counter()
+    for i in range(statements):
+        DBManager(path).fetchone("SELECT name FROM clients WHERE id = ?", (i % 2000 + 1,))
+    return statements / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--statements', type=int, default=20000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.db')
+        create_database(path)
+        legacy = run_legacy(path, args.statements)
+        pooled = run_pooled(path, args.statements)
+        close_all_pools()
+
+    print(f"connect-per-call: {legacy:10.0f} statements/sec")
+    print(f"pooled:           {pooled:10.0f} statements/sec")
+    print(f"speedup:          {pooled / legacy:10.1f}x")
+
+
+if __name__ == '__main__':
+    main()
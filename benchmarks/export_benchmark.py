@@ -0,0 +1,90 @@
+"""Time and peak memory of the streaming report exports as the report grows.
+
+Fills a copy of the database with synthetic payments for the current month,
+then exports the monthly financials report at increasing sizes, each in a
+fresh process so the peak RSS belongs to that export alone. Memory should stay
+flat while the row count grows.
+
+Run from the project root:  python -m benchmarks.export_benchmark [--rows 1000000]
+"""
+import argparse
+import os
+import random
+import resource
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def fill(db_path, rows):
+    month = date.today().strftime('%Y-%m')
+    rng = random.Random(42)
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO finances (client_id, category, amount, description, created_at, recorded_by) VALUES (NULL, 'payment', ?, ?, ?, 1)",
+        ((round(rng.uniform(10, 500), 2), f'Membership payment #{i}', f'{month}-{1 + i % 28:02d} 10:00:00')
+         for i in range(rows)))
+    conn.commit()
+    conn.close()
+
+
+def export(db_path, fmt, limit, out_path):
+    """Child process: export at most limit rows and print 'rows seconds peak_rss_mb'."""
+    import models.db_manager as db_manager
+    import models.reports_model as reports_model
+    db_manager.DEFAULT_DB_PATH = db_path
+    spec = reports_model.EXPORT_REPORTS['financials']
+    reports_model.EXPORT_REPORTS['financials'] = spec._replace(query=f'{spec.query} LIMIT {int(limit)}')
+    model = reports_model.ReportsModel()
+    start = time.perf_counter()
+    write = model.export_to_pdf if fmt == 'pdf' else model.export_to_excel
+    count = write('financials', out_path)
+    elapsed = time.perf_counter() - start
+    print(count, elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--child', nargs=4, metavar=('DB', 'FORMAT', 'LIMIT', 'OUT'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        export(*args.child)
+        return
+
+    import models.db_manager as db_manager
+    from models.migrations import migrate
+
+    workdir = tempfile.mkdtemp()
+    try:
+        db_path = os.path.join(workdir, 'benchmark.db')
+        shutil.copyfile(db_manager.DEFAULT_DB_PATH, db_path)
+        migrate(db_path)
+        fill(db_path, args.rows)
+
+        # No memory-mapped I/O, so RSS reflects the export rather than the database file
+        env = dict(os.environ, GYM_DB_PROFILE='low_memory')
+        sizes = sorted({max(args.rows // 100, 1), max(args.rows // 10, 1), args.rows})
+        print(f"{'format':<8}{'rows':>10}{'seconds':>10}{'rows/sec':>12}{'peak MB':>10}{'file MB':>10}")
+        for fmt in ('xlsx', 'pdf'):
+            for size in sizes:
+                out_path = os.path.join(workdir, f'export.{fmt}')
+                result = subprocess.run(
+                    [sys.executable, '-m', 'benchmarks.export_benchmark', '--child', db_path, fmt, str(size), out_path],
+                    cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+                count, seconds, peak_mb = result.stdout.split()
+                count, seconds = int(count), float(seconds)
+                print(f'{fmt:<8}{count:>10,}{seconds:>10.1f}{count / seconds:>12,.0f}{float(peak_mb):>10.0f}'
+                      f'{os.path.getsize(out_path) / 2**20:>10.1f}')
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
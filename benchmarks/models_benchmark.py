@@ -0,0 +1,284 @@
+"""Time every public model method, and AuthController.login, against generated databases.
+
+Databases come from db/sample_data.py and are cached under --data-dir, one per
+scale, seed and day. Each run works on a copy, so the write methods do not
+change the cached data. Results are written as JSON. Medians are checked
+against benchmarks/models_thresholds.json, and with --baseline also against a
+stored result file, failing a case that got slower by more than --tolerance.
+The run exits with status 1 if any check fails.
+
+Run from the project root:
+    python -m benchmarks.models_benchmark --scales tiny,small --output results.json
+    python -m benchmarks.models_benchmark --scales tiny,small --baseline results.json
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date
+
+import models.db_manager as db_manager
+from db.sample_data import SCALES, generate
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+THRESHOLDS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'models_thresholds.json')
+
+
+def prepare_database(data_dir, scale, seed, today):
+    """Path of a working copy of the generated database for this scale, generating it if needed."""
+    os.makedirs(data_dir, exist_ok=True)
+    source = os.path.join(data_dir, f'{scale}_seed{seed}_{today.isoformat()}.db')
+    if not os.path.exists(source):
+        partial = source + '.partial'
+        if os.path.exists(partial):
+            os.remove(partial)
+        print(f'Generating the {scale} dataset in {source} ...', file=sys.stderr)
+        generate(partial, scale, seed, today)
+        # Fold the WAL back in so a plain file copy is complete
+        with sqlite3.connect(partial) as conn:
+            conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        os.replace(partial, source)
+    work = os.path.join(tempfile.mkdtemp(), f'{scale}.db')
+    shutil.copyfile(source, work)
+    return work
+
+
+def sample_values(db_path, today):
+    """Realistic arguments taken from the generated data: a busy client, trainer, day and user."""
+    conn = sqlite3.connect(db_path)
+    client_id, code, name = conn.execute(
+        "SELECT c.id, c.client_code, c.name FROM clients c "
+        "JOIN (SELECT client_id, COUNT(*) AS n FROM attendance GROUP BY client_id ORDER BY n DESC LIMIT 1) a "
+        "ON a.client_id = c.id").fetchone()
+    loan_client = conn.execute(
+        "SELECT client_id FROM loans WHERE client_id IS NOT NULL GROUP BY client_id ORDER BY COUNT(*) DESC LIMIT 1"
+    ).fetchone()[0]
+    trainer = conn.execute("SELECT trainer_name FROM private_sessions LIMIT 1").fetchone()[0]
+    conn.close()
+    return {
+        'client_id': client_id, 'client_code': code, 'name_part': name.split()[0], 'loan_client': loan_client,
+        'trainer': trainer, 'day': today.isoformat(), 'month': today.strftime('%Y-%m'), 'user_id': 1,
+    }
+
+
+def drain(rows):
+    """Consume a streamed result, the way an export does, and return how many rows it had."""
+    count = 0
+    for _ in rows:
+        count += 1
+    return count
+
+
+def ignore_progress(done, total):
+    pass
+
+
+def cases(v, out_dir):
+    """(name, callable) for every public model method and AuthController.login."""
+    from controllers.auth_controller import AuthController
+    from models.attendance_model import AttendanceModel
+    from models.client_model import ClientModel
+    from models.finance_model import FinanceModel
+    from models.invitation_model import InvitationModel
+    from models.loans_model import LoansModel
+    from models.reports_model import ReportsModel
+    from models.session_model import SessionModel
+
+    clients, attendance, finance = ClientModel(), AttendanceModel(), FinanceModel()
+    loans, sessions, reports, auth = LoansModel(), SessionModel(), ReportsModel(), AuthController()
+    invitations, db = InvitationModel(), db_manager.DBManager()
+
+    def client_round_trip():
+        # add, update and delete one client, so repeated runs leave the table as it was
+        clients.add(('BENCH001', 'Bench Client', '+201000000000', 'Normal', v['day'], v['day']))
+        clients.update('BENCH001', ('Bench Client 2', '+201000000001', 'Normal', v['day'], v['day']))
+        clients.delete('BENCH001')
+
+    return [
+        ('ClientModel.get_all', clients.get_all),
+        ('ClientModel.search[code]', lambda: clients.search(v['client_code'])),
+        ('ClientModel.search[name]', lambda: clients.search(v['name_part'])),
+        ('ClientModel.search[short]', lambda: clients.search(v['name_part'][:2])),
+        ('ClientModel.count', clients.count),
+        ('ClientModel.count[active]', lambda: clients.count(status='active')),
+        ('ClientModel.get_status_counts', clients.get_status_counts),
+        ('ClientModel.get_page[first]', lambda: clients.get_page(0, 100)),
+        ('ClientModel.get_page[deep,end_date desc]',
+         lambda: clients.get_page(clients.count() // 2, 100, sort_column='end_date', descending=True)),
+        ('ClientModel.get_page[keyword]', lambda: clients.get_page(0, 100, keyword=v['name_part'])),
+        ('ClientModel.add+update+delete', client_round_trip),
+        ('AttendanceModel.log_checkin', lambda: attendance.log_checkin(v['client_id'], v['user_id'])),
+        ('AttendanceModel.get_by_date', lambda: attendance.get_by_date(v['day'])),
+        ('AttendanceModel.get_by_client', lambda: attendance.get_by_client(v['client_id'])),
+        ('FinanceModel.add_payment', lambda: finance.add_payment(v['client_id'], 100, 'Benchmark', v['user_id'])),
+        ('FinanceModel.add_expense', lambda: finance.add_expense('expense', 10, 'Benchmark', v['user_id'])),
+        ('FinanceModel.get_payments_by_date', lambda: finance.get_payments_by_date(v['day'])),
+        ('FinanceModel.get_expenses_by_date', lambda: finance.get_expenses_by_date(v['day'])),
+        ('FinanceModel.get_unmatched_payments', finance.get_unmatched_payments),
+        ('FinanceModel.get_daily_payments_by_user',
+         lambda: finance.get_daily_payments_by_user(v['user_id'], v['day'])),
+        ('FinanceModel.get_financial_stats', finance.get_financial_stats),
+        ('FinanceModel.get_all', finance.get_all),
+        ('LoansModel.add_loan', lambda: loans.add_loan(v['loan_client'], 50, 'Benchmark')),
+        ('LoansModel.get_by_client', lambda: loans.get_by_client(v['loan_client'])),
+        ('LoansModel.get_all', loans.get_all),
+        ('LoansModel.get_running_balance', lambda: loans.get_running_balance(v['loan_client'])),
+        ('LoansModel.search', loans.search),
+        ('LoansModel.search[client,range]', lambda: loans.search(v['name_part'], amount_range='100_500')),
+        ('LoansModel.get_stats', loans.get_stats),
+        ('LoansModel.export_rows', lambda: drain(loans.export_rows(ignore_progress))),
+        ('SessionModel.add_session',
+         lambda: sessions.add_session(v['client_id'], v['trainer'], v['day'], 'personal', 0)),
+        ('SessionModel.get_by_trainer', lambda: sessions.get_by_trainer(v['trainer'])),
+        ('SessionModel.get_by_client', lambda: sessions.get_by_client(v['client_id'])),
+        ('SessionModel.get_all', sessions.get_all),
+        ('SessionModel.search[first page]', lambda: sessions.search(limit=200)),
+        ('SessionModel.search[trainer,client]',
+         lambda: sessions.search(trainer=v['trainer'][:9], client_text=v['name_part'], limit=200)),
+        ('SessionModel.count', sessions.count),
+        ('SessionModel.get_stats', sessions.get_stats),
+        ('SessionModel.export_rows', lambda: drain(sessions.export_rows(ignore_progress))),
+        ('InvitationModel.search[first page]', lambda: invitations.search(limit=200)),
+        ('InvitationModel.count', invitations.count),
+        ('InvitationModel.export_rows', lambda: drain(invitations.export_rows(ignore_progress))),
+        ('DBManager.fetchiter', lambda: drain(db.fetchiter("SELECT * FROM attendance"))),
+        ('ReportsModel.get_registered_today', reports.get_registered_today),
+        ('ReportsModel.get_paid_today', reports.get_paid_today),
+        ('ReportsModel.get_attended_today', reports.get_attended_today),
+        ('ReportsModel.get_monthly_financials', lambda: reports.get_monthly_financials(v['month'])),
+        ('ReportsModel.get_missing_payments', reports.get_missing_payments),
+        ('ReportsModel.get_admin_stats', reports.get_admin_stats),
+        ('ReportsModel.export_count', lambda: reports.export_count('financials', v['month'])),
+        ('ReportsModel.export_to_pdf',
+         lambda: reports.export_to_pdf('financials', os.path.join(out_dir, 'report.pdf'), month=v['month'])),
+        ('ReportsModel.export_to_excel',
+         lambda: reports.export_to_excel('financials', os.path.join(out_dir, 'report.xlsx'), month=v['month'])),
+        ('AuthController.login', lambda: auth.login('admin', 'admin123', 'admin')),
+    ]
+
+
+def measure(fn, repeat, max_seconds):
+    """Milliseconds per call after one warm-up call; stops early once max_seconds is spent."""
+    fn()
+    times = []
+    started = time.perf_counter()
+    while len(times) < repeat:
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+        if time.perf_counter() - started > max_seconds:
+            break
+    return {'median_ms': statistics.median(times), 'min_ms': min(times), 'runs': len(times)}
+
+
+def run_scale(args, scale, today):
+    db_path = prepare_database(args.data_dir, scale, args.seed, today)
+    work_dir = os.path.dirname(db_path)
+    db_manager.DEFAULT_DB_PATH = db_path
+    try:
+        values = sample_values(db_path, today)
+        results = {}
+        for name, fn in cases(values, work_dir):
+            if args.filter and args.filter not in name:
+                continue
+            results[name] = measure(fn, args.repeat, args.max_seconds)
+            print(f"{scale:<8}{name:<48}{results[name]['median_ms']:>12.2f} ms", file=sys.stderr)
+        return results
+    finally:
+        db_manager.close_all_pools()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def compare(results, baseline, tolerance, min_delta_ms):
+    """Cases whose median grew by more than tolerance (and min_delta_ms) against the baseline."""
+    regressions = []
+    for scale, cases_ in results.items():
+        for name, result in cases_.items():
+            base = baseline.get('results', {}).get(scale, {}).get(name)
+            if base is None:
+                continue
+            now, before = result['median_ms'], base['median_ms']
+            if now > before * (1 + tolerance) and now - before > min_delta_ms:
+                regressions.append((scale, name, before, now))
+    return regressions
+
+
+def check_thresholds(results, thresholds):
+    """Cases whose median is above its limit in thresholds: {scale: {case: max median_ms}}."""
+    failures = []
+    for scale, cases_ in results.items():
+        for name, limit in thresholds.get(scale, {}).items():
+            if name in cases_ and cases_[name]['median_ms'] > limit:
+                failures.append(f"{scale} {name}: {cases_[name]['median_ms']:.2f} ms > threshold {limit}")
+    return failures
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scales', default='tiny,small', help=f"comma separated, from {', '.join(SCALES)}")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--max-seconds', type=float, default=3.0, help='time budget per case before cutting repeats')
+    parser.add_argument('--filter', help='only cases whose name contains this text')
+    parser.add_argument('--data-dir', default=os.path.join(tempfile.gettempdir(), 'gym_benchmarks'))
+    parser.add_argument('--thresholds', default=THRESHOLDS)
+    parser.add_argument('--output', help='write the JSON results here (default: stdout)')
+    parser.add_argument('--baseline', help='JSON results of an earlier run to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed slowdown as a fraction (0.25 = 25%%)')
+    parser.add_argument('--min-delta-ms', type=float, default=1.0, help='ignore slowdowns smaller than this')
+    args = parser.parse_args()
+
+    scales = [scale.strip() for scale in args.scales.split(',') if scale.strip()]
+    unknown = [scale for scale in scales if scale not in SCALES]
+    if unknown:
+        parser.error(f"unknown scale(s): {', '.join(unknown)}")
+
+    today = date.today()
+    report = {
+        'meta': {
+            'commit': git_commit(), 'date': today.isoformat(), 'seed': args.seed, 'repeat': args.repeat,
+            'python': platform.python_version(), 'sqlite': sqlite3.sqlite_version, 'platform': platform.platform(),
+            'db_profile': db_manager.POOL_SETTINGS['profile'],
+        },
+        'results': {scale: run_scale(args, scale, today) for scale in scales},
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+    failures = []
+    if args.thresholds and os.path.exists(args.thresholds):
+        with open(args.thresholds, encoding='utf-8') as f:
+            failures += check_thresholds(report['results'], json.load(f))
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(report['results'], baseline, args.tolerance, args.min_delta_ms)
+        failures += [f'{scale} {name}: {before:.2f} ms -> {now:.2f} ms ({now / before - 1:+.0%})'
+                     for scale, name, before, now in regressions]
+    for failure in failures:
+        print('FAIL:', failure, file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
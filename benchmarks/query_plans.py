@@ -0,0 +1,79 @@
+"""Check that the date-filtered model queries are answered from indexes.
+
+Runs EXPLAIN QUERY PLAN for each query against a freshly built database and
+exits non-zero if any of them falls back to a full table scan.
+
+Run from the project root:  python -m benchmarks.query_plans
+"""
+import os
+import sys
+import tempfile
+
+from models.db_manager import DBManager, close_all_pools
+from models.migrations import migrate
+from models.attendance_model import AttendanceModel
+from models.finance_model import FinanceModel
+from models.reports_model import ReportsModel
+
+
+class PlanRecorder(DBManager):
+    def __init__(self, db_path):
+        super().__init__(db_path)
+        self.plans = []
+
+    def _explain(self, query, params):
+        with self.connect() as conn:
+            rows = conn.execute("EXPLAIN QUERY PLAN " + query, params).fetchall()
+        self.plans.append((query, [row[3] for row in rows]))
+        return []
+
+    def fetchall(self, query, params=()):
+        return self._explain(query, params)
+
+    def fetchone(self, query, params=()):
+        self._explain(query, params)
+        return None
+
+
+def full_scans(details):
+    # "SCAN t" is a full table scan; "SCAN t USING ... INDEX" walks an index
+    return [d for d in details if d.startswith('SCAN ') and 'INDEX' not in d]
+
+
+CHECKS = [
+    (AttendanceModel, lambda m: m.get_by_date('2025-07-02')),
+    (FinanceModel, lambda m: m.get_payments_by_date('2025-07-02')),
+    (FinanceModel, lambda m: m.get_expenses_by_date('2025-07-02')),
+    (FinanceModel, lambda m: m.get_daily_payments_by_user(1, '2025-07-02')),
+    (ReportsModel, lambda m: m.get_registered_today()),
+    (ReportsModel, lambda m: m.get_paid_today()),
+    (ReportsModel, lambda m: m.get_attended_today()),
+    (ReportsModel, lambda m: m.get_monthly_financials('2025-07')),
+    (ReportsModel, lambda m: m.get_missing_payments()),
+]
+
+
+def main():
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'plans.db')
+        migrate(path)
+        recorder = PlanRecorder(path)
+        for model_cls, call in CHECKS:
+            model = model_cls()
+            model.db = recorder
+            call(model)
+        close_all_pools()
+
+    for query, details in recorder.plans:
+        scans = full_scans(details)
+        status = 'FULL SCAN' if scans else 'ok'
+        failures += bool(scans)
+        print(f"[{status}] {' '.join(query.split())}")
+        for detail in details:
+            print(f"    {detail}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
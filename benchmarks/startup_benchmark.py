@@ -0,0 +1,66 @@
+"""Startup import-time budget: what `import main` costs before the login window can appear.
+
+Runs `python -X importtime -c "import main"` in fresh interpreters, reports the
+median cumulative time and the slowest modules, and fails (exit status 1) when
+the median exceeds the budget or a deferred module is imported at startup.
+
+Run from the project root:  python -m benchmarks.startup_benchmark [--runs 5] [--budget-ms 200]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Only needed once an export runs or a module view is opened
+DEFERRED = ('pandas', 'numpy', 'openpyxl', 'reportlab', 'views.dashboard_view', 'views.clients_view',
+            'views.attendance_view', 'views.finance_view', 'views.sessions_view', 'views.invitations_view',
+            'views.loans_view', 'views.reports_view', 'views.user_management_view')
+
+
+def import_times(target='main'):
+    """Return {module: (self_us, cumulative_us)} for one cold import of target."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {target}'],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--budget-ms', type=float, default=200.0)
+    parser.add_argument('--top', type=int, default=10, help='number of slowest modules to list')
+    args = parser.parse_args()
+
+    runs = [import_times() for _ in range(args.runs)]
+    total_ms = statistics.median(run['main'][1] for run in runs) / 1000
+    last = runs[-1]
+
+    print(f"import main: {total_ms:.1f} ms (median of {args.runs}, budget {args.budget_ms:.0f} ms)")
+    print(f"{'self ms':>9} {'cumulative ms':>14}  module")
+    for name, (self_us, cumulative_us) in sorted(last.items(), key=lambda item: -item[1][0])[:args.top]:
+        print(f'{self_us / 1000:>9.1f} {cumulative_us / 1000:>14.1f}  {name}')
+
+    failures = []
+    if total_ms > args.budget_ms:
+        failures.append(f'startup import time {total_ms:.1f} ms exceeds the {args.budget_ms:.0f} ms budget')
+    eager = [name for name in DEFERRED if name in last]
+    if eager:
+        failures.append('imported at startup but should be deferred: ' + ', '.join(eager))
+    for failure in failures:
+        print('FAIL:', failure)
+    if failures:
+        sys.exit(1)
+    print('OK')
+
+
+if __name__ == '__main__':
+    main()
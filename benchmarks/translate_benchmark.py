@@ -0,0 +1,60 @@
+"""Measure Translator.translate() calls/sec: the old per-call dictionary against the cached catalog.
+
+Run from the project root:  python -m benchmarks.translate_benchmark [--calls 200000]
+"""
+import argparse
+import random
+import time
+
+from i18n.translator import ARABIC_TRANSLATIONS, Translator
+
+
+class _NoApp:
+    # Translator only needs somewhere to (un)install its QTranslator
+    def removeTranslator(self, translator):
+        pass
+
+    def installTranslator(self, translator):
+        pass
+
+
+def legacy_translate_function():
+    """Rebuild the old translate(), which evaluated the whole dictionary literal on every call."""
+    entries = ',\n'.join(f'        {key!r}: {value!r}' for key, value in ARABIC_TRANSLATIONS.items())
+    source = f"def translate(text):\n    translations = {{\n{entries}\n    }}\n    return translations.get(text, text)\n"
+    namespace = {}
+    exec(compile(source, '<legacy translate>', 'exec'), namespace)
+    return namespace['translate']
+
+
+def calls_per_second(translate, texts):
+    start = time.perf_counter()
+    for text in texts:
+        translate(text)
+    return len(texts) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--calls', type=int, default=200000)
+    args = parser.parse_args()
+
+    # Mostly known labels, some untranslated strings such as client names
+    rng = random.Random(42)
+    keys = list(ARABIC_TRANSLATIONS)
+    texts = [rng.choice(keys) if rng.random() < 0.9 else f"Client {i}" for i in range(args.calls)]
+
+    translator = Translator(_NoApp())
+    translator.set_language('ar')
+    legacy = legacy_translate_function()
+    assert all(legacy(text) == translator.translate(text) for text in texts[:1000])
+
+    legacy_rate = calls_per_second(legacy, texts[:max(args.calls // 50, 1)])
+    catalog_rate = calls_per_second(translator.translate, texts)
+    print(f"{len(keys)} Arabic strings")
+    print(f"legacy translate():  {legacy_rate:>14,.0f} calls/sec")
+    print(f"catalog translate(): {catalog_rate:>14,.0f} calls/sec  ({catalog_rate / legacy_rate:,.0f}x)")
+
+
+if __name__ == '__main__':
+    main()
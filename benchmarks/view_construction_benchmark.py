@@ -0,0 +1,134 @@
+"""Measure how long each module view takes to build and show under different stylesheet setups.
+
+  theme  per-view sheets from views/styles, loaded once by views.theme (what the app does)
+  none   no stylesheet at all, the floor set by widget creation and data loading
+  app    every view's rules merged into one application stylesheet, scoped by view class
+
+The app variant is what a single "compiled" theme would look like. Qt matches an
+application stylesheet against every widget in the process, so it measures slower
+than the per-view sheets; that is why the views keep calling apply_theme().
+
+Runs offscreen against a copy of the database:
+    python -m benchmarks.view_construction_benchmark [--repeat 5] [--db path]
+"""
+import argparse
+import collections
+import importlib
+import os
+import re
+import shutil
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtCore import QCoreApplication, QEvent
+from PyQt5.QtWidgets import QApplication
+
+import models.db_manager as db_manager
+from models.migrations import migrate
+
+VIEWS = {
+    'clients': ('views.clients_view', 'ClientsView'),
+    'finance': ('views.finance_view', 'FinanceView'),
+    'loans': ('views.loans_view', 'LoansView'),
+    'sessions': ('views.sessions_view', 'SessionsView'),
+    'invitations': ('views.invitations_view', 'InvitationsView'),
+    'attendance': ('views.attendance_view', 'AttendanceView'),
+    'reports': ('views.reports_view', 'ReportsView'),
+    'user_management': ('views.user_management_view', 'UserManagementView'),
+}
+
+COMMENT = re.compile(r'/\*.*?\*/', re.S)
+RULE = re.compile(r'([^{}]+)\{([^{}]*)\}')
+
+
+def scoped(selector, class_name):
+    """Selectors that restrict a rule to widgets of class_name and their children."""
+    selectors = []
+    if re.match(r'QWidget(?!\w)', selector):
+        selectors.append(class_name + selector[len('QWidget'):])
+    selectors.append(f'{class_name} {selector}')
+    return selectors
+
+
+def merged_app_stylesheet(sheets):
+    """One stylesheet for all views; identical rules are written once with every view's scope."""
+    groups = collections.OrderedDict()
+    for class_name, qss in sheets:
+        for selectors, body in RULE.findall(COMMENT.sub('', qss)):
+            for selector in selectors.split(','):
+                selector = ' '.join(selector.split())
+                if selector:
+                    groups.setdefault((selector, body.strip()), []).append(class_name)
+    return '\n'.join(
+        ', '.join(s for name in names for s in scoped(selector, name)) + ' {' + body + '}'
+        for (selector, body), names in groups.items()
+    )
+
+
+def build_times(app, translator, classes, repeat):
+    """Best-of-repeat milliseconds to construct, show and lay out each view."""
+    times = {}
+    for _ in range(repeat):
+        for name, view_class in classes.items():
+            start = time.perf_counter()
+            view = view_class(translator)
+            view.show()
+            app.processEvents()
+            elapsed = (time.perf_counter() - start) * 1000
+            times[name] = min(times.get(name, elapsed), elapsed)
+            view.close()
+            view.deleteLater()
+            QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--db', default=db_manager.DEFAULT_DB_PATH, help='database to copy and build the views against')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    db_path = os.path.join(workdir, 'benchmark.db')
+    shutil.copyfile(args.db, db_path)
+    migrate(db_path)
+    db_manager.DEFAULT_DB_PATH = db_path
+
+    app = QApplication([])
+    from i18n.translator import Translator
+    from views.theme import load_stylesheet
+    translator = Translator(app)
+
+    classes = {name: getattr(importlib.import_module(module), class_name)
+               for name, (module, class_name) in VIEWS.items()}
+    apply_styles = {name: view_class.apply_styles for name, view_class in classes.items()}
+    sheets = [(classes[name].__name__, load_stylesheet(name)) for name in VIEWS]
+
+    # Warm up imports, the stylesheet cache and the connection pool
+    build_times(app, translator, classes, 1)
+    results = {'theme': build_times(app, translator, classes, args.repeat)}
+
+    for view_class in classes.values():
+        view_class.apply_styles = lambda self: None
+    results['none'] = build_times(app, translator, classes, args.repeat)
+
+    app.setStyleSheet(merged_app_stylesheet(sheets))
+    results['app'] = build_times(app, translator, classes, args.repeat)
+    app.setStyleSheet('')
+    for name, view_class in classes.items():
+        view_class.apply_styles = apply_styles[name]
+
+    modes = list(results)
+    print(f"{'view':<18}" + ''.join(f'{mode:>10}' for mode in modes) + '   (ms, best of %d)' % args.repeat)
+    for name in VIEWS:
+        print(f'{name:<18}' + ''.join(f'{results[mode][name]:>10.1f}' for mode in modes))
+    print(f"{'total':<18}" + ''.join(f'{sum(results[mode].values()):>10.1f}' for mode in modes))
+
+    db_manager.close_all_pools()
+    shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,215 @@
+"""Offscreen benchmarks for the heaviest views, with thresholds that fail on regression.
+
+For each view this measures, against a generated database (see
+models_benchmark):
+  construct_ms  building and showing the view until its first queries have landed
+  fill_ms       reloading its data: ClientTableModel refresh, ReportsView.load_all_reports,
+                LoansView.load_loans, DashboardWindow.create_main_content (via reload_data)
+  language_ms   switching to Arabic and retranslating the view in place
+  peak_rss_mb   peak resident memory of a process that only built this view
+
+Every view runs in its own process, so peak memory belongs to that view.
+Medians are checked against benchmarks/views_thresholds.json, and against
+--baseline with --tolerance when one is given. The run exits with status 1 if
+any check fails.
+
+Run from the project root:
+    python -m benchmarks.views_benchmark --scales small [--output results.json] [--baseline old.json]
+"""
+import argparse
+import json
+import os
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date
+
+from benchmarks.models_benchmark import compare, git_commit, prepare_database
+from db.sample_data import SCALES
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+THRESHOLDS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'views_thresholds.json')
+VIEWS = ('clients', 'reports', 'loans', 'dashboard')
+TIMINGS = ('construct_ms', 'fill_ms', 'language_ms')
+ADMIN = (1, 'admin', 'admin')
+
+
+def build(name, translator):
+    """Return (view, fill) where fill() reloads the view's data."""
+    if name == 'clients':
+        from views.clients_view import ClientsView
+        view = ClientsView(translator)
+        return view, view.load_clients
+    if name == 'reports':
+        from views.reports_view import ReportsView
+        view = ReportsView(translator)
+        return view, view.load_all_reports
+    if name == 'loans':
+        from views.loans_view import LoansView
+        view = LoansView(translator)
+        return view, view.load_loans
+    if name == 'dashboard':
+        from views.dashboard_view import DashboardWindow
+        view = DashboardWindow(ADMIN, translator)
+        return view, view.reload_data
+    raise ValueError(f'Unknown view: {name}')
+
+
+def settle(app, view):
+    """Process events until every background query of the view has been delivered."""
+    from views.query_worker import QueryRunner
+    app.processEvents()
+    for runner in view.findChildren(QueryRunner):
+        while runner.is_loading():
+            runner.wait()
+            app.processEvents()
+    app.processEvents()
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def run_view(name, db_path, repeat):
+    """Child process: measure one view and print its results as JSON."""
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    import models.db_manager as db_manager
+    db_manager.DEFAULT_DB_PATH = db_path
+
+    from PyQt5.QtCore import QCoreApplication, QEvent
+    from PyQt5.QtWidgets import QApplication
+    from i18n.translator import Translator
+    app = QApplication([])
+    translator = Translator(app)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    construct, fill, language = [], [], []
+    for i in range(repeat + 1):
+        holder = {}
+
+        def construct_view():
+            holder['view'], holder['fill'] = build(name, translator)
+            holder['view'].show()
+            settle(app, holder['view'])
+
+        elapsed = timed(construct_view)
+        view, fill_view = holder['view'], holder['fill']
+        if i:  # the first round warms imports, stylesheets and the connection pool
+            construct.append(elapsed)
+            fill.append(timed(lambda: (fill_view(), settle(app, view))))
+
+            def switch():
+                translator.set_language('ar')
+                view.retranslate_ui()
+                settle(app, view)
+            language.append(timed(switch))
+            translator.set_language('en')
+            view.retranslate_ui()
+            settle(app, view)
+        view.close()
+        view.deleteLater()
+        QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps({
+        'construct_ms': statistics.median(construct),
+        'fill_ms': statistics.median(fill),
+        'language_ms': statistics.median(language),
+        'peak_rss_mb': round(peak, 1),
+        'view_rss_mb': round(peak - rss_before, 1),
+    }))
+    db_manager.close_all_pools()
+
+
+def check_thresholds(results, thresholds):
+    failures = []
+    for scale, views in results.items():
+        for view, metrics in views.items():
+            for metric, limit in thresholds.get(scale, {}).get(view, {}).items():
+                if metrics.get(metric, 0) > limit:
+                    failures.append(f'{scale} {view} {metric}: {metrics[metric]:.1f} > threshold {limit}')
+    return failures
+
+
+def timing_cases(results):
+    """The timings in the shape models_benchmark.compare() expects: {scale: {'view.metric': {'median_ms': ...}}}."""
+    return {scale: {f'{view}.{metric}': {'median_ms': metrics[metric]}
+                    for view, metrics in views.items() for metric in TIMINGS}
+            for scale, views in results.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scales', default='small', help=f"comma separated, from {', '.join(SCALES)}")
+    parser.add_argument('--views', default=','.join(VIEWS))
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--data-dir', default=os.path.join(tempfile.gettempdir(), 'gym_benchmarks'))
+    parser.add_argument('--thresholds', default=THRESHOLDS)
+    parser.add_argument('--output', help='write the JSON results here (default: stdout)')
+    parser.add_argument('--baseline', help='JSON results of an earlier run to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.25)
+    parser.add_argument('--min-delta-ms', type=float, default=5.0)
+    parser.add_argument('--child', nargs=3, metavar=('VIEW', 'DB', 'REPEAT'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        run_view(args.child[0], args.child[1], int(args.child[2]))
+        return
+
+    scales = [scale for scale in args.scales.split(',') if scale]
+    views = [view for view in args.views.split(',') if view]
+    today = date.today()
+    results = {}
+    for scale in scales:
+        db_path = prepare_database(args.data_dir, scale, args.seed, today)
+        results[scale] = {}
+        try:
+            for view in views:
+                env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+                child = subprocess.run(
+                    [sys.executable, '-m', 'benchmarks.views_benchmark', '--child', view, db_path, str(args.repeat)],
+                    cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+                results[scale][view] = json.loads(child.stdout.strip().splitlines()[-1])
+                metrics = results[scale][view]
+                print(f"{scale:<8}{view:<11}construct {metrics['construct_ms']:>8.1f} ms   fill {metrics['fill_ms']:>8.1f} ms"
+                      f"   language {metrics['language_ms']:>7.1f} ms   peak {metrics['peak_rss_mb']:>6.0f} MB",
+                      file=sys.stderr)
+        finally:
+            shutil.rmtree(os.path.dirname(db_path), ignore_errors=True)
+
+    report = {
+        'meta': {'commit': git_commit(), 'date': today.isoformat(), 'seed': args.seed, 'repeat': args.repeat},
+        'results': results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+    failures = []
+    if args.thresholds and os.path.exists(args.thresholds):
+        with open(args.thresholds, encoding='utf-8') as f:
+            failures += check_thresholds(results, json.load(f))
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(timing_cases(results), {'results': timing_cases(baseline.get('results', {}))},
+                              args.tolerance, args.min_delta_ms)
+        failures += [f'{scale} {name}: {before:.1f} ms -> {now:.1f} ms ({now / before - 1:+.0%})'
+                     for scale, name, before, now in regressions]
+    for failure in failures:
+        print('FAIL:', failure, file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,7 @@
 from models.attendance_model import AttendanceModel
+from controllers.instrumentation import instrument
 
+@instrument
 class AttendanceController:
     def __init__(self):
         self.model = AttendanceModel()
@@ -1,6 +1,8 @@
 from models.db_manager import DBManager
 import hashlib
+from controllers.instrumentation import instrument
 
+@instrument
 class AuthController:
     def __init__(self):
         self.db = DBManager()
@@ -1,5 +1,7 @@
 from models.client_model import ClientModel
+from controllers.instrumentation import instrument
 
+@instrument
 class ClientsController:
     def __init__(self):
         self.model = ClientModel()
@@ -7,8 +9,17 @@ class ClientsController:
     def load_all(self):
         return self.model.get_all()
 
-    def search(self, keyword):
-        return self.model.search(keyword)
+    def search(self, keyword, limit=None):
+        return self.model.search(keyword, limit)
+
+    def count(self, keyword=None, status=None):
+        return self.model.count(keyword, status)
+
+    def get_page(self, offset, limit, keyword=None, sort_column='client_code', descending=False, status=None):
+        return self.model.get_page(offset, limit, keyword, sort_column, descending, status)
+
+    def get_status_counts(self):
+        return self.model.get_status_counts()
 
     def add(self, data):
         return self.model.add(data)
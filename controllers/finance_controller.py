@@ -1,5 +1,7 @@
 from models.finance_model import FinanceModel
+from controllers.instrumentation import instrument
 
+@instrument
 class FinanceController:
     def __init__(self):
         self.model = FinanceModel()
@@ -22,5 +24,8 @@ class FinanceController:
     def get_daily_payments_by_user(self, user_id, date):
         return self.model.get_daily_payments_by_user(user_id, date)
 
+    def get_financial_stats(self):
+        return self.model.get_financial_stats()
+
     def get_all(self):
         return self.model.get_all() 
\ No newline at end of file
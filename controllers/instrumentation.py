@@ -0,0 +1,205 @@
+import functools
+import json
+import math
+import os
+import threading
+import time
+from bisect import bisect_left
+from types import GeneratorType
+
+# Controller timing, see configure_metrics(). Off by default; GYM_METRICS=1
+# turns it on, GYM_METRICS_FILE and GYM_METRICS_INTERVAL set where and how
+# often start_snapshots() writes the numbers out.
+METRICS_SETTINGS = {
+    'enabled': os.environ.get('GYM_METRICS', '') not in ('', '0'),
+    'snapshot_path': os.environ.get('GYM_METRICS_FILE',
+                                    os.path.join(os.path.dirname(__file__), '../logs/metrics.json')),
+    'snapshot_interval': float(os.environ.get('GYM_METRICS_INTERVAL', 60)),
+}
+
+# Bucket upper bounds in ms, 15% apart from 10 µs to about 2 minutes. Percentiles
+# are read as the middle of their bucket, within about 7% of the true value.
+BUCKET_GROWTH = 1.15
+BUCKET_BOUNDS = tuple(0.01 * BUCKET_GROWTH ** i for i in range(int(math.log(120000 / 0.01, BUCKET_GROWTH)) + 2))
+
+
+class LatencyHistogram:
+    """Call latencies in fixed buckets: constant memory however many calls are observed."""
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, elapsed_ms, failed=False):
+        self.counts[bisect_left(BUCKET_BOUNDS, elapsed_ms)] += 1
+        self.count += 1
+        self.errors += failed
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+
+    def percentile(self, fraction):
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                if index == len(BUCKET_BOUNDS):
+                    return self.max_ms
+                return min(BUCKET_BOUNDS[index] / math.sqrt(BUCKET_GROWTH), self.max_ms)
+        return self.max_ms
+
+    def summary(self):
+        return {
+            'count': self.count, 'errors': self.errors,
+            'mean_ms': self.total_ms / self.count if self.count else 0.0,
+            'p50_ms': self.percentile(0.50), 'p95_ms': self.percentile(0.95), 'p99_ms': self.percentile(0.99),
+            'max_ms': self.max_ms, 'total_ms': self.total_ms,
+        }
+
+
+class Metrics:
+    """One LatencyHistogram per operation name, shared by all threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self.since = time.time()
+
+    def observe(self, name, elapsed_ms, failed=False):
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = LatencyHistogram()
+            histogram.observe(elapsed_ms, failed)
+
+    def summaries(self, order='total_ms'):
+        """[(name, summary)], the operation with the highest order first."""
+        with self._lock:
+            rows = [(name, histogram.summary()) for name, histogram in self._histograms.items()]
+        rows.sort(key=lambda row: row[1][order], reverse=True)
+        return rows
+
+    def snapshot(self):
+        return {'taken_at': time.time(), 'since': self.since,
+                'operations': dict(self.summaries())}
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self.since = time.time()
+
+
+metrics = Metrics()
+_enabled = METRICS_SETTINGS['enabled']
+
+
+def configure_metrics(**settings):
+    """Change timing settings (enabled, snapshot_path, snapshot_interval)."""
+    global _enabled
+    unknown = set(settings) - set(METRICS_SETTINGS)
+    if unknown:
+        raise ValueError(f"Unknown metrics settings: {', '.join(sorted(unknown))}")
+    METRICS_SETTINGS.update(settings)
+    _enabled = METRICS_SETTINGS['enabled']
+
+
+def timed(fn, name=None):
+    """Wrap fn so each call's latency is recorded under name (default: its qualified name).
+
+    A call that returns a generator, such as an export_rows(), is timed
+    until the generator is exhausted or closed, since that is when its
+    queries run. While timing is off the wrapper only checks a flag
+    before calling fn.
+    """
+    name = name or fn.__qualname__
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if not _enabled:
+            return fn(*args, **kwargs)
+        started = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException:
+            metrics.observe(name, (time.perf_counter() - started) * 1000, True)
+            raise
+        if isinstance(result, GeneratorType):
+            return _timed_generator(result, name, started)
+        metrics.observe(name, (time.perf_counter() - started) * 1000)
+        return result
+    return wrapper
+
+
+def _timed_generator(generator, name, started):
+    failed = True
+    try:
+        yield from generator
+        failed = False
+    except GeneratorExit:
+        # Closed early by its consumer: not an error
+        failed = False
+        raise
+    finally:
+        metrics.observe(name, (time.perf_counter() - started) * 1000, failed)
+
+
+def instrument(cls):
+    """Class decorator: time every public method of a controller."""
+    for attr, value in list(vars(cls).items()):
+        if not attr.startswith('_') and callable(value):
+            setattr(cls, attr, timed(value, f'{cls.__name__}.{attr}'))
+    return cls
+
+
+def write_snapshot(path=None):
+    """Write the current numbers as JSON, replacing the file in one step."""
+    path = os.path.abspath(path or METRICS_SETTINGS['snapshot_path'])
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    partial = path + '.partial'
+    with open(partial, 'w', encoding='utf-8') as f:
+        json.dump(metrics.snapshot(), f, indent=2)
+    os.replace(partial, path)
+    return path
+
+
+_snapshots = None
+
+
+def start_snapshots(interval=None, path=None):
+    """Write a snapshot every interval seconds on a background thread until stop_snapshots()."""
+    global _snapshots
+    stop_snapshots()
+    interval = interval or METRICS_SETTINGS['snapshot_interval']
+    stop = threading.Event()
+
+    def run():
+        while not stop.wait(interval):
+            try:
+                write_snapshot(path)
+            except OSError:
+                pass
+
+    thread = threading.Thread(target=run, name='metrics-snapshots', daemon=True)
+    thread.start()
+    _snapshots = (thread, stop, path)
+
+
+def stop_snapshots():
+    """Stop the snapshot thread, writing one last snapshot."""
+    global _snapshots
+    if _snapshots is None:
+        return
+    thread, stop, path = _snapshots
+    _snapshots = None
+    stop.set()
+    thread.join()
+    try:
+        write_snapshot(path)
+    except OSError:
+        pass
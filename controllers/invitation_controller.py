@@ -1,19 +1,38 @@
+from models.invitation_model import InvitationModel
+from controllers.instrumentation import instrument
+
+@instrument
 class InvitationController:
     def __init__(self):
-        pass
+        self.model = InvitationModel()
 
     def get_all(self):
-        # Return a list of all invitations (stub)
-        return []
+        return self.model.get_all()
 
-    def add_invitation(self, client_id, friend_name, friend_phone, tagged):
-        # Add a new invitation (stub)
-        pass
+    def add_invitation(self, client_id, friend_name, friend_phone, tagged=0):
+        return self.model.add_invitation(client_id, friend_name, friend_phone, tagged)
 
     def delete_invitation(self, invitation_id):
-        # Delete an invitation (stub)
-        pass
+        return self.model.delete_invitation(invitation_id)
 
     def update_invitation(self, invitation_id, data):
-        # Update an invitation (stub)
-        pass 
\ No newline at end of file
+        # data: (friend_name, friend_phone, tagged)
+        return self.model.update_invitation(invitation_id, *data)
+
+    def tag_invitation(self, invitation_id, tagged=1):
+        return self.model.tag_invitation(invitation_id, tagged)
+
+    def search(self, client_text=None, friend_text=None, tagged=None, limit=None, offset=0):
+        return self.model.search(client_text, friend_text, tagged, limit, offset)
+
+    def count(self, client_text=None, friend_text=None, tagged=None):
+        return self.model.count(client_text, friend_text, tagged)
+
+    def export_rows(self, progress=None):
+        return self.model.export_rows(progress)
+
+    def get_stats(self):
+        return self.model.get_stats()
+
+    def get_conversion_by_client(self, limit=10):
+        return self.model.get_conversion_by_client(limit)
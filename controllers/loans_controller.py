@@ -1,5 +1,7 @@
 from models.loans_model import LoansModel
+from controllers.instrumentation import instrument
 
+@instrument
 class LoansController:
     def __init__(self):
         self.model = LoansModel()
@@ -14,4 +16,13 @@ class LoansController:
         return self.model.get_all()
 
     def get_running_balance(self, client_id):
-        return self.model.get_running_balance(client_id) 
\ No newline at end of file
+        return self.model.get_running_balance(client_id)
+
+    def search(self, client_text=None, amount_text=None, amount_range=None):
+        return self.model.search(client_text, amount_text, amount_range)
+
+    def export_rows(self, progress=None):
+        return self.model.export_rows(progress)
+
+    def get_stats(self):
+        return self.model.get_stats()
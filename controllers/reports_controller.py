@@ -1,5 +1,7 @@
 from models.reports_model import ReportsModel
+from controllers.instrumentation import instrument
 
+@instrument
 class ReportsController:
     def __init__(self):
         self.model = ReportsModel()
@@ -19,8 +21,11 @@ class ReportsController:
     def get_missing_payments(self):
         return self.model.get_missing_payments()
 
-    def export_to_pdf(self, data, filename):
-        return self.model.export_to_pdf(data, filename)
+    def get_admin_stats(self):
+        return self.model.get_admin_stats()
 
-    def export_to_excel(self, data, filename):
-        return self.model.export_to_excel(data, filename) 
\ No newline at end of file
+    def export_to_pdf(self, report, filename, headers=None, title=None, month=None, progress=None):
+        return self.model.export_to_pdf(report, filename, headers, title, month, progress)
+
+    def export_to_excel(self, report, filename, headers=None, title=None, month=None, progress=None):
+        return self.model.export_to_excel(report, filename, headers, title, month, progress) 
\ No newline at end of file
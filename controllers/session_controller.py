@@ -1,5 +1,7 @@
 from models.session_model import SessionModel
+from controllers.instrumentation import instrument
 
+@instrument
 class SessionController:
     def __init__(self):
         self.model = SessionModel()
@@ -14,4 +16,16 @@ class SessionController:
         return self.model.get_by_client(client_id)
 
     def get_all(self):
-        return self.model.get_all() 
\ No newline at end of file
+        return self.model.get_all() 
+
+    def search(self, trainer=None, client_text=None, is_group=None, session_date=None, limit=None, offset=0):
+        return self.model.search(trainer, client_text, is_group, session_date, limit, offset)
+
+    def count(self, trainer=None, client_text=None, is_group=None, session_date=None):
+        return self.model.count(trainer, client_text, is_group, session_date)
+
+    def export_rows(self, progress=None):
+        return self.model.export_rows(progress)
+
+    def get_stats(self):
+        return self.model.get_stats()
@@ -1,5 +1,7 @@
 from models.user_model import UserModel
+from controllers.instrumentation import instrument
 
+@instrument
 class UserController:
     def __init__(self):
         self.model = UserModel()
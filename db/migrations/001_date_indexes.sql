@@ -0,0 +1,13 @@
+-- Range-friendly indexes for the per-day and per-month queries.
+-- Models filter with half-open ranges (col >= day AND col < day + 1)
+-- instead of DATE(col) = day so these indexes can be used.
+
+CREATE INDEX IF NOT EXISTS idx_attendance_checkin_time ON attendance(checkin_time);
+CREATE INDEX IF NOT EXISTS idx_attendance_client_checkin ON attendance(client_id, checkin_time);
+
+CREATE INDEX IF NOT EXISTS idx_finances_created_at ON finances(created_at);
+CREATE INDEX IF NOT EXISTS idx_finances_category_created_at ON finances(category, created_at);
+CREATE INDEX IF NOT EXISTS idx_finances_recorded_by_created_at ON finances(recorded_by, created_at);
+
+CREATE INDEX IF NOT EXISTS idx_clients_created_at ON clients(created_at);
+CREATE INDEX IF NOT EXISTS idx_clients_end_date ON clients(end_date);
@@ -0,0 +1,49 @@
+-- Full-text client search (ClientModel.search).
+-- clients_fts is a trigram FTS5 index over name, code and phone so that
+-- substring searches no longer scan the clients table. search_name holds
+-- the name with Arabic letter variants folded and diacritics removed; keep
+-- it in sync with ARABIC_NORMALIZATION in models/client_model.py.
+
+ALTER TABLE clients ADD COLUMN search_name TEXT GENERATED ALWAYS AS (
+    replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(name
+        , 'أ', 'ا')
+        , 'إ', 'ا')
+        , 'آ', 'ا')
+        , 'ٱ', 'ا')
+        , 'ة', 'ه')
+        , 'ى', 'ي')
+        , 'ؤ', 'و')
+        , 'ئ', 'ي')
+        , 'ـ', '')
+        , 'ً', '')
+        , 'ٌ', '')
+        , 'ٍ', '')
+        , 'َ', '')
+        , 'ُ', '')
+        , 'ِ', '')
+        , 'ّ', '')
+        , 'ْ', '')
+) VIRTUAL;
+
+CREATE VIRTUAL TABLE clients_fts USING fts5(
+    name, client_code, phone,
+    tokenize = 'trigram'
+);
+
+INSERT INTO clients_fts (rowid, name, client_code, phone)
+SELECT id, search_name, client_code, phone FROM clients;
+
+CREATE TRIGGER clients_fts_insert AFTER INSERT ON clients BEGIN
+    INSERT INTO clients_fts (rowid, name, client_code, phone)
+    VALUES (new.id, new.search_name, new.client_code, new.phone);
+END;
+
+CREATE TRIGGER clients_fts_update AFTER UPDATE OF name, client_code, phone ON clients BEGIN
+    DELETE FROM clients_fts WHERE rowid = old.id;
+    INSERT INTO clients_fts (rowid, name, client_code, phone)
+    VALUES (new.id, new.search_name, new.client_code, new.phone);
+END;
+
+CREATE TRIGGER clients_fts_delete AFTER DELETE ON clients BEGIN
+    DELETE FROM clients_fts WHERE rowid = old.id;
+END;
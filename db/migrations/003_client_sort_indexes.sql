@@ -0,0 +1,6 @@
+-- Indexes for the sortable, paged clients table (ClientModel.get_page).
+-- Paging with ORDER BY ... LIMIT/OFFSET walks these instead of sorting
+-- the whole clients table for every page.
+
+CREATE INDEX IF NOT EXISTS idx_clients_name ON clients(name);
+CREATE INDEX IF NOT EXISTS idx_clients_start_date ON clients(start_date);
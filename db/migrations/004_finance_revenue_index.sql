@@ -0,0 +1,5 @@
+-- Make the per-category finance index covering for amount, so revenue
+-- totals (ReportsModel.get_admin_stats) are summed from the index alone.
+
+DROP INDEX IF EXISTS idx_finances_category_created_at;
+CREATE INDEX IF NOT EXISTS idx_finances_category_created_at ON finances(category, created_at, amount);
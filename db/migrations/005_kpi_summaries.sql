@@ -0,0 +1,105 @@
+-- Summary tables for dashboard and finance KPIs, kept current by triggers
+-- so the stats screens read a handful of rows instead of scanning clients
+-- and finances. db/summaries.py rebuilds or verifies them.
+
+-- Finance totals per day and category (payments, expenses, ...)
+CREATE TABLE daily_revenue (
+    day TEXT NOT NULL,
+    category TEXT NOT NULL,
+    total REAL NOT NULL DEFAULT 0,
+    entries INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, category)
+) WITHOUT ROWID;
+
+-- Check-ins per day
+CREATE TABLE daily_attendance (
+    day TEXT PRIMARY KEY,
+    checkins INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+
+-- Client counts per end date, frozen flag and outstanding balance flag.
+-- Status depends on today's date, so the stats query sums the end-date
+-- ranges it needs; there is at most one row per distinct end date and flag.
+CREATE TABLE client_status_counts (
+    end_date TEXT NOT NULL,
+    frozen INTEGER NOT NULL,
+    has_balance INTEGER NOT NULL,
+    clients INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (end_date, frozen, has_balance)
+) WITHOUT ROWID;
+
+INSERT INTO daily_revenue (day, category, total, entries)
+SELECT COALESCE(DATE(created_at), ''), category, SUM(amount), COUNT(*)
+FROM finances GROUP BY 1, 2;
+
+INSERT INTO daily_attendance (day, checkins)
+SELECT COALESCE(DATE(checkin_time), ''), COUNT(*)
+FROM attendance GROUP BY 1;
+
+INSERT INTO client_status_counts (end_date, frozen, has_balance, clients)
+SELECT COALESCE(end_date, ''), COALESCE(freeze_days > 0, 0), COALESCE(amount_remaining > 0, 0), COUNT(*)
+FROM clients GROUP BY 1, 2, 3;
+
+-- finances -> daily_revenue
+CREATE TRIGGER daily_revenue_insert AFTER INSERT ON finances BEGIN
+    INSERT INTO daily_revenue (day, category, total, entries)
+    VALUES (COALESCE(DATE(new.created_at), ''), new.category, new.amount, 1)
+    ON CONFLICT (day, category) DO UPDATE SET total = total + excluded.total, entries = entries + 1;
+END;
+
+CREATE TRIGGER daily_revenue_delete AFTER DELETE ON finances BEGIN
+    UPDATE daily_revenue SET total = total - old.amount, entries = entries - 1
+    WHERE day = COALESCE(DATE(old.created_at), '') AND category = old.category;
+END;
+
+CREATE TRIGGER daily_revenue_update AFTER UPDATE OF amount, category, created_at ON finances BEGIN
+    UPDATE daily_revenue SET total = total - old.amount, entries = entries - 1
+    WHERE day = COALESCE(DATE(old.created_at), '') AND category = old.category;
+    INSERT INTO daily_revenue (day, category, total, entries)
+    VALUES (COALESCE(DATE(new.created_at), ''), new.category, new.amount, 1)
+    ON CONFLICT (day, category) DO UPDATE SET total = total + excluded.total, entries = entries + 1;
+END;
+
+-- attendance -> daily_attendance
+CREATE TRIGGER daily_attendance_insert AFTER INSERT ON attendance BEGIN
+    INSERT INTO daily_attendance (day, checkins)
+    VALUES (COALESCE(DATE(new.checkin_time), ''), 1)
+    ON CONFLICT (day) DO UPDATE SET checkins = checkins + 1;
+END;
+
+CREATE TRIGGER daily_attendance_delete AFTER DELETE ON attendance BEGIN
+    UPDATE daily_attendance SET checkins = checkins - 1
+    WHERE day = COALESCE(DATE(old.checkin_time), '');
+END;
+
+CREATE TRIGGER daily_attendance_update AFTER UPDATE OF checkin_time ON attendance BEGIN
+    UPDATE daily_attendance SET checkins = checkins - 1
+    WHERE day = COALESCE(DATE(old.checkin_time), '');
+    INSERT INTO daily_attendance (day, checkins)
+    VALUES (COALESCE(DATE(new.checkin_time), ''), 1)
+    ON CONFLICT (day) DO UPDATE SET checkins = checkins + 1;
+END;
+
+-- clients -> client_status_counts
+CREATE TRIGGER client_status_counts_insert AFTER INSERT ON clients BEGIN
+    INSERT INTO client_status_counts (end_date, frozen, has_balance, clients)
+    VALUES (COALESCE(new.end_date, ''), COALESCE(new.freeze_days > 0, 0), COALESCE(new.amount_remaining > 0, 0), 1)
+    ON CONFLICT (end_date, frozen, has_balance) DO UPDATE SET clients = clients + 1;
+END;
+
+CREATE TRIGGER client_status_counts_delete AFTER DELETE ON clients BEGIN
+    UPDATE client_status_counts SET clients = clients - 1
+    WHERE end_date = COALESCE(old.end_date, '')
+      AND frozen = COALESCE(old.freeze_days > 0, 0)
+      AND has_balance = COALESCE(old.amount_remaining > 0, 0);
+END;
+
+CREATE TRIGGER client_status_counts_update AFTER UPDATE OF end_date, freeze_days, amount_remaining ON clients BEGIN
+    UPDATE client_status_counts SET clients = clients - 1
+    WHERE end_date = COALESCE(old.end_date, '')
+      AND frozen = COALESCE(old.freeze_days > 0, 0)
+      AND has_balance = COALESCE(old.amount_remaining > 0, 0);
+    INSERT INTO client_status_counts (end_date, frozen, has_balance, clients)
+    VALUES (COALESCE(new.end_date, ''), COALESCE(new.freeze_days > 0, 0), COALESCE(new.amount_remaining > 0, 0), 1)
+    ON CONFLICT (end_date, frozen, has_balance) DO UPDATE SET clients = clients + 1;
+END;
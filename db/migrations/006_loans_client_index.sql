@@ -0,0 +1,4 @@
+-- Per-client loan lookups and the running-balance window in
+-- LoansModel.search partition loans by client in creation order.
+
+CREATE INDEX IF NOT EXISTS idx_loans_client_created_at ON loans(client_id, created_at);
@@ -0,0 +1,7 @@
+-- SessionModel.search filters sessions by trainer (case-insensitive prefix,
+-- hence NOCASE so LIKE can use the index), by client and by date, and pages
+-- them newest first.
+
+CREATE INDEX IF NOT EXISTS idx_private_sessions_trainer_date ON private_sessions(trainer_name COLLATE NOCASE, session_date);
+CREATE INDEX IF NOT EXISTS idx_private_sessions_client_id ON private_sessions(client_id);
+CREATE INDEX IF NOT EXISTS idx_private_sessions_session_date ON private_sessions(session_date);
@@ -0,0 +1,5 @@
+-- InvitationModel.search pages invitations newest first and filters them
+-- by client; get_stats counts the current month by invited_at range.
+
+CREATE INDEX IF NOT EXISTS idx_invitations_invited_at ON invitations(invited_at);
+CREATE INDEX IF NOT EXISTS idx_invitations_client_id ON invitations(client_id);
@@ -0,0 +1,5 @@
+-- The trainer filter in SessionModel.search matches any part of the name,
+-- which no index can serve, so the NOCASE index from 007 only slowed down
+-- inserts.
+
+DROP INDEX IF EXISTS idx_private_sessions_trainer_date;
@@ -1 +1,233 @@
- 
\ No newline at end of file
+"""Fill a database with a deterministic, production-sized synthetic dataset for performance testing.
+
+    python db/sample_data.py /tmp/gym_medium.db --scale medium --seed 42
+
+The same --seed, --scale and --today always produce the same rows. Rows are
+bulk-loaded with executemany, one transaction per table, through the normal
+triggers so the search index and KPI summary tables stay consistent.
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from models.migrations import migrate
+from db.setup import SAMPLE_USERS, hash_password
+
+SCALES = {
+    'tiny': dict(clients=200, attendance=10_000, finances=5_000, loans=200,
+                 sessions=2_000, invitations=500),
+    'small': dict(clients=2_000, attendance=100_000, finances=50_000, loans=2_000,
+                  sessions=20_000, invitations=5_000),
+    'medium': dict(clients=20_000, attendance=1_000_000, finances=500_000, loans=20_000,
+                   sessions=200_000, invitations=50_000),
+    'large': dict(clients=50_000, attendance=3_000_000, finances=2_000_000, loans=50_000,
+                  sessions=500_000, invitations=200_000),
+}
+HISTORY_DAYS = 730
+BATCH_SIZE = 10_000
+
+FIRST_NAMES = ['Ahmed', 'Mohammed', 'Omar', 'Youssef', 'Mahmoud', 'Mostafa', 'Karim', 'Hassan', 'Ali', 'Tarek',
+               'Sara', 'Fatima', 'Nour', 'Mariam', 'Salma', 'Aya', 'Hana', 'Laila', 'Dina', 'Rana',
+               'أحمد', 'محمد', 'عمر', 'يوسف', 'محمود', 'مصطفى', 'كريم', 'حسن', 'علي', 'طارق',
+               'سارة', 'فاطمة', 'نور', 'مريم', 'سلمى', 'آية', 'هنا', 'ليلى', 'دينا', 'رنا']
+LAST_NAMES = ['Hassan', 'Ibrahim', 'Mahmoud', 'Saleh', 'Abdelrahman', 'Farouk', 'Khalil', 'Nasser', 'Mansour',
+              'Fathy', 'Adel', 'Samir', 'حسن', 'إبراهيم', 'محمود', 'صالح', 'عبد الرحمن', 'فاروق', 'خليل',
+              'ناصر', 'منصور', 'فتحي', 'عادل', 'سمير']
+SUBSCRIPTION_TYPES = [('Normal', 0.6), ('Private', 0.15), ('Under 15', 0.15), ('Box', 0.1)]
+DURATIONS = [(1, 0.55), (3, 0.3), (6, 0.1), (12, 0.05)]
+PLAN_NAMES = {1: 'monthly', 3: 'quarterly', 6: 'semi-annual', 12: 'yearly'}
+MONTHLY_PRICE = {'Normal': 400, 'Private': 1200, 'Under 15': 300, 'Box': 600}
+TRAINERS = ['Trainer Ali', 'Trainer Sara', 'Trainer Omar', 'Trainer Mona', 'Trainer Karim', 'Trainer Hana',
+            'Trainer Youssef', 'Trainer Nour']
+ROTATIONS = ['Morning', 'Afternoon', 'Evening']
+SCHEDULES = ['Mon,Wed,Fri', 'Sun,Tue,Thu', 'Sat,Mon,Wed', 'Daily']
+EXPENSES = ['Electricity bill', 'Water bill', 'Cleaning supplies', 'Equipment maintenance', 'Rent',
+            'Staff salaries', 'Internet', 'Towels and laundry']
+LOANS = ['Partial payment loan', 'Supplements on credit', 'Locker fee on credit', 'Personal training balance']
+
+
+def weighted(rng, choices):
+    values, weights = zip(*choices)
+    return rng.choices(values, weights)[0]
+
+
+def phone(rng):
+    return f'+201{rng.choice("0125")}{rng.randrange(10**8):08d}'
+
+
+def timestamp(day, rng, opening=6, closing=23):
+    return f'{day.isoformat()} {rng.randrange(opening, closing):02d}:{rng.randrange(60):02d}:{rng.randrange(60):02d}'
+
+
+def per_day(total, days):
+    """Split total rows over days, busier towards the present like a growing gym."""
+    weights = [0.5 + i / days for i in range(days)]
+    scale = total / sum(weights)
+    counts = [int(w * scale) for w in weights]
+    counts[-1] += total - sum(counts)
+    return counts
+
+
+def insert(conn, table, columns, rows):
+    placeholders = ', '.join('?' for _ in columns)
+    sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+    count = 0
+    batch = []
+    with conn:
+        for row in rows:
+            batch.append(row)
+            if len(batch) == BATCH_SIZE:
+                conn.executemany(sql, batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            conn.executemany(sql, batch)
+            count += len(batch)
+    return count
+
+
+def generate(db_path, scale='small', seed=42, today=None):
+    """Append a synthetic dataset of the given scale to db_path; returns rows inserted per table."""
+    sizes = SCALES[scale]
+    today = today or date.today()
+    first_day = today - timedelta(days=HISTORY_DAYS - 1)
+    days = [first_day + timedelta(days=i) for i in range(HISTORY_DAYS)]
+
+    migrate(db_path)
+    conn = sqlite3.connect(db_path)
+    conn.execute('PRAGMA synchronous = OFF')
+    with conn:
+        for username, password, role, full_name in SAMPLE_USERS:
+            conn.execute(
+                "INSERT OR IGNORE INTO users (username, password_hash, role, full_name) VALUES (?, ?, ?, ?)",
+                (username, hash_password(password), role, full_name))
+    user_ids = [row[0] for row in conn.execute('SELECT id FROM users ORDER BY id')]
+    first_client = conn.execute('SELECT COALESCE(MAX(id), 0) + 1 FROM clients').fetchone()[0]
+    first_subscription = conn.execute('SELECT COALESCE(MAX(id), 0) + 1 FROM subscriptions').fetchone()[0]
+    codes = {row[0] for row in conn.execute('SELECT client_code FROM clients')}
+
+    # Each table gets its own generator so changing one scale does not reshuffle the others
+    rngs = {table: random.Random(f'{seed}:{table}') for table in
+            ('clients', 'attendance', 'finances', 'loans', 'sessions', 'invitations')}
+    rng = rngs['clients']
+
+    clients, subscriptions = [], []
+    for i in range(sizes['clients']):
+        client_id = first_client + i
+        code = f'{rng.getrandbits(32):08X}'
+        while code in codes:
+            code = f'{rng.getrandbits(32):08X}'
+        codes.add(code)
+        sub_type = weighted(rng, SUBSCRIPTION_TYPES)
+        joined = days[min(int(rng.betavariate(2, 1.2) * HISTORY_DAYS), HISTORY_DAYS - 1)]
+        # Renewals back to back from the joining day; the last one is the current subscription
+        start = joined
+        while True:
+            months = weighted(rng, DURATIONS)
+            end = start + timedelta(days=30 * months)
+            last = end > today or rng.random() > 0.7
+            subscription_id = first_subscription + len(subscriptions)
+            subscriptions.append((subscription_id, client_id, PLAN_NAMES[months], months, None, start.isoformat(),
+                                  end.isoformat(), int(last and end >= today), f'{start.isoformat()} 12:00:00'))
+            if last:
+                break
+            start = end
+        price = MONTHLY_PRICE[sub_type] * months
+        remaining = rng.choice([0, 0, 0, 0, 50, 100, price // 2]) if rng.random() < 0.25 else 0
+        guardian = sub_type == 'Under 15'
+        clients.append((
+            client_id, code, f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}', phone(rng), None, sub_type,
+            subscription_id, start.isoformat(), end.isoformat(), price - remaining, remaining,
+            rng.choice([0, 0, 0, 7, 14]) if rng.random() < 0.1 else 0,
+            rng.choice(TRAINERS) if sub_type in ('Private', 'Box') or rng.random() < 0.2 else None,
+            rng.choice(ROTATIONS), f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}' if guardian else None,
+            phone(rng) if guardian else None, rng.choice(SCHEDULES),
+            rng.randrange(first_client, client_id) if i and rng.random() < 0.1 else None,
+            timestamp(joined, rng, 9, 22),
+        ))
+    client_ids = range(first_client, first_client + sizes['clients'])
+
+    counts = {}
+    counts['clients'] = insert(conn, 'clients', (
+        'id', 'client_code', 'name', 'phone', 'profile_picture', 'subscription_type', 'subscription_id',
+        'start_date', 'end_date', 'amount_paid', 'amount_remaining', 'freeze_days', 'trainer_name', 'rotation',
+        'guardian_name', 'guardian_phone', 'attendance_schedule', 'invited_by', 'created_at'), clients)
+    counts['subscriptions'] = insert(conn, 'subscriptions', (
+        'id', 'client_id', 'type', 'duration_months', 'session_count', 'start_date', 'end_date', 'is_active',
+        'created_at'), subscriptions)
+    del clients, subscriptions
+
+    # The remaining tables are generated day by day, in time order, without holding them in memory
+    def attendance(rng=rngs['attendance']):
+        # A minority of regulars make most of the check-ins
+        regulars = rng.sample(client_ids, max(len(client_ids) // 5, 1))
+        for day, n in zip(days, per_day(sizes['attendance'], HISTORY_DAYS)):
+            for stamp in sorted(timestamp(day, rng) for _ in range(n)):
+                client_id = rng.choice(regulars) if rng.random() < 0.6 else rng.choice(client_ids)
+                yield client_id, stamp, rng.choice(user_ids)
+
+    def finances(rng=rngs['finances']):
+        for day, n in zip(days, per_day(sizes['finances'], HISTORY_DAYS)):
+            for stamp in sorted(timestamp(day, rng, 8, 23) for _ in range(n)):
+                kind = rng.random()
+                if kind < 0.8:
+                    yield (rng.choice(client_ids), 'payment', float(rng.choice((100, 150, 200, 300, 400, 600, 1200))),
+                           'Subscription payment', stamp, rng.choice(user_ids))
+                elif kind < 0.95:
+                    yield None, 'expense', round(rng.uniform(50, 3000), 2), rng.choice(EXPENSES), stamp, user_ids[0]
+                else:
+                    yield rng.choice(client_ids), 'late_fee', 50.0, 'Late payment fee', stamp, rng.choice(user_ids)
+
+    def loans(rng=rngs['loans']):
+        for day, n in zip(days, per_day(sizes['loans'], HISTORY_DAYS)):
+            for stamp in sorted(timestamp(day, rng) for _ in range(n)):
+                client_id = rng.choice(client_ids) if rng.random() < 0.95 else None
+                yield client_id, float(rng.choice((50, 100, 150, 250, 500))), rng.choice(LOANS), stamp
+
+    def sessions(rng=rngs['sessions']):
+        for day, n in zip(days, per_day(sizes['sessions'], HISTORY_DAYS)):
+            for _ in range(n):
+                is_group = rng.random() < 0.3
+                yield (rng.choice(client_ids), rng.choice(TRAINERS), day.isoformat(),
+                       'group' if is_group else 'personal', int(is_group))
+
+    def invitations(rng=rngs['invitations']):
+        for day, n in zip(days, per_day(sizes['invitations'], HISTORY_DAYS)):
+            for stamp in sorted(timestamp(day, rng) for _ in range(n)):
+                yield (rng.choice(client_ids), f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}', phone(rng),
+                       stamp, int(rng.random() < 0.25))
+
+    counts['attendance'] = insert(conn, 'attendance', ('client_id', 'checkin_time', 'checked_in_by'), attendance())
+    counts['finances'] = insert(conn, 'finances', (
+        'client_id', 'category', 'amount', 'description', 'created_at', 'recorded_by'), finances())
+    counts['loans'] = insert(conn, 'loans', ('client_id', 'amount', 'description', 'created_at'), loans())
+    counts['private_sessions'] = insert(conn, 'private_sessions', (
+        'client_id', 'trainer_name', 'session_date', 'session_type', 'is_group'), sessions())
+    counts['invitations'] = insert(conn, 'invitations', (
+        'client_id', 'friend_name', 'friend_phone', 'invited_at', 'tagged'), invitations())
+    conn.close()
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('db_path', help='database to fill; created if missing')
+    parser.add_argument('--scale', choices=list(SCALES), default='small')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--today', type=date.fromisoformat, help='last day of the generated history (default today)')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    counts = generate(args.db_path, args.scale, args.seed, args.today)
+    for table, count in counts.items():
+        print(f'{table:<18}{count:>12,}')
+    print(f'Generated the {args.scale} dataset in {time.perf_counter() - start:.1f}s.')
+
+
+if __name__ == '__main__':
+    main()
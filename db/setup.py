@@ -1,8 +1,11 @@
 import sqlite3
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from models.migrations import migrate
 
 DB_PATH = os.path.join(os.path.dirname(__file__), 'gym_management.db')
-SCHEMA_PATH = os.path.join(os.path.dirname(__file__), 'schema.sql')
 
 SAMPLE_USERS = [
     ("admin", "admin123", "admin", "Gym Owner"),
@@ -15,9 +18,9 @@ def hash_password(password):
     return hashlib.sha256(password.encode()).hexdigest()
 
 def main():
+    # Creates the schema on a new database and applies pending migrations
+    migrate(DB_PATH)
     with sqlite3.connect(DB_PATH) as conn:
-        with open(SCHEMA_PATH, 'r', encoding='utf-8') as f:
-            conn.executescript(f.read())
         # Insert sample users
         for username, password, role, full_name in SAMPLE_USERS:
             conn.execute(
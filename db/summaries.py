@@ -0,0 +1,34 @@
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from models.migrations import migrate
+from models.summary_model import SummaryModel, SUMMARY_TABLES
+
+def main():
+    parser = argparse.ArgumentParser(description='Verify or rebuild the KPI summary tables.')
+    parser.add_argument('action', choices=['verify', 'rebuild'])
+    parser.add_argument('--table', action='append', choices=sorted(SUMMARY_TABLES),
+                        help='Limit to one summary table (repeatable)')
+    args = parser.parse_args()
+
+    # The summary tables arrive with migration 005
+    migrate()
+    model = SummaryModel()
+    if args.action == 'rebuild':
+        model.rebuild(args.table)
+        print('Summary tables rebuilt.')
+        return 0
+
+    mismatches = model.verify(args.table)
+    for table, rows in mismatches.items():
+        print(f'{table}: {len(rows)} mismatched rows')
+        for row in rows[:20]:
+            print(f'    {row}')
+    if not mismatches:
+        print('Summary tables match their source tables.')
+    return 1 if mismatches else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,7 +1,11 @@
-from PyQt5.QtWidgets import QApplication, QMainWindow, QStackedWidget, QComboBox, QWidget, QHBoxLayout, QSpacerItem, QSizePolicy
+from PyQt5.QtWidgets import QApplication, QMainWindow, QStackedWidget, QComboBox, QWidget, QHBoxLayout, QSpacerItem, QSizePolicy, QMessageBox
 from views.login_view import LoginWindow
 from i18n.translator import Translator
-from views.dashboard_view import DashboardWindow
+from views.view_registry import ViewRegistry
+from models.db_manager import DBManager
+from models.migrations import migrate, MigrationError
+from controllers import instrumentation
+from views.export_jobs import shutdown_exports
 import sys
 
 class MainWindow(QMainWindow):
@@ -16,6 +20,7 @@ class MainWindow(QMainWindow):
         self.login_view.handle_login_success = self.show_dashboard
         self.stack.addWidget(self.login_view)
         self.dashboard_view = None
+        self.module_views = ViewRegistry(self.stack)
 
         # Add language selector at the top right
         self.language_selector = QComboBox()
@@ -79,18 +84,19 @@ class MainWindow(QMainWindow):
     def change_language(self, index):
         lang_code = 'en' if index == 0 else 'ar'
         self.translator.set_language(lang_code)
-        # Retranslate all widgets in the stack
+        # Retranslate all widgets in the stack (the dashboard is one of them)
         for i in range(self.stack.count()):
             widget = self.stack.widget(i)
             if hasattr(widget, 'retranslate_ui'):
                 widget.retranslate_ui()
-        # Also update dashboard if it exists
-        if self.dashboard_view and hasattr(self.dashboard_view, 'retranslate_ui'):
-            self.dashboard_view.retranslate_ui()
 
     def show_dashboard(self, user):
+        # Imported on first login so the login window comes up without it
+        from views.dashboard_view import DashboardWindow
+        self.module_views.clear()
         if self.dashboard_view:
             self.stack.removeWidget(self.dashboard_view)
+            self.dashboard_view.deleteLater()
         self.dashboard_view = DashboardWindow(user, self.translator, main_window=self)
         self.stack.addWidget(self.dashboard_view)
         self.stack.setCurrentWidget(self.dashboard_view)
@@ -98,18 +104,33 @@ class MainWindow(QMainWindow):
         if hasattr(self.dashboard_view, 'retranslate_ui'):
             self.dashboard_view.retranslate_ui()
 
-    def show_module(self, widget):
-        self.stack.addWidget(widget)
+    def show_module(self, name, factory):
+        widget, created = self.module_views.get(name, factory)
         self.stack.setCurrentWidget(widget)
-        # Ensure language and layout direction are applied
-        if hasattr(widget, 'retranslate_ui'):
-            widget.retranslate_ui()
+        if created:
+            # Ensure language and layout direction are applied
+            if hasattr(widget, 'retranslate_ui'):
+                widget.retranslate_ui()
+        elif hasattr(widget, 'reload_data'):
+            # Cached views follow language changes already; only the data may be stale
+            widget.reload_data()
 
     def back_to_dashboard(self):
         self.stack.setCurrentWidget(self.dashboard_view)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    # Slots run in connection order: exports must stop before the database closes
+    app.aboutToQuit.connect(shutdown_exports)
+    app.aboutToQuit.connect(DBManager.close_all)
+    app.aboutToQuit.connect(instrumentation.stop_snapshots)
+    if instrumentation.METRICS_SETTINGS['enabled']:
+        instrumentation.start_snapshots()
+    try:
+        migrate()
+    except MigrationError as e:
+        QMessageBox.critical(None, 'Database Error', f'Could not upgrade the database:\n{e}')
+        sys.exit(1)
     window = MainWindow()
     window.show()
     sys.exit(app.exec_()) 
\ No newline at end of file
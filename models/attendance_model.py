@@ -12,8 +12,8 @@ class AttendanceModel:
 
     def get_by_date(self, date):
         return self.db.fetchall(
-            "SELECT a.id, c.client_code, c.name, a.checkin_time FROM attendance a JOIN clients c ON a.client_id = c.id WHERE DATE(a.checkin_time) = ?",
-            (date,)
+            "SELECT a.id, c.client_code, c.name, a.checkin_time FROM attendance a JOIN clients c ON a.client_id = c.id WHERE a.checkin_time >= ? AND a.checkin_time < DATE(?, '+1 day')",
+            (date, date)
         )
 
     def get_by_client(self, client_id):
@@ -1,4 +1,53 @@
 from models.db_manager import DBManager
+from datetime import date, timedelta
+
+# Mirrors the search_name column in db/migrations/002_client_search.sql
+ARABIC_NORMALIZATION = str.maketrans({
+    'أ': 'ا', 'إ': 'ا', 'آ': 'ا', 'ٱ': 'ا',
+    'ة': 'ه', 'ى': 'ي', 'ؤ': 'و', 'ئ': 'ي',
+    'ـ': None,
+    **{chr(c): None for c in range(0x064B, 0x0653)},
+})
+
+# The trigram index cannot match anything shorter than three characters
+MIN_FTS_LENGTH = 3
+
+# Status filters for count()/get_page(), matching the status shown in the clients table
+CLIENT_STATUSES = ('active', 'expired', 'ending_soon')
+ENDING_SOON_DAYS = 7
+
+# Columns returned by get_all()/search()/get_page(), in order; also the allowed sort keys
+CLIENT_COLUMNS = ('client_code', 'name', 'phone', 'subscription_type', 'start_date', 'end_date')
+
+
+def normalize_search_text(text):
+    return text.translate(ARABIC_NORMALIZATION).strip()
+
+
+def _fts_phrase(kw):
+    return '"' + kw.replace('"', '""') + '"'
+
+
+def client_text_filter(client_text, client_id_column, client_alias='c'):
+    """Return (condition, params) matching rows whose client's name, code or phone contains client_text.
+
+    The one place client text is matched, so every screen finds the same
+    clients. Text long enough for the trigram index is looked up in
+    clients_fts and matched on client_id_column; shorter text falls back to
+    LIKE on the clients columns (client_alias=None for the clients table
+    itself), using the normalized search_name so Arabic letter variants match.
+    Returns (None, []) for empty text.
+    """
+    kw = normalize_search_text(client_text or '')
+    if not kw:
+        return None, []
+    if len(kw) < MIN_FTS_LENGTH:
+        prefix = f"{client_alias}." if client_alias else ""
+        like = f"%{kw}%"
+        return (f"({prefix}search_name LIKE ? OR {prefix}client_code LIKE ? OR {prefix}phone LIKE ?)",
+                [like, like, like])
+    return f"{client_id_column} IN (SELECT rowid FROM clients_fts WHERE clients_fts MATCH ?)", [_fts_phrase(kw)]
+
 
 class ClientModel:
     def __init__(self):
@@ -7,11 +56,92 @@ class ClientModel:
     def get_all(self):
         return self.db.fetchall("SELECT client_code, name, phone, subscription_type, start_date, end_date FROM clients")
 
-    def search(self, keyword):
-        kw = f"%{keyword}%"
+    def search(self, keyword, limit=None):
+        """Search clients by name, code or phone.
+
+        An exact client code comes first, followed by substring matches from
+        the trigram index ordered by FTS5 rank. Keywords shorter than a
+        trigram fall back to LIKE.
+        """
+        kw = normalize_search_text(keyword)
+        if not kw:
+            return self.get_all()
+        limit_sql = " LIMIT ?" if limit else ""
+        limit_params = (limit,) if limit else ()
+        if len(kw) < MIN_FTS_LENGTH:
+            condition, params = client_text_filter(kw, 'id', client_alias=None)
+            return self.db.fetchall(
+                "SELECT client_code, name, phone, subscription_type, start_date, end_date FROM clients "
+                f"WHERE {condition}" + limit_sql,
+                (*params, *limit_params)
+            )
+        codes = (kw, kw.upper())
+        match = _fts_phrase(kw)
+        return self.db.fetchall(
+            "SELECT client_code, name, phone, subscription_type, start_date, end_date FROM ("
+            " SELECT 0 AS exact, 0 AS rank, c.* FROM clients c WHERE c.client_code IN (?, ?)"
+            " UNION ALL"
+            " SELECT 1, f.rank, c.* FROM ("
+            "  SELECT rowid, rank FROM clients_fts WHERE clients_fts MATCH ? ORDER BY rank" + limit_sql +
+            " ) f JOIN clients c ON c.id = f.rowid WHERE c.client_code NOT IN (?, ?)"
+            ") ORDER BY exact, rank" + limit_sql,
+            codes + (match,) + limit_params + codes + limit_params
+        )
+
+    def _status_bounds(self):
+        today = date.today()
+        return today.isoformat(), (today + timedelta(days=ENDING_SOON_DAYS)).isoformat()
+
+    def _filters(self, keyword, status):
+        conditions, params = [], []
+        condition, condition_params = client_text_filter(keyword, 'id', client_alias=None)
+        if condition:
+            conditions.append(condition)
+            params += condition_params
+        if status:
+            if status not in CLIENT_STATUSES:
+                raise ValueError(f"Unknown client status: {status}")
+            today, soon = self._status_bounds()
+            # Range predicates on end_date so idx_clients_end_date can be used
+            if status == 'active':
+                conditions.append("end_date > ?")
+                params.append(soon)
+            elif status == 'expired':
+                conditions.append("end_date < ?")
+                params.append(today)
+            else:
+                conditions.append("end_date >= ? AND end_date <= ?")
+                params += [today, soon]
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return where, params
+
+    def count(self, keyword=None, status=None):
+        where, params = self._filters(keyword, status)
+        return self.db.fetchone(f"SELECT COUNT(*) FROM clients{where}", params)[0]
+
+    def get_status_counts(self):
+        """Return total, active (incl. ending soon), expired and ending_soon counts in one pass."""
+        today, soon = self._status_bounds()
+        row = self.db.fetchone(
+            "SELECT COUNT(*), "
+            "COALESCE(SUM(end_date >= ?), 0), "
+            "COALESCE(SUM(end_date < ?), 0), "
+            "COALESCE(SUM(end_date >= ? AND end_date <= ?), 0) "
+            "FROM clients",
+            (today, today, today, soon)
+        )
+        return {'total': row[0], 'active': row[1], 'expired': row[2], 'ending_soon': row[3]}
+
+    def get_page(self, offset, limit, keyword=None, sort_column='client_code', descending=False, status=None):
+        """Return one page of clients, filtered by keyword and status and sorted in SQL."""
+        if sort_column not in CLIENT_COLUMNS:
+            raise ValueError(f"Cannot sort clients by {sort_column}")
+        where, params = self._filters(keyword, status)
+        direction = "DESC" if descending else "ASC"
         return self.db.fetchall(
-            "SELECT client_code, name, phone, subscription_type, start_date, end_date FROM clients WHERE name LIKE ? OR client_code LIKE ? OR phone LIKE ?",
-            (kw, kw, kw)
+            f"SELECT {', '.join(CLIENT_COLUMNS)} FROM clients{where} "
+            f"ORDER BY {sort_column} {direction}, id {direction} LIMIT ? OFFSET ?",
+            (*params, limit, offset)
         )
 
     def add(self, data):
@@ -1,27 +1,292 @@
 import sqlite3
 import os
+import queue
+import threading
+import time
+import atexit
+
+from models import query_log
+
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(__file__), '../db/gym_management.db')
+
+# Rows fetched, and progress reported, per step of a streamed export
+EXPORT_BATCH_SIZE = 1000
+
+# PRAGMAs applied to every new connection. WAL lets report queries read while
+# the front desk writes check-ins; "network" keeps the rollback journal for
+# databases on a shared drive, where WAL is not supported.
+CONNECTION_PROFILES = {
+    'default': {
+        'busy_timeout': 5000,
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -32000,
+        'mmap_size': 268435456,
+        'temp_store': 'MEMORY',
+    },
+    'low_memory': {
+        'busy_timeout': 5000,
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -4000,
+        'mmap_size': 0,
+        'temp_store': 'DEFAULT',
+    },
+    'network': {
+        'busy_timeout': 15000,
+        'journal_mode': 'DELETE',
+        'synchronous': 'FULL',
+        'cache_size': -16000,
+        'mmap_size': 0,
+        'temp_store': 'MEMORY',
+    },
+}
+
+# Process-wide pool settings, see configure_pool()
+POOL_SETTINGS = {
+    'max_size': 5,
+    'timeout': 30.0,
+    'health_check_interval': 60.0,
+    'profile': os.environ.get('GYM_DB_PROFILE', 'default'),
+}
+
+
+class PoolClosedError(sqlite3.Error):
+    pass
+
+
+class ConnectionPool:
+    """Keeps a bounded set of open sqlite3 connections for one database file.
+
+    A thread borrows a connection for the duration of a statement and gives it
+    back afterwards. Nested borrows from the same thread reuse the connection
+    that thread already holds, so helpers can call each other freely.
+    """
+
+    def __init__(self, db_path, max_size=5, timeout=30.0, health_check_interval=60.0, profile='default'):
+        if profile not in CONNECTION_PROFILES:
+            raise ValueError(f"Unknown connection profile: {profile}")
+        self.db_path = db_path
+        self.profile = profile
+        self.max_size = max_size
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._all = set()
+        self._closed = False
+
+    def _open(self):
+        conn = sqlite3.connect(self.db_path, timeout=self.timeout, check_same_thread=False)
+        apply_profile(conn, self.profile)
+        with self._lock:
+            self._all.add(conn)
+        return conn
+
+    def _discard(self, conn):
+        with self._lock:
+            self._all.discard(conn)
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    def _is_healthy(self, conn):
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def acquire(self):
+        if self._closed:
+            raise PoolClosedError(f"Connection pool for {self.db_path} is closed")
+        held = getattr(self._local, 'conn', None)
+        if held is not None:
+            self._local.depth += 1
+            return held
+        if not self._slots.acquire(timeout=self.timeout):
+            raise sqlite3.OperationalError(
+                f"Timed out waiting for a database connection (pool size {self.max_size})")
+        try:
+            conn = None
+            while conn is None:
+                try:
+                    conn, last_used = self._idle.get_nowait()
+                except queue.Empty:
+                    conn = self._open()
+                    break
+                if time.monotonic() - last_used > self.health_check_interval and not self._is_healthy(conn):
+                    self._discard(conn)
+                    conn = None
+        except Exception:
+            self._slots.release()
+            raise
+        self._local.conn = conn
+        self._local.depth = 1
+        return conn
+
+    def release(self, conn):
+        if getattr(self._local, 'conn', None) is not conn:
+            raise ValueError("Connection was not acquired by this thread")
+        self._local.depth -= 1
+        if self._local.depth > 0:
+            return
+        self._local.conn = None
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            if self._closed:
+                self._discard(conn)
+            else:
+                self._idle.put((conn, time.monotonic()))
+        except sqlite3.Error:
+            self._discard(conn)
+        finally:
+            self._slots.release()
+
+    def connection(self):
+        return _PooledConnection(self)
+
+    def stats(self):
+        with self._lock:
+            total = len(self._all)
+        return {'open': total, 'idle': self._idle.qsize(), 'max_size': self.max_size, 'profile': self.profile}
+
+    def close(self):
+        self._closed = True
+        while True:
+            try:
+                conn, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
+
+
+def apply_profile(conn, profile='default'):
+    # busy_timeout comes first so switching the journal mode waits for locks
+    for pragma, value in CONNECTION_PROFILES[profile].items():
+        conn.execute(f"PRAGMA {pragma} = {value}")
+
+
+class _PooledConnection:
+    def __init__(self, pool):
+        self.pool = pool
+        self.conn = None
+
+    def __enter__(self):
+        self.conn = self.pool.acquire()
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.pool.release(self.conn)
+        return False
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def configure_pool(**settings):
+    """Change settings for pools created from now on (max_size, timeout, health_check_interval, profile)."""
+    unknown = set(settings) - set(POOL_SETTINGS)
+    if unknown:
+        raise ValueError(f"Unknown pool settings: {', '.join(sorted(unknown))}")
+    if 'profile' in settings and settings['profile'] not in CONNECTION_PROFILES:
+        raise ValueError(f"Unknown connection profile: {settings['profile']}")
+    POOL_SETTINGS.update(settings)
+
+
+def get_pool(db_path):
+    key = os.path.abspath(db_path)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool._closed:
+            pool = ConnectionPool(key, **POOL_SETTINGS)
+            _pools[key] = pool
+        return pool
+
+
+def pool_stats():
+    """{database path: pool stats} for every open pool."""
+    with _pools_lock:
+        pools = list(_pools.items())
+    return {path: pool.stats() for path, pool in pools}
+
+
+def close_all_pools():
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_all_pools)
+
 
 class DBManager:
     def __init__(self, db_path=None):
         if db_path is None:
-            db_path = os.path.join(os.path.dirname(__file__), '../db/gym_management.db')
+            db_path = DEFAULT_DB_PATH
         self.db_path = db_path
+        self.pool = get_pool(db_path)
 
     def connect(self):
-        return sqlite3.connect(self.db_path)
+        return self.pool.connection()
 
     def fetchone(self, query, params=()):
+        started = query_log.start()
         with self.connect() as conn:
-            cur = conn.execute(query, params)
-            return cur.fetchone()
+            row = conn.execute(query, params).fetchone()
+        if started is not None:
+            query_log.record(query, 0 if row is None else 1, started)
+        return row
 
     def fetchall(self, query, params=()):
+        started = query_log.start()
         with self.connect() as conn:
-            cur = conn.execute(query, params)
-            return cur.fetchall()
+            rows = conn.execute(query, params).fetchall()
+        if started is not None:
+            query_log.record(query, len(rows), started)
+        return rows
+
+    def fetchiter(self, query, params=(), batch_size=EXPORT_BATCH_SIZE):
+        """Yield rows batch_size at a time, for results too large to hold in memory.
+
+        The connection stays borrowed until the generator is exhausted or
+        closed, so consume it on the thread that started it.
+        """
+        started = query_log.start()
+        count = 0
+        try:
+            with self.connect() as conn:
+                cur = conn.execute(query, params)
+                while True:
+                    rows = cur.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    count += len(rows)
+                    yield from rows
+        finally:
+            if started is not None:
+                query_log.record(query, count, started)
 
     def execute(self, query, params=()):
+        started = query_log.start()
         with self.connect() as conn:
-            cur = conn.execute(query, params)
-            conn.commit()
-            return cur.lastrowid 
\ No newline at end of file
+            try:
+                cur = conn.execute(query, params)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        if started is not None:
+            query_log.record(query, cur.rowcount, started)
+        return cur.lastrowid
+
+    @staticmethod
+    def close_all():
+        close_all_pools()
@@ -18,14 +18,14 @@ class FinanceModel:
 
     def get_payments_by_date(self, date):
         return self.db.fetchall(
-            "SELECT f.id, c.client_code, c.name, f.amount, f.description FROM finances f LEFT JOIN clients c ON f.client_id = c.id WHERE f.category = 'payment' AND DATE(f.created_at) = ?",
-            (date,)
+            "SELECT f.id, c.client_code, c.name, f.amount, f.description FROM finances f LEFT JOIN clients c ON f.client_id = c.id WHERE f.category = 'payment' AND f.created_at >= ? AND f.created_at < DATE(?, '+1 day')",
+            (date, date)
         )
 
     def get_expenses_by_date(self, date):
         return self.db.fetchall(
-            "SELECT id, category, amount, description FROM finances WHERE category != 'payment' AND DATE(created_at) = ?",
-            (date,)
+            "SELECT id, category, amount, description FROM finances WHERE category != 'payment' AND created_at >= ? AND created_at < DATE(?, '+1 day')",
+            (date, date)
         )
 
     def get_unmatched_payments(self):
@@ -34,9 +34,28 @@ class FinanceModel:
 
     def get_daily_payments_by_user(self, user_id, date):
         return self.db.fetchall(
-            "SELECT id, amount, description FROM finances WHERE category = 'payment' AND recorded_by = ? AND DATE(created_at) = ?",
-            (user_id, date)
+            "SELECT id, amount, description FROM finances WHERE category = 'payment' AND recorded_by = ? AND created_at >= ? AND created_at < DATE(?, '+1 day')",
+            (user_id, date, date)
         )
 
+    def get_financial_stats(self):
+        """Today's and this month's payment/expense totals from the daily_revenue summary."""
+        row = self.db.fetchone(
+            "SELECT "
+            "COALESCE(SUM(CASE WHEN category = 'payment' AND day = DATE('now') THEN total END), 0), "
+            "COALESCE(SUM(CASE WHEN category = 'payment' THEN total END), 0), "
+            "COALESCE(SUM(CASE WHEN category = 'expense' AND day = DATE('now') THEN total END), 0), "
+            "COALESCE(SUM(CASE WHEN category = 'expense' THEN total END), 0) "
+            "FROM daily_revenue "
+            "WHERE day >= DATE('now', 'start of month') AND day < DATE('now', 'start of month', '+1 month')"
+        )
+        today_revenue, monthly_revenue, today_expenses, monthly_expenses = row
+        return {
+            'today_revenue': today_revenue,
+            'monthly_revenue': monthly_revenue,
+            'today_expenses': today_expenses,
+            'net_profit': monthly_revenue - monthly_expenses
+        }
+
     def get_all(self):
         return self.db.fetchall("SELECT * FROM finances") 
\ No newline at end of file
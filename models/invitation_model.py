@@ -1,13 +1,14 @@
-from models.db_manager import DBManager
+from models.db_manager import DBManager, EXPORT_BATCH_SIZE
+from models.client_model import client_text_filter
 
 class InvitationModel:
     def __init__(self):
         self.db = DBManager()
 
-    def add_invitation(self, client_id, friend_name, friend_phone):
+    def add_invitation(self, client_id, friend_name, friend_phone, tagged=0):
         return self.db.execute(
-            "INSERT INTO invitations (client_id, friend_name, friend_phone) VALUES (?, ?, ?)",
-            (client_id, friend_name, friend_phone)
+            "INSERT INTO invitations (client_id, friend_name, friend_phone, tagged) VALUES (?, ?, ?, ?)",
+            (client_id, friend_name, friend_phone, tagged)
         )
 
     def get_by_client(self, client_id):
@@ -23,4 +24,101 @@ class InvitationModel:
         return self.db.execute(
             "UPDATE invitations SET tagged = ? WHERE id = ?",
             (tagged, invitation_id)
-        ) 
\ No newline at end of file
+        )
+
+    def update_invitation(self, invitation_id, friend_name, friend_phone, tagged):
+        return self.db.execute(
+            "UPDATE invitations SET friend_name = ?, friend_phone = ?, tagged = ? WHERE id = ?",
+            (friend_name, friend_phone, tagged, invitation_id)
+        )
+
+    def delete_invitation(self, invitation_id):
+        return self.db.execute("DELETE FROM invitations WHERE id = ?", (invitation_id,))
+
+    def _filters(self, client_text, friend_text, tagged):
+        conditions, params = [], []
+        client_condition, client_params = client_text_filter(client_text, "i.client_id")
+        if client_condition:
+            conditions.append(client_condition)
+            params += client_params
+        if friend_text:
+            like = f"%{friend_text}%"
+            conditions.append("(i.friend_name LIKE ? OR i.friend_phone LIKE ?)")
+            params += [like, like]
+        if tagged is not None:
+            conditions.append("COALESCE(i.tagged, 0) != 0" if tagged else "COALESCE(i.tagged, 0) = 0")
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return where, params
+
+    def search(self, client_text=None, friend_text=None, tagged=None, limit=None, offset=0):
+        """Invitations joined with the inviting client, filtered in SQL, newest first.
+
+        Each row is (id, client_id, client_code, client_name, friend_name,
+        friend_phone, invited_at, tagged). tagged=None means any status.
+        """
+        where, params = self._filters(client_text, friend_text, tagged)
+        page = " LIMIT ? OFFSET ?" if limit else ""
+        if limit:
+            params += [limit, offset]
+        return self.db.fetchall(self._select(where) + page, params)
+
+    def _select(self, where):
+        return (
+            "SELECT i.id, i.client_id, COALESCE(c.client_code, 'Unknown'), COALESCE(c.name, 'Unknown'), "
+            "i.friend_name, i.friend_phone, i.invited_at, i.tagged "
+            "FROM invitations i LEFT JOIN clients c ON c.id = i.client_id" + where +
+            " ORDER BY i.invited_at DESC, i.id DESC"
+        )
+
+    def count(self, client_text=None, friend_text=None, tagged=None):
+        where, params = self._filters(client_text, friend_text, tagged)
+        return self.db.fetchone(
+            "SELECT COUNT(*) FROM invitations i LEFT JOIN clients c ON c.id = i.client_id" + where,
+            params
+        )[0]
+
+    def export_rows(self, progress=None, batch_size=EXPORT_BATCH_SIZE):
+        """Yield every invitation in search() order, calling progress(done, total) after every batch."""
+        total = None
+        if progress:
+            total = self.count()
+            progress(0, total)
+        done = 0
+        for row in self.db.fetchiter(self._select(""), (), batch_size):
+            yield row
+            done += 1
+            if progress and done % batch_size == 0:
+                progress(done, total)
+        if progress:
+            progress(done, total)
+
+    def get_stats(self):
+        """Return total, tagged, pending, this_month and conversion_rate (tagged share, 0-100)."""
+        row = self.db.fetchone(
+            "SELECT COUNT(*), COALESCE(SUM(COALESCE(tagged, 0) != 0), 0), "
+            "COALESCE(SUM(invited_at >= DATE('now', 'start of month') "
+            "AND invited_at < DATE('now', 'start of month', '+1 month')), 0) "
+            "FROM invitations"
+        )
+        total, tagged, this_month = row
+        return {
+            'total': total,
+            'tagged': tagged,
+            'pending': total - tagged,
+            'this_month': this_month,
+            'conversion_rate': round(tagged * 100.0 / total, 1) if total else 0.0,
+        }
+
+    def get_conversion_by_client(self, limit=10):
+        """Top inviting clients as (client_id, client_code, client_name, invitations, tagged, conversion_rate)."""
+        return self.db.fetchall(
+            "SELECT i.client_id, COALESCE(c.client_code, 'Unknown'), COALESCE(c.name, 'Unknown'), "
+            "i.invitations, i.tagged, ROUND(i.tagged * 100.0 / i.invitations, 1) "
+            "FROM ("
+            " SELECT client_id, COUNT(*) AS invitations, SUM(COALESCE(tagged, 0) != 0) AS tagged"
+            " FROM invitations GROUP BY client_id"
+            " ORDER BY invitations DESC, tagged DESC LIMIT ?"
+            ") i LEFT JOIN clients c ON c.id = i.client_id "
+            "ORDER BY i.invitations DESC, i.tagged DESC",
+            (limit,)
+        )
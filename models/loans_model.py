@@ -1,4 +1,12 @@
-from models.db_manager import DBManager
+from models.db_manager import DBManager, EXPORT_BATCH_SIZE
+from models.client_model import client_text_filter
+
+# Amount range filters for LoansModel.search()
+LOAN_AMOUNT_RANGES = {
+    'under_100': "l.amount < 100",
+    '100_500': "l.amount BETWEEN 100 AND 500",
+    'over_500': "l.amount > 500",
+}
 
 class LoansModel:
     def __init__(self):
@@ -24,4 +32,65 @@ class LoansModel:
             "SELECT SUM(amount) FROM loans WHERE client_id = ?",
             (client_id,)
         )
-        return result[0] if result else 0 
\ No newline at end of file
+        return result[0] if result else 0
+
+    def search(self, client_text=None, amount_text=None, amount_range=None):
+        """Loans joined with their client, filtered in SQL.
+
+        Each row is (id, client_id, client_code, client_name, amount,
+        description, created_at, running_balance, client_balance), where
+        running_balance is the client's cumulative total up to that loan
+        and client_balance the client's overall total.
+        """
+        return self.db.fetchall(*self._search_query(client_text, amount_text, amount_range))
+
+    def _search_query(self, client_text=None, amount_text=None, amount_range=None):
+        conditions, params = [], []
+        client_condition, client_params = client_text_filter(client_text, "l.client_id")
+        if client_condition:
+            conditions.append(client_condition)
+            params += client_params
+        if amount_text:
+            conditions.append("CAST(l.amount AS TEXT) LIKE ?")
+            params.append(f"%{amount_text}%")
+        if amount_range:
+            if amount_range not in LOAN_AMOUNT_RANGES:
+                raise ValueError(f"Unknown loan amount range: {amount_range}")
+            conditions.append(LOAN_AMOUNT_RANGES[amount_range])
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        # Balances are computed over all of a client's loans, before filtering
+        return (
+            "SELECT l.id, l.client_id, COALESCE(c.client_code, 'Unknown'), COALESCE(c.name, 'Unknown'), "
+            "l.amount, l.description, l.created_at, l.running_balance, l.client_balance "
+            "FROM ("
+            " SELECT id, client_id, amount, description, created_at,"
+            " SUM(amount) OVER (PARTITION BY client_id ORDER BY created_at, id) AS running_balance,"
+            " SUM(amount) OVER (PARTITION BY client_id) AS client_balance"
+            " FROM loans"
+            ") l LEFT JOIN clients c ON c.id = l.client_id" + where + " ORDER BY l.id",
+            params
+        )
+
+    def export_rows(self, progress=None, batch_size=EXPORT_BATCH_SIZE):
+        """Yield every loan in search() order, calling progress(done, total) after every batch."""
+        total = None
+        if progress:
+            total = self.db.fetchone("SELECT COUNT(*) FROM loans")[0]
+            progress(0, total)
+        done = 0
+        for row in self.db.fetchiter(*self._search_query(), batch_size):
+            yield row
+            done += 1
+            if progress and done % batch_size == 0:
+                progress(done, total)
+        if progress:
+            progress(done, total)
+
+    def get_stats(self):
+        row = self.db.fetchone(
+            "SELECT COUNT(*), COALESCE(SUM(amount), 0), COALESCE(AVG(amount), 0), "
+            "COALESCE(SUM(created_at >= DATE('now', 'start of month') "
+            "AND created_at < DATE('now', 'start of month', '+1 month')), 0) "
+            "FROM loans"
+        )
+        return {'total': row[0], 'total_amount': row[1], 'average': row[2], 'this_month': row[3]}
@@ -0,0 +1,121 @@
+import sqlite3
+import os
+import re
+
+from models.db_manager import DEFAULT_DB_PATH, POOL_SETTINGS, apply_profile
+
+DB_DIR = os.path.join(os.path.dirname(__file__), '../db')
+SCHEMA_PATH = os.path.join(DB_DIR, 'schema.sql')
+MIGRATIONS_DIR = os.path.join(DB_DIR, 'migrations')
+
+MIGRATION_FILE = re.compile(r'^(\d+)_(\w+)\.sql$')
+
+
+class MigrationError(Exception):
+    pass
+
+
+def load_migrations(migrations_dir=MIGRATIONS_DIR):
+    """Return [(version, name, path)] for db/migrations/NNN_name.sql, sorted by version."""
+    migrations = []
+    for filename in os.listdir(migrations_dir):
+        match = MIGRATION_FILE.match(filename)
+        if match:
+            migrations.append((int(match.group(1)), match.group(2), os.path.join(migrations_dir, filename)))
+    migrations.sort()
+    versions = [version for version, _, _ in migrations]
+    if len(set(versions)) != len(versions):
+        raise MigrationError(f"Duplicate migration numbers in {migrations_dir}")
+    return migrations
+
+
+def _has_sql(text):
+    return any(line.strip() and not line.strip().startswith('--') for line in text.splitlines())
+
+
+def split_statements(script):
+    statements = []
+    current = ''
+    for line in script.splitlines(keepends=True):
+        current += line
+        if sqlite3.complete_statement(current):
+            if _has_sql(current):
+                statements.append(current.strip())
+            current = ''
+    if _has_sql(current):
+        raise MigrationError(f"Incomplete SQL statement: {current.strip()[:60]}")
+    return statements
+
+
+def get_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def _is_empty(conn):
+    return conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'table'").fetchone()[0] == 0
+
+
+def _run_in_transaction(conn, statements, version):
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        for statement in statements:
+            conn.execute(statement)
+        conn.execute(f"PRAGMA user_version = {int(version)}")
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def migrate(db_path=None, migrations_dir=MIGRATIONS_DIR, profile=None):
+    """Bring the database up to the newest migration and return the versions applied.
+
+    An empty database gets schema.sql first (version 0). Every migration runs
+    in its own IMMEDIATE transaction together with the user_version bump, so a
+    failing migration leaves the database at the previous version. Index builds
+    only block other writers; in WAL mode readers carry on. ANALYZE refreshes
+    the planner statistics once anything has been applied.
+    """
+    if db_path is None:
+        db_path = DEFAULT_DB_PATH
+    migrations = load_migrations(migrations_dir)
+    latest = migrations[-1][0] if migrations else 0
+
+    conn = None
+    try:
+        conn = sqlite3.connect(db_path, isolation_level=None)
+        apply_profile(conn, profile or POOL_SETTINGS['profile'])
+        current = get_version(conn)
+        if current > latest:
+            raise MigrationError(
+                f"Database is at version {current}, newer than this application ({latest})")
+
+        if _is_empty(conn):
+            with open(SCHEMA_PATH, 'r', encoding='utf-8') as f:
+                statements = split_statements(f.read())
+            try:
+                _run_in_transaction(conn, statements, 0)
+            except sqlite3.Error as e:
+                raise MigrationError(f"Creating the schema failed: {e}") from e
+
+        applied = []
+        for version, name, path in migrations:
+            if version <= current:
+                continue
+            with open(path, 'r', encoding='utf-8') as f:
+                statements = split_statements(f.read())
+            try:
+                _run_in_transaction(conn, statements, version)
+            except sqlite3.Error as e:
+                raise MigrationError(f"Migration {version:03d}_{name} failed: {e}") from e
+            applied.append(version)
+
+        if applied:
+            conn.execute("ANALYZE")
+        return applied
+    except sqlite3.Error as e:
+        # Opening a file that is not a database, a locked file, a failing ANALYZE...
+        raise MigrationError(f"Could not open or upgrade {db_path}: {e}") from e
+    finally:
+        if conn is not None:
+            conn.close()
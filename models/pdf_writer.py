@@ -0,0 +1,86 @@
+import os
+import zlib
+
+LETTER = (612, 792)
+
+# Object numbers reserved for the objects written last, once every page is known
+_CATALOG, _PAGES, _FONT, _BOLD_FONT, _INFO = 1, 2, 3, 4, 5
+
+
+def _pdf_string(text):
+    data = str(text).encode('cp1252', 'replace')
+    return b'(' + data.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)') + b')'
+
+
+class StreamingPDFWriter:
+    """Minimal text-only PDF writer that writes each page to disk as soon as it is finished.
+
+    Only the object offsets are kept in memory, so a report of any length
+    uses the same memory as a single page. Text is set in the standard
+    Helvetica fonts (WinAnsi encoding).
+    """
+
+    def __init__(self, path, pagesize=LETTER, title=''):
+        self.width, self.height = pagesize
+        self.title = title
+        self.file = open(path, 'wb')
+        self.offsets = {}
+        self.page_ids = []
+        self.next_id = _INFO + 1
+        self.ops = []
+        self.file.write(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+
+    def _write_object(self, obj_id, body):
+        self.offsets[obj_id] = self.file.tell()
+        self.file.write(b'%d 0 obj\n' % obj_id + body + b'\nendobj\n')
+
+    def _new_id(self):
+        self.next_id += 1
+        return self.next_id - 1
+
+    def draw_string(self, x, y, text, size=10, bold=False):
+        font = b'/F2' if bold else b'/F1'
+        self.ops.append(b'BT %s %g Tf %.2f %.2f Td %s Tj ET' % (font, size, x, y, _pdf_string(text)))
+
+    def show_page(self):
+        content = zlib.compress(b'\n'.join(self.ops))
+        self.ops = []
+        content_id, page_id = self._new_id(), self._new_id()
+        self._write_object(content_id, b'<< /Length %d /Filter /FlateDecode >>\nstream\n' % len(content)
+                           + content + b'\nendstream')
+        self._write_object(page_id, b'<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %g %g] '
+                           b'/Resources << /Font << /F1 %d 0 R /F2 %d 0 R >> >> /Contents %d 0 R >>'
+                           % (_PAGES, self.width, self.height, _FONT, _BOLD_FONT, content_id))
+        self.page_ids.append(page_id)
+
+    def close(self):
+        if self.ops or not self.page_ids:
+            self.show_page()
+        for obj_id, name in ((_FONT, b'Helvetica'), (_BOLD_FONT, b'Helvetica-Bold')):
+            self._write_object(obj_id, b'<< /Type /Font /Subtype /Type1 /BaseFont /%s '
+                                       b'/Encoding /WinAnsiEncoding >>' % name)
+        kids = b' '.join(b'%d 0 R' % page_id for page_id in self.page_ids)
+        self._write_object(_PAGES, b'<< /Type /Pages /Kids [%s] /Count %d >>' % (kids, len(self.page_ids)))
+        self._write_object(_CATALOG, b'<< /Type /Catalog /Pages %d 0 R >>' % _PAGES)
+        self._write_object(_INFO, b'<< /Title %s /Producer (Gym Management System) >>' % _pdf_string(self.title))
+
+        xref_offset = self.file.tell()
+        count = self.next_id
+        self.file.write(b'xref\n0 %d\n0000000000 65535 f \n' % count)
+        for obj_id in range(1, count):
+            self.file.write(b'%010d 00000 n \n' % self.offsets[obj_id])
+        self.file.write(b'trailer\n<< /Size %d /Root %d 0 R /Info %d 0 R >>\nstartxref\n%d\n%%%%EOF\n'
+                        % (count, _CATALOG, _INFO, xref_offset))
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            # An unfinished PDF is unreadable, so do not leave it behind
+            self.file.close()
+            os.remove(self.file.name)
+        return False
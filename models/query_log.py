@@ -0,0 +1,169 @@
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter, deque
+from datetime import datetime
+from functools import lru_cache
+
+# Query recording, see configure_query_log(). Off by default; GYM_QUERY_LOG=1
+# records every statement, GYM_SLOW_QUERY_MS sets the slow-query threshold.
+QUERY_LOG_SETTINGS = {
+    'enabled': os.environ.get('GYM_QUERY_LOG', '') not in ('', '0'),
+    'slow_ms': float(os.environ['GYM_SLOW_QUERY_MS']) if os.environ.get('GYM_SLOW_QUERY_MS') else None,
+    'log_path': os.environ.get('GYM_SLOW_QUERY_LOG',
+                               os.path.join(os.path.dirname(__file__), '../logs/slow_queries.log')),
+    'max_bytes': 1_000_000,
+    'backup_count': 3,
+}
+
+# Distinct statements kept; anything beyond is counted under OTHER
+MAX_STATEMENTS = 500
+OTHER = '<other statements>'
+RECENT_SLOW = 100
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r'\b\d+(?:\.\d+)?\b')
+_IN_LIST = re.compile(r'\bIN\s*\(\s*\?(?:\s*,\s*\?)+\s*\)', re.IGNORECASE)
+_SPACE = re.compile(r'\s+')
+_THIS_DIR = os.path.dirname(os.path.abspath(__file__))
+_INTERNAL = (os.path.join(_THIS_DIR, 'db_manager.py'), os.path.abspath(__file__))
+
+
+@lru_cache(maxsize=1024)
+def normalize_sql(query):
+    """The statement with literals replaced by ?, IN lists folded and whitespace collapsed."""
+    query = _STRING.sub('?', query)
+    query = _NUMBER.sub('?', query)
+    query = _IN_LIST.sub('IN (?, ...)', query)
+    return _SPACE.sub(' ', query).strip()
+
+
+def _caller():
+    """Qualified name of the first function outside the database layer, e.g. 'ClientModel.search'."""
+    frame = sys._getframe(2)
+    while frame is not None and os.path.abspath(frame.f_code.co_filename) in _INTERNAL:
+        frame = frame.f_back
+    if frame is None:
+        return '?'
+    code = frame.f_code
+    return getattr(code, 'co_qualname', code.co_name)
+
+
+class QueryStats:
+    """Totals per normalized statement, plus the most recent slow queries."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._statements = {}
+        self.slow = deque(maxlen=RECENT_SLOW)
+        self.since = time.time()
+
+    def add(self, sql, caller, rows, elapsed_ms):
+        with self._lock:
+            entry = self._statements.get(sql)
+            if entry is None:
+                if len(self._statements) >= MAX_STATEMENTS:
+                    sql = OTHER
+                entry = self._statements.setdefault(
+                    sql, {'calls': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'rows': 0, 'callers': Counter()})
+            entry['calls'] += 1
+            entry['total_ms'] += elapsed_ms
+            entry['max_ms'] = max(entry['max_ms'], elapsed_ms)
+            entry['rows'] += max(rows, 0)
+            entry['callers'][caller] += 1
+
+    def add_slow(self, sql, caller, rows, elapsed_ms):
+        with self._lock:
+            self.slow.appendleft({'at': datetime.now().strftime('%H:%M:%S'), 'sql': sql, 'caller': caller,
+                                  'rows': rows, 'ms': elapsed_ms})
+
+    def top(self, limit=20, order='total_ms'):
+        """The statements with the highest order (total_ms, calls, max_ms or avg_ms), as dicts."""
+        with self._lock:
+            items = [(sql, dict(entry, callers=entry['callers'].most_common(3)))
+                     for sql, entry in self._statements.items()]
+        rows = [dict(entry, sql=sql, avg_ms=entry['total_ms'] / entry['calls']) for sql, entry in items]
+        rows.sort(key=lambda row: row[order], reverse=True)
+        return rows[:limit]
+
+    def recent_slow(self):
+        with self._lock:
+            return list(self.slow)
+
+    def summary(self):
+        with self._lock:
+            calls = sum(entry['calls'] for entry in self._statements.values())
+            total = sum(entry['total_ms'] for entry in self._statements.values())
+            return {'statements': len(self._statements), 'calls': calls, 'total_ms': total,
+                    'slow': len(self.slow), 'since': self.since}
+
+    def reset(self):
+        with self._lock:
+            self._statements.clear()
+            self.slow.clear()
+            self.since = time.time()
+
+
+stats = QueryStats()
+_active = QUERY_LOG_SETTINGS['enabled'] or QUERY_LOG_SETTINGS['slow_ms'] is not None
+_slow_logger = None
+
+
+def configure_query_log(**settings):
+    """Change recording settings (enabled, slow_ms, log_path, max_bytes, backup_count); slow_ms=None turns slow logging off."""
+    global _active, _slow_logger
+    unknown = set(settings) - set(QUERY_LOG_SETTINGS)
+    if unknown:
+        raise ValueError(f"Unknown query log settings: {', '.join(sorted(unknown))}")
+    QUERY_LOG_SETTINGS.update(settings)
+    _active = QUERY_LOG_SETTINGS['enabled'] or QUERY_LOG_SETTINGS['slow_ms'] is not None
+    if _slow_logger is not None and {'log_path', 'max_bytes', 'backup_count'} & set(settings):
+        for handler in list(_slow_logger.handlers):
+            _slow_logger.removeHandler(handler)
+            handler.close()
+        _slow_logger = None
+
+
+def start():
+    """A start time if queries are being timed, else None; pass it to record()."""
+    return time.perf_counter() if _active else None
+
+
+def record(query, rows, started):
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    slow_ms = QUERY_LOG_SETTINGS['slow_ms']
+    is_slow = slow_ms is not None and elapsed_ms >= slow_ms
+    if not (QUERY_LOG_SETTINGS['enabled'] or is_slow):
+        return
+    sql, caller = normalize_sql(query), _caller()
+    if QUERY_LOG_SETTINGS['enabled']:
+        stats.add(sql, caller, rows, elapsed_ms)
+    if is_slow:
+        stats.add_slow(sql, caller, rows, elapsed_ms)
+        _log_slow(sql, caller, rows, elapsed_ms)
+
+
+def _log_slow(sql, caller, rows, elapsed_ms):
+    # A rotating file rather than the logs table: writing from here would take
+    # the database write lock in the middle of read-only screens
+    global _slow_logger
+    if _slow_logger is None:
+        # logging is only imported once there is something to log; it adds to startup time
+        import logging
+        from logging.handlers import RotatingFileHandler
+        path = os.path.abspath(QUERY_LOG_SETTINGS['log_path'])
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            handler = RotatingFileHandler(path, maxBytes=QUERY_LOG_SETTINGS['max_bytes'],
+                                          backupCount=QUERY_LOG_SETTINGS['backup_count'], encoding='utf-8')
+        except OSError:
+            handler = logging.NullHandler()
+        handler.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+        logger = logging.getLogger('gym.slow_queries')
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        logger.addHandler(handler)
+        _slow_logger = logger
+    _slow_logger.info('%.1f ms rows=%d %s: %s', elapsed_ms, rows, caller, sql)
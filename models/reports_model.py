@@ -1,28 +1,217 @@
-from models.db_manager import DBManager
+from models.db_manager import DBManager, EXPORT_BATCH_SIZE
+from models.pdf_writer import LETTER, StreamingPDFWriter
+from datetime import date, datetime
+from typing import NamedTuple
+
+
+class AdminStats(NamedTuple):
+    total_clients: int
+    active: int
+    frozen: int
+    ending_soon: int
+    missing_payments: int
+    revenue: float
+    daily_cashier: float
+    total_invites: int
+    tagged_invites: int
+
+    @property
+    def invite_conversion(self):
+        return f"{self.tagged_invites}/{self.total_invites}"
+
+
+class ExportReport(NamedTuple):
+    title: str
+    columns: tuple
+    query: str
+    money_columns: tuple = ()
+
+
+# The same columns as the report tabs, selected with their client details in one query
+EXPORT_REPORTS = {
+    'registered': ExportReport(
+        'Registered Today Report',
+        ('Code', 'Name', 'Phone', 'Subscription', 'Start Date'),
+        "SELECT client_code, name, phone, subscription_type, start_date FROM clients "
+        "WHERE created_at >= DATE('now') AND created_at < DATE('now', '+1 day') ORDER BY id"),
+    'paid': ExportReport(
+        'Paid Today Report',
+        ('Code', 'Name', 'Amount', 'Description'),
+        "SELECT c.client_code, c.name, f.amount, f.description FROM finances f "
+        "LEFT JOIN clients c ON c.id = f.client_id "
+        "WHERE f.category = 'payment' AND f.created_at >= DATE('now') AND f.created_at < DATE('now', '+1 day') "
+        "ORDER BY f.id",
+        money_columns=(2,)),
+    'attended': ExportReport(
+        'Attended Today Report',
+        ('Code', 'Name', 'Check-in Time'),
+        "SELECT c.client_code, c.name, a.checkin_time FROM attendance a "
+        "LEFT JOIN clients c ON c.id = a.client_id "
+        "WHERE a.checkin_time >= DATE('now') AND a.checkin_time < DATE('now', '+1 day') ORDER BY a.id"),
+    'financials': ExportReport(
+        'Monthly Financials Report',
+        ('Date', 'Category', 'Amount', 'Description', 'User'),
+        "SELECT created_at, category, amount, description, recorded_by FROM finances "
+        "WHERE created_at >= ? AND created_at < DATE(?, '+1 month') ORDER BY id",
+        money_columns=(2,)),
+    'missing': ExportReport(
+        'Missing Payments Report',
+        ('Code', 'Name', 'Phone', 'Amount Remaining', 'End Date'),
+        "SELECT client_code, name, phone, amount_remaining, end_date FROM clients "
+        "WHERE amount_remaining > 0 AND end_date >= DATE('now') ORDER BY id",
+        money_columns=(3,)),
+}
+
 
 class ReportsModel:
     def __init__(self):
         self.db = DBManager()
 
     def get_registered_today(self):
-        return self.db.fetchall("SELECT * FROM clients WHERE DATE(created_at) = DATE('now')")
+        return self.db.fetchall("SELECT * FROM clients WHERE created_at >= DATE('now') AND created_at < DATE('now', '+1 day')")
 
     def get_paid_today(self):
-        return self.db.fetchall("SELECT * FROM finances WHERE category = 'payment' AND DATE(created_at) = DATE('now')")
+        """Today's payments: the finances columns followed by the client's code and name (None if unknown)."""
+        return self.db.fetchall(
+            "SELECT f.*, c.client_code, c.name FROM finances f LEFT JOIN clients c ON c.id = f.client_id "
+            "WHERE f.category = 'payment' AND f.created_at >= DATE('now') AND f.created_at < DATE('now', '+1 day')")
 
     def get_attended_today(self):
-        return self.db.fetchall("SELECT * FROM attendance WHERE DATE(checkin_time) = DATE('now')")
+        """Today's check-ins: the attendance columns followed by the client's code and name (None if unknown)."""
+        return self.db.fetchall(
+            "SELECT a.*, c.client_code, c.name FROM attendance a LEFT JOIN clients c ON c.id = a.client_id "
+            "WHERE a.checkin_time >= DATE('now') AND a.checkin_time < DATE('now', '+1 day')")
 
     def get_monthly_financials(self, month):
-        return self.db.fetchall("SELECT * FROM finances WHERE strftime('%Y-%m', created_at) = ?", (month,))
+        month_start = f"{month}-01"
+        return self.db.fetchall(
+            "SELECT * FROM finances WHERE created_at >= ? AND created_at < DATE(?, '+1 month')",
+            (month_start, month_start)
+        )
 
     def get_missing_payments(self):
         return self.db.fetchall("SELECT * FROM clients WHERE amount_remaining > 0 AND end_date >= DATE('now')")
 
-    def export_to_pdf(self, data, filename):
-        # Stub for PDF export
-        pass
+    def get_admin_stats(self):
+        """Compute every dashboard KPI in a single statement.
+
+        Client and revenue figures come from the trigger-maintained
+        client_status_counts and daily_revenue summaries (migration 005),
+        so the cost does not grow with the number of clients or payments.
+        """
+        row = self.db.fetchone("""
+            SELECT c.total, c.active, c.frozen, c.ending_soon, c.missing,
+                   f.revenue, f.daily, i.total, i.tagged
+            FROM (
+                SELECT COALESCE(SUM(clients), 0) AS total,
+                       COALESCE(SUM(CASE WHEN end_date >= DATE('now') AND frozen = 0 THEN clients END), 0) AS active,
+                       COALESCE(SUM(CASE WHEN frozen = 1 THEN clients END), 0) AS frozen,
+                       COALESCE(SUM(CASE WHEN end_date BETWEEN DATE('now') AND DATE('now', '+7 day')
+                                         THEN clients END), 0) AS ending_soon,
+                       COALESCE(SUM(CASE WHEN has_balance = 1 AND end_date >= DATE('now') THEN clients END), 0) AS missing
+                FROM client_status_counts
+            ) c, (
+                SELECT COALESCE(SUM(total), 0) AS revenue,
+                       COALESCE(SUM(CASE WHEN day = DATE('now') THEN total END), 0) AS daily
+                FROM daily_revenue WHERE category = 'payment'
+            ) f, (
+                SELECT COUNT(*) AS total, COALESCE(SUM(COALESCE(tagged, 0) != 0), 0) AS tagged
+                FROM invitations
+            ) i
+        """)
+        return AdminStats(*row)
+
+    def export_report(self, report, month=None):
+        """Return (ExportReport, params) for one of EXPORT_REPORTS."""
+        spec = EXPORT_REPORTS[report]
+        if report == 'financials':
+            month_start = f"{month or date.today().strftime('%Y-%m')}-01"
+            return spec, (month_start, month_start)
+        return spec, ()
+
+    def export_count(self, report, month=None):
+        spec, params = self.export_report(report, month)
+        return self.db.fetchone(f"SELECT COUNT(*) FROM ({spec.query})", params)[0]
+
+    def export_rows(self, report, month=None, progress=None, batch_size=EXPORT_BATCH_SIZE):
+        """Yield a report's rows, calling progress(done, total) after every batch."""
+        spec, params = self.export_report(report, month)
+        total = None
+        if progress:
+            total = self.export_count(report, month)
+            progress(0, total)
+        done = 0
+        for row in self.db.fetchiter(spec.query, params, batch_size):
+            yield row
+            done += 1
+            if progress and done % batch_size == 0:
+                progress(done, total)
+        if progress:
+            progress(done, total)
+
+    def export_to_pdf(self, report, filename, headers=None, title=None, month=None, progress=None,
+                      batch_size=EXPORT_BATCH_SIZE):
+        """Write a report straight from the database to a PDF, one page at a time.
+
+        progress(done, total) is called after every batch of rows; an exception
+        raised from it aborts the export and removes the partial file.
+        Returns the number of rows written.
+        """
+        spec, params = self.export_report(report, month)
+        headers = headers or spec.columns
+        title = title or spec.title
+        column_width = (LETTER[0] - 60) / len(headers)
+        max_chars = max(int(column_width / 5), 4)  # about 5pt per character at 10pt Helvetica
+
+        def cell(value, column):
+            if value is None:
+                return ''
+            text = f"${value:.2f}" if column in spec.money_columns else str(value)
+            return text if len(text) <= max_chars else text[:max_chars - 3] + '...'
+
+        def start_page(top=LETTER[1] - 50):
+            for i, header in enumerate(headers):
+                pdf.draw_string(30 + i * column_width, top, header, size=12, bold=True)
+            pdf.draw_string(30, 25, f"{title} - page {len(pdf.page_ids) + 1}", size=8)
+            return top - 25
+
+        count = 0
+        with StreamingPDFWriter(filename, LETTER, title) as pdf:
+            pdf.draw_string(30, LETTER[1] - 40, title, size=16, bold=True)
+            pdf.draw_string(30, LETTER[1] - 60, f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            y = start_page(top=LETTER[1] - 90)
+            for row in self.export_rows(report, month, progress, batch_size):
+                if y < 50:
+                    pdf.show_page()
+                    y = start_page()
+                for i, value in enumerate(row):
+                    pdf.draw_string(30 + i * column_width, y, cell(value, i))
+                y -= 16
+                count += 1
+        return count
+
+    def export_to_excel(self, report, filename, headers=None, title=None, month=None, progress=None,
+                        batch_size=EXPORT_BATCH_SIZE):
+        """Write a report straight from the database to an .xlsx workbook.
+
+        openpyxl's write-only mode streams rows to disk, so memory use does
+        not grow with the report. progress works as in export_to_pdf().
+        Returns the number of rows written.
+        """
+        from openpyxl import Workbook
 
-    def export_to_excel(self, data, filename):
-        # Stub for Excel export
-        pass 
\ No newline at end of file
+        spec, params = self.export_report(report, month)
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet((title or spec.title)[:31])  # Excel's sheet name limit
+        sheet.append(list(headers or spec.columns))
+        count = 0
+        try:
+            for row in self.export_rows(report, month, progress, batch_size):
+                sheet.append(row)
+                count += 1
+        except Exception:
+            # Finish the sheet's temporary file; openpyxl deletes it at exit
+            sheet.close()
+            raise
+        workbook.save(filename)
+        return count
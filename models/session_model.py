@@ -1,4 +1,6 @@
-from models.db_manager import DBManager
+from models.db_manager import DBManager, EXPORT_BATCH_SIZE
+from models.client_model import client_text_filter
+from datetime import date
 
 class SessionModel:
     def __init__(self):
@@ -23,4 +25,74 @@ class SessionModel:
         )
 
     def get_all(self):
-        return self.db.fetchall("SELECT * FROM private_sessions") 
\ No newline at end of file
+        return self.db.fetchall("SELECT * FROM private_sessions")
+
+    def _filters(self, trainer, client_text, is_group, session_date):
+        conditions, params = [], []
+        if trainer:
+            # Any part of the name, ignoring case
+            conditions.append("instr(lower(s.trainer_name), lower(?)) > 0")
+            params.append(trainer)
+        client_condition, client_params = client_text_filter(client_text, "s.client_id")
+        if client_condition:
+            conditions.append(client_condition)
+            params += client_params
+        if is_group is not None:
+            conditions.append("s.is_group = ?")
+            params.append(1 if is_group else 0)
+        if session_date:
+            conditions.append("s.session_date = ?")
+            params.append(session_date)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return where, params
+
+    def search(self, trainer=None, client_text=None, is_group=None, session_date=None, limit=None, offset=0):
+        """Sessions joined with their client, filtered in SQL, newest first.
+
+        Each row is (id, client_id, client_code, client_name, trainer_name,
+        session_date, session_type, is_group). is_group=None means both
+        private and group sessions.
+        """
+        where, params = self._filters(trainer, client_text, is_group, session_date)
+        page = " LIMIT ? OFFSET ?" if limit else ""
+        if limit:
+            params += [limit, offset]
+        return self.db.fetchall(self._select(where) + page, params)
+
+    def _select(self, where):
+        return (
+            "SELECT s.id, s.client_id, COALESCE(c.client_code, 'Unknown'), COALESCE(c.name, 'Unknown'), "
+            "s.trainer_name, s.session_date, s.session_type, s.is_group "
+            "FROM private_sessions s LEFT JOIN clients c ON c.id = s.client_id" + where +
+            " ORDER BY s.session_date DESC, s.id DESC"
+        )
+
+    def count(self, trainer=None, client_text=None, is_group=None, session_date=None):
+        where, params = self._filters(trainer, client_text, is_group, session_date)
+        return self.db.fetchone(
+            "SELECT COUNT(*) FROM private_sessions s LEFT JOIN clients c ON c.id = s.client_id" + where,
+            params
+        )[0]
+
+    def export_rows(self, progress=None, batch_size=EXPORT_BATCH_SIZE):
+        """Yield every session in search() order, calling progress(done, total) after every batch."""
+        total = None
+        if progress:
+            total = self.count()
+            progress(0, total)
+        done = 0
+        for row in self.db.fetchiter(self._select(""), (), batch_size):
+            yield row
+            done += 1
+            if progress and done % batch_size == 0:
+                progress(done, total)
+        if progress:
+            progress(done, total)
+
+    def get_stats(self):
+        row = self.db.fetchone(
+            "SELECT COUNT(*), COALESCE(SUM(is_group != 0), 0), COALESCE(SUM(session_date = ?), 0) "
+            "FROM private_sessions",
+            (date.today().isoformat(),)
+        )
+        return {'total': row[0], 'private': row[0] - row[1], 'group': row[1], 'today': row[2]}
@@ -0,0 +1,59 @@
+from models.db_manager import DBManager
+
+# Summary tables from db/migrations/005_kpi_summaries.sql:
+# table -> (key columns, value columns, query over the source table)
+SUMMARY_TABLES = {
+    'daily_revenue': (
+        ('day', 'category'), ('total', 'entries'),
+        "SELECT COALESCE(DATE(created_at), ''), category, SUM(amount), COUNT(*) FROM finances GROUP BY 1, 2"
+    ),
+    'daily_attendance': (
+        ('day',), ('checkins',),
+        "SELECT COALESCE(DATE(checkin_time), ''), COUNT(*) FROM attendance GROUP BY 1"
+    ),
+    'client_status_counts': (
+        ('end_date', 'frozen', 'has_balance'), ('clients',),
+        "SELECT COALESCE(end_date, ''), COALESCE(freeze_days > 0, 0), COALESCE(amount_remaining > 0, 0), COUNT(*) "
+        "FROM clients GROUP BY 1, 2, 3"
+    ),
+}
+
+
+class SummaryModel:
+    def __init__(self):
+        self.db = DBManager()
+
+    def rebuild(self, tables=None):
+        """Recompute summary tables from their source tables in one transaction."""
+        with self.db.connect() as conn:
+            try:
+                for table in tables or SUMMARY_TABLES:
+                    keys, values, source = SUMMARY_TABLES[table]
+                    conn.execute(f"DELETE FROM {table}")
+                    conn.execute(f"INSERT INTO {table} ({', '.join(keys + values)}) {source}")
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    def verify(self, tables=None):
+        """Return {table: [(key..., stored, expected)]} for every summary row that disagrees with its source."""
+        mismatches = {}
+        for table in tables or SUMMARY_TABLES:
+            keys, values, source = SUMMARY_TABLES[table]
+            count_column = values[-1]
+            expected = {row[:len(keys)]: row[len(keys):] for row in self.db.fetchall(source)}
+            stored = {
+                row[:len(keys)]: row[len(keys):]
+                for row in self.db.fetchall(
+                    f"SELECT {', '.join(keys + values)} FROM {table} WHERE {count_column} != 0")
+            }
+            rows = []
+            for key in expected.keys() | stored.keys():
+                have = stored.get(key)
+                want = expected.get(key)
+                if have is None or want is None or any(round(a - b, 6) for a, b in zip(have, want)):
+                    rows.append((*key, have, want))
+            if rows:
+                mismatches[table] = sorted(rows, key=lambda r: tuple(str(v) for v in r))
+        return mismatches
@@ -5,6 +5,8 @@ from PyQt5.QtCore import QDate, Qt
 from PyQt5.QtGui import QFont, QColor
 from controllers.attendance_controller import AttendanceController
 from models.client_model import ClientModel
+from views.theme import apply_theme
+from views.query_worker import QueryRunner
 
 class AttendanceView(QWidget):
     def __init__(self, translator):
@@ -12,6 +14,8 @@ class AttendanceView(QWidget):
         self.translator = translator
         self.controller = AttendanceController()
         self.client_model = ClientModel()
+        self.runner = QueryRunner(self)
+        self.runner.loadingChanged.connect(self.set_loading)
         self.init_ui()
         self.apply_styles()
         self.load_attendance()
@@ -184,268 +188,16 @@ class AttendanceView(QWidget):
         return checkin_frame
 
     def apply_styles(self):
-        style_sheet = """
-            /* Main Widget Background - DARK like Dashboard */
-            QWidget {
-                background-color: #2c2c2c;
-                color: #ffffff;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            
-            /* Header Frame - DARK seamless */
-            QFrame#headerFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-bottom: 1px solid #404040;
-            }
-            
-            QLabel#pageTitle {
-                color: #ffffff;
-                font-size: 28px;
-                font-weight: bold;
-                background: transparent;
-            }
-            
-            QLabel#pageSubtitle {
-                color: #cccccc;
-                font-size: 16px;
-                font-weight: 400;
-                background: transparent;
-            }
-            
-            /* Controls Frame - DARK seamless */
-            QFrame#controlsFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-bottom: 1px solid #404040;
-            }
-            
-            QLabel#controlLabel {
-                color: #ffffff;
-                font-size: 16px;
-                font-weight: 600;
-                background: transparent;
-            }
-            
-            QLabel#statsLabel {
-                color: #e63946;
-                font-size: 16px;
-                font-weight: bold;
-                background: transparent;
-            }
-            
-            /* Date Picker - DARK style */
-            QDateEdit#datePicker {
-                background-color: #404040;
-                border: 2px solid #505050;
-                border-radius: 8px;
-                color: #ffffff;
-                font-size: 14px;
-                font-weight: 500;
-                padding: 8px 12px;
-            }
-            
-            QDateEdit#datePicker:focus {
-                border-color: #e63946;
-                background-color: #4a4a4a;
-            }
-            
-            QDateEdit#datePicker::drop-down {
-                border: none;
-                background-color: #e63946;
-                border-radius: 4px;
-                width: 30px;
-            }
-            
-            QDateEdit#datePicker::down-arrow {
-                image: none;
-                border: none;
-                width: 0px;
-                height: 0px;
-            }
-            
-            /* Search Button */
-            QPushButton#searchButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e63946, stop:1 #c1121f);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 15px;
-            }
-            
-            QPushButton#searchButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff6b6b, stop:1 #e63946);
-            }
-            
-            QPushButton#searchButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #c1121f, stop:1 #a00e1c);
-            }
-            
-            /* Table Frame - DARK seamless */
-            QFrame#tableFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-bottom: 1px solid #404040;
-            }
-            
-            /* Section Titles */
-            QLabel#sectionTitle {
-                color: #ffffff;
-                font-size: 20px;
-                font-weight: bold;
-                background: transparent;
-                padding: 0px 0px 10px 0px;
-                border-bottom: 3px solid #e63946;
-            }
-            
-            /* Attendance Table - DARK style */
-            QTableWidget#attendanceTable {
-                background-color: #404040;
-                alternate-background-color: #4a4a4a;
-                border: none;
-                gridline-color: #505050;
-                selection-background-color: #e63946;
-                selection-color: white;
-                font-size: 14px;
-            }
-            
-            QTableWidget#attendanceTable::item {
-                padding: 12px 8px;
-                border-bottom: 1px solid #505050;
-            }
-            
-            QTableWidget#attendanceTable::item:selected {
-                background-color: #e63946;
-                color: white;
-            }
-            
-            QHeaderView::section {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e63946, stop:1 #c1121f);
-                color: white;
-                padding: 15px 8px;
-                border: none;
-                border-right: 1px solid #a00e1c;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            
-            QHeaderView::section:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff6b6b, stop:1 #e63946);
-            }
-            
-            /* Scrollbars - DARK */
-            QScrollBar:vertical {
-                background-color: #404040;
-                width: 12px;
-                border-radius: 6px;
-                margin: 0px;
-            }
-            
-            QScrollBar::handle:vertical {
-                background-color: #e63946;
-                border-radius: 6px;
-                min-height: 30px;
-            }
-            
-            QScrollBar::handle:vertical:hover {
-                background-color: #ff6b6b;
-            }
-            
-            /* Check-in Frame - DARK seamless */
-            QFrame#checkinFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-top: 2px solid #e63946;
-            }
-            
-            QLabel#checkinTitle {
-                color: #e63946;
-                font-size: 18px;
-                font-weight: bold;
-                background: transparent;
-            }
-            
-            QLabel#inputLabel {
-                color: #ffffff;
-                font-size: 16px;
-                font-weight: 600;
-                background: transparent;
-            }
-            
-            /* Client Input - DARK style */
-            QLineEdit#clientInput {
-                background-color: #404040;
-                border: 2px solid #505050;
-                border-radius: 8px;
-                color: #ffffff;
-                font-size: 14px;
-                padding: 12px 15px;
-            }
-            
-            QLineEdit#clientInput:focus {
-                border-color: #e63946;
-                background-color: #4a4a4a;
-            }
-            
-            QLineEdit#clientInput::placeholder {
-                color: #999999;
-            }
-            
-            /* Check-in Button */
-            QPushButton#checkinButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #38b000, stop:1 #2d8f00);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 15px;
-            }
-            
-            QPushButton#checkinButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4ade80, stop:1 #38b000);
-            }
-            
-            QPushButton#checkinButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #2d8f00, stop:1 #1f6b00);
-            }
-            
-            /* Message Boxes - DARK */
-            QMessageBox {
-                background-color: #2c2c2c;
-                color: #ffffff;
-            }
-            
-            QMessageBox QPushButton {
-                background-color: #e63946;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 20px;
-                font-weight: 600;
-                min-width: 80px;
-            }
-            
-            QMessageBox QPushButton:hover {
-                background-color: #ff6b6b;
-            }
-        """
-        self.setStyleSheet(style_sheet)
+        apply_theme(self, 'attendance')
 
     def load_attendance(self):
         date = self.date_picker.date().toString('yyyy-MM-dd')
-        records = self.controller.get_by_date(date)
-        
+        self.runner.submit('attendance', self.controller.get_by_date, date,
+                           on_result=self.populate_attendance,
+                           on_error=lambda e: self.show_error_message(
+                               self.tr(f'❌ Error loading attendance: {str(e)}')))
+
+    def populate_attendance(self, records):
         self.table.setRowCount(0)
         
         for rec in records:
@@ -471,32 +223,53 @@ class AttendanceView(QWidget):
         self.stats_label.setText(self.tr(f'📊 Total Check-ins: {total_checkins}'))
 
     def handle_checkin(self):
+        if self.runner.is_loading('checkin'):
+            return
         text = self.client_input.text().strip()
         if not text:
             self.show_error_message(self.tr('Please enter client code or name.'))
             return
             
+        self.runner.submit('checkin', self.log_checkin, text,
+                           on_result=self.on_checkin_logged,
+                           on_error=lambda e: self.show_error_message(str(e)))
+
+    def log_checkin(self, text):
+        """Find the client and log the check-in; runs on a worker thread.
+
+        Returns an error message to show, or None once the check-in is logged.
+        """
         # Find client by code or name
-        clients = self.client_model.search(text)
+        clients = self.client_model.search(text, limit=1)
         if not clients:
-            self.show_error_message(self.tr('Client not found. Please verify the code or name.'))
-            return
+            return 'Client not found. Please verify the code or name.'
             
-        client_code = clients[0][0]
-        
         # Get client_id
-        client_id = self.get_client_id_by_code(client_code)
+        client_id = self.get_client_id_by_code(clients[0][0])
         if not client_id:
-            self.show_error_message(self.tr('Client not found in database.'))
-            return
+            return 'Client not found in database.'
             
-        try:
-            self.controller.log_checkin(client_id, 1)  # Assume user_id=1 (admin) for now
-            self.show_success_message(self.tr('✅ Check-in logged successfully!'))
-            self.client_input.clear()
-            self.load_attendance()  # Refresh the table
-        except Exception as e:
-            self.show_error_message(str(e))
+        self.controller.log_checkin(client_id, 1)  # Assume user_id=1 (admin) for now
+        return None
+
+    def on_checkin_logged(self, error):
+        if error:
+            self.show_error_message(self.tr(error))
+            return
+        self.show_success_message(self.tr('✅ Check-in logged successfully!'))
+        self.client_input.clear()
+        self.load_attendance()  # Refresh the table
+
+    def set_loading(self, key, loading):
+        """Show that attendance is being queried or a check-in is being logged"""
+        if key == 'checkin':
+            # One check-in at a time, so a double click does not log two
+            self.checkin_btn.setEnabled(not loading)
+        elif loading:
+            self.table.setCursor(Qt.BusyCursor)
+            self.stats_label.setText(self.tr('⏳ Loading...'))
+        else:
+            self.table.unsetCursor()
 
     def show_success_message(self, message):
         msg_box = QMessageBox(self)
@@ -5,6 +5,7 @@ from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdi
 from PyQt5.QtCore import QDate, Qt
 from PyQt5.QtGui import QFont, QPixmap
 import re
+from views.theme import apply_theme
 
 class ClientProfileDialog(QDialog):
     def __init__(self, translator, client=None):
@@ -494,337 +495,7 @@ class ClientProfileDialog(QDialog):
         return actions_frame
 
     def apply_styles(self):
-        style_sheet = """
-            /* Main Dialog */
-            QDialog {
-                background-color: #2c2c2c;
-                color: #ffffff;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            
-            /* Header Frame */
-            QFrame#headerFrame {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e63946, stop:1 #c1121f);
-                border: none;
-                border-bottom: 3px solid #a00e1c;
-            }
-            
-            QLabel#headerIcon {
-                font-size: 24px;
-                color: white;
-                background: transparent;
-            }
-            
-            QLabel#headerTitle {
-                color: white;
-                font-size: 22px;
-                font-weight: bold;
-                background: transparent;
-            }
-            
-            QLabel#headerSubtitle {
-                color: #f0f0f0;
-                font-size: 14px;
-                font-weight: 400;
-                background: transparent;
-            }
-            
-            /* Scroll Area */
-            QScrollArea#scrollArea {
-                background-color: #2c2c2c;
-                border: none;
-            }
-            
-            QScrollArea#scrollArea QWidget {
-                background-color: #2c2c2c;
-            }
-            
-            /* Section Frames */
-            QFrame#sectionFrame {
-                background-color: #404040;
-                border: 2px solid #505050;
-                border-radius: 12px;
-                margin: 5px 0px;
-            }
-            
-            QFrame#sectionFrame:hover {
-                border-color: #e63946;
-                background-color: #4a4a4a;
-            }
-            
-            /* Section Titles */
-            QLabel#sectionTitle {
-                color: #e63946;
-                font-size: 16px;
-                font-weight: bold;
-                background: transparent;
-                padding: 5px 0px;
-                border-bottom: 2px solid #e63946;
-                margin-bottom: 10px;
-            }
-            
-            /* Field Labels */
-            QLabel#fieldLabel {
-                color: #ffffff;
-                font-size: 14px;
-                font-weight: 600;
-                background: transparent;
-                min-width: 140px;
-            }
-            
-            QLabel#noteLabel {
-                color: #cccccc;
-                font-size: 12px;
-                font-style: italic;
-                background: transparent;
-                margin-bottom: 10px;
-            }
-            
-            /* Input Fields */
-            QLineEdit#inputField {
-                background-color: #505050;
-                border: 2px solid #606060;
-                border-radius: 8px;
-                padding: 12px 15px;
-                font-size: 14px;
-                color: #ffffff;
-                min-height: 20px;
-            }
-            
-            QLineEdit#inputField:focus {
-                border-color: #e63946;
-                background-color: #5a5a5a;
-            }
-            
-            QLineEdit#inputField::placeholder {
-                color: #999999;
-            }
-            
-            QLineEdit#inputFieldReadonly {
-                background-color: #3a3a3a;
-                border: 2px solid #505050;
-                border-radius: 8px;
-                padding: 12px 15px;
-                font-size: 14px;
-                color: #cccccc;
-                min-height: 20px;
-            }
-            
-            /* Combo Boxes */
-            QComboBox#comboField {
-                background-color: #505050;
-                border: 2px solid #606060;
-                border-radius: 8px;
-                padding: 12px 15px;
-                font-size: 14px;
-                color: #ffffff;
-                min-height: 20px;
-            }
-            
-            QComboBox#comboField:hover {
-                border-color: #e63946;
-                background-color: #5a5a5a;
-            }
-            
-            QComboBox#comboField::drop-down {
-                border: none;
-                padding-right: 10px;
-            }
-            
-            QComboBox#comboField::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 8px solid #ffffff;
-                margin-right: 5px;
-            }
-            
-            QComboBox#comboField QAbstractItemView {
-                background-color: #505050;
-                border: 2px solid #e63946;
-                border-radius: 8px;
-                selection-background-color: #e63946;
-                color: #ffffff;
-                padding: 5px;
-            }
-            
-            /* Spin Boxes */
-            QSpinBox#spinField {
-                background-color: #505050;
-                border: 2px solid #606060;
-                border-radius: 8px;
-                padding: 12px 15px;
-                font-size: 14px;
-                color: #ffffff;
-                min-height: 20px;
-            }
-            
-            QSpinBox#spinField:focus {
-                border-color: #e63946;
-                background-color: #5a5a5a;
-            }
-            
-            QSpinBox#spinField::up-button, QSpinBox#spinField::down-button {
-                background-color: #e63946;
-                border: none;
-                border-radius: 4px;
-                width: 20px;
-                margin: 2px;
-            }
-            
-            QSpinBox#spinField::up-button:hover, QSpinBox#spinField::down-button:hover {
-                background-color: #ff6b6b;
-            }
-            
-            QSpinBox#spinField::up-arrow, QSpinBox#spinField::down-arrow {
-                width: 8px;
-                height: 8px;
-            }
-            
-            /* Date Edit */
-            QDateEdit#dateField {
-                background-color: #505050;
-                border: 2px solid #606060;
-                border-radius: 8px;
-                padding: 12px 15px;
-                font-size: 14px;
-                color: #ffffff;
-                min-height: 20px;
-            }
-            
-            QDateEdit#dateField:focus {
-                border-color: #e63946;
-                background-color: #5a5a5a;
-            }
-            
-            QDateEdit#dateField::drop-down {
-                background-color: #e63946;
-                border: none;
-                border-radius: 4px;
-                width: 25px;
-                margin: 2px;
-            }
-            
-            QDateEdit#dateField::drop-down:hover {
-                background-color: #ff6b6b;
-            }
-            
-            /* Text Edit */
-            QTextEdit#textField {
-                background-color: #505050;
-                border: 2px solid #606060;
-                border-radius: 8px;
-                padding: 12px 15px;
-                font-size: 14px;
-                color: #ffffff;
-            }
-            
-            QTextEdit#textField:focus {
-                border-color: #e63946;
-                background-color: #5a5a5a;
-            }
-            
-            /* Browse Button */
-            QPushButton#browseButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #17a2b8, stop:1 #0f7b8a);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 12px 20px;
-            }
-            
-            QPushButton#browseButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #28a9c4, stop:1 #17a2b8);
-            }
-            
-            /* Actions Frame */
-            QFrame#actionsFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-top: 3px solid #e63946;
-            }
-            
-            /* Action Buttons */
-            QPushButton#saveButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #38b000, stop:1 #2d8000);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 20px;
-            }
-            
-            QPushButton#saveButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4ade80, stop:1 #38b000);
-            }
-            
-            QPushButton#cancelButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #6c757d, stop:1 #495057);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 20px;
-            }
-            
-            QPushButton#cancelButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #5a6268, stop:1 #343a40);
-            }
-            
-            /* Scrollbars */
-            QScrollBar:vertical {
-                background-color: #404040;
-                width: 12px;
-                border-radius: 6px;
-                margin: 0px;
-            }
-            
-            QScrollBar::handle:vertical {
-                background-color: #e63946;
-                border-radius: 6px;
-                min-height: 30px;
-            }
-            
-            QScrollBar::handle:vertical:hover {
-                background-color: #ff6b6b;
-            }
-            
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            
-            /* Message Boxes */
-            QMessageBox {
-                background-color: #2c2c2c;
-                color: #ffffff;
-            }
-            
-            QMessageBox QPushButton {
-                background-color: #e63946;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 20px;
-                font-weight: 600;
-                min-width: 80px;
-            }
-            
-            QMessageBox QPushButton:hover {
-                background-color: #ff6b6b;
-            }
-        """
-        self.setStyleSheet(style_sheet)
+        apply_theme(self, 'client_profile_dialog')
 
     def browse_picture(self):
         file, _ = QFileDialog.getOpenFileName(
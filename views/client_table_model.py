@@ -0,0 +1,148 @@
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QVariant, pyqtSignal
+from models.client_model import CLIENT_COLUMNS
+from views.query_worker import QueryRunner
+from datetime import datetime, timedelta
+
+
+class ClientTableModel(QAbstractTableModel):
+    """Lazily paged client directory for a QTableView.
+
+    Rows are pulled from the controller a page at a time as the view scrolls
+    (canFetchMore/fetchMore), so only what has been scrolled into view is
+    ever materialized. Sorting is delegated to SQL through get_page().
+    A filter or sort change queries the count and first page on a worker
+    thread (see QueryRunner); loading is reported through runner.loadingChanged.
+    """
+
+    loadFailed = pyqtSignal(object)
+
+    PAGE_SIZE = 200
+    HEADERS = ['Code', 'Name', 'Phone', 'Subscription', 'Start Date', 'End Date', 'Status']
+    STATUS_COLUMN = 6
+
+    def __init__(self, controller, translator, parent=None):
+        super().__init__(parent)
+        self.controller = controller
+        self.translator = translator
+        self.keyword = None
+        self.status = None
+        self.sort_column = 'client_code'
+        self.descending = False
+        self._rows = []
+        self._statuses = []
+        self._total = 0
+        self.runner = QueryRunner(self)
+
+    def tr(self, text):
+        return self.translator.translate(text)
+
+    # Data loading
+    def set_filter(self, keyword=None, status=None):
+        self.keyword = keyword or None
+        self.status = status
+        self.refresh()
+
+    def refresh(self):
+        # Supersedes a refresh still in flight, e.g. from the previous keystroke
+        self.runner.submit('refresh', self._load_first_page, self.keyword, self.status,
+                           self.sort_column, self.descending,
+                           on_result=self._on_first_page, on_error=self.loadFailed.emit)
+
+    def _load_first_page(self, keyword, status, sort_column, descending):
+        # Runs on a worker thread
+        total = self.controller.count(keyword, status)
+        rows = self.controller.get_page(0, self.PAGE_SIZE, keyword, sort_column, descending, status)
+        return total, rows
+
+    def _on_first_page(self, result):
+        self.beginResetModel()
+        self._rows = []
+        self._statuses = []
+        self._total, rows = result
+        today = datetime.now().date()
+        self._today = today.strftime('%Y-%m-%d')
+        self._week_from_now = (today + timedelta(days=7)).strftime('%Y-%m-%d')
+        self._append(rows)
+        self.endResetModel()
+
+    def _fetch_page(self):
+        return self.controller.get_page(len(self._rows), self.PAGE_SIZE, self.keyword,
+                                        self.sort_column, self.descending, self.status)
+
+    def _append(self, rows):
+        self._rows.extend(rows)
+        self._statuses.extend(self.status_for(row[5]) for row in rows)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        # The loaded rows belong to the previous filter until the refresh lands
+        if parent.isValid() or self.runner.is_loading('refresh'):
+            return False
+        return len(self._rows) < self._total
+
+    def fetchMore(self, parent=QModelIndex()):
+        # Follow-up pages are small index walks and stay on the GUI thread
+        if parent.isValid() or self.runner.is_loading('refresh'):
+            return
+        rows = self._fetch_page()
+        if not rows:
+            # Clients were deleted since the count was taken
+            self._total = len(self._rows)
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._append(rows)
+        self.endInsertRows()
+
+    def status_for(self, end_date):
+        # Dates are stored as YYYY-MM-DD, so string comparison orders them
+        if not end_date:
+            return 'Unknown'
+        if end_date < self._today:
+            return '❌ Expired'
+        if end_date <= self._week_from_now:
+            return '⏰ Ending Soon'
+        return '✅ Active'
+
+    def client_at(self, row):
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    # QAbstractTableModel interface
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return QVariant()
+        if role == Qt.DisplayRole:
+            if index.column() == self.STATUS_COLUMN:
+                return self.tr(self._statuses[index.row()])
+            return str(self._rows[index.row()][index.column()])
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return QVariant()
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.tr(self.HEADERS[section])
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        # Read-only
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        # Status is derived from the end date, so it sorts the same way
+        self.sort_column = CLIENT_COLUMNS[min(max(column, 0), len(CLIENT_COLUMNS) - 1)]
+        self.descending = order == Qt.DescendingOrder
+        self.refresh()
+
+    def retranslate(self):
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(self.HEADERS) - 1)
+        if self._rows:
+            self.dataChanged.emit(self.index(0, self.STATUS_COLUMN),
+                                  self.index(len(self._rows) - 1, self.STATUS_COLUMN))
@@ -1,15 +1,20 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit, 
-                                QLabel, QTableWidget, QTableWidgetItem, QMessageBox, QSizePolicy,
+                                QLabel, QTableView, QMessageBox, QSizePolicy,
                                 QFrame, QHeaderView, QComboBox, QGraphicsDropShadowEffect,
                                 QSpacerItem, QAbstractItemView)
 from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QColor, QFont, QPalette
 from controllers.clients_controller import ClientsController
 from views.client_profile_dialog import ClientProfileDialog
+from views.client_table_model import ClientTableModel
 import uuid
 from datetime import datetime, timedelta
+from views.theme import apply_theme
 
 class ClientsView(QWidget):
+    # Status filter per filter_combo index: All Clients, Active, Expired, Ending Soon
+    STATUS_FILTERS = [None, 'active', 'expired', 'ending_soon']
+
     def __init__(self, translator):
         super().__init__()
         self.translator = translator
@@ -206,23 +211,21 @@ class ClientsView(QWidget):
         table_title = QLabel(self.tr('Client Directory'))
         table_title.setObjectName("sectionTitle")
         
-        # Create table
-        self.table = QTableWidget(0, 7)
+        # Create table backed by a lazily paged model
+        self.table = QTableView()
         self.table.setObjectName("clientsTable")
-        self.table.setHorizontalHeaderLabels([
-            self.tr('Code'), 
-            self.tr('Name'), 
-            self.tr('Phone'), 
-            self.tr('Subscription'), 
-            self.tr('Start Date'), 
-            self.tr('End Date'),
-            self.tr('Status')
-        ])
+        self.table_model = ClientTableModel(self.controller, self.translator, self)
+        self.table.setModel(self.table_model)
+        self.table_model.runner.loadingChanged.connect(self.set_loading)
+        self.table_model.loadFailed.connect(self.show_load_error)
         
         # Configure table
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Stretch)
         header.setMinimumHeight(45)
+        header.setSortIndicator(0, Qt.AscendingOrder)
+        self.table.verticalHeader().setDefaultSectionSize(50)
+        self.table.setSortingEnabled(True)
         
         self.table.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.table.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
@@ -299,423 +302,18 @@ class ClientsView(QWidget):
         return actions_frame
 
     def apply_styles(self):
-        style_sheet = """
-            /* Main Widget Background - DARK like Dashboard */
-            QWidget {
-                background-color: #2c2c2c;
-                color: #ffffff;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            
-            /* Header Frame - DARK seamless */
-            QFrame#headerFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-bottom: 1px solid #404040;
-            }
-            
-            QLabel#pageTitle {
-                color: #ffffff;
-                font-size: 28px;
-                font-weight: bold;
-                background: transparent;
-            }
-            
-            QLabel#pageSubtitle {
-                color: #cccccc;
-                font-size: 16px;
-                font-weight: 400;
-                background: transparent;
-            }
-            
-            /* Search Frame - DARK seamless */
-            QFrame#searchFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-bottom: 1px solid #404040;
-            }
-            
-            QLabel#searchIcon {
-                font-size: 18px;
-                background: transparent;
-                color: #e63946;
-            }
-            
-            QLineEdit#searchInput {
-                background-color: #404040;
-                border: 2px solid #505050;
-                border-radius: 8px;
-                padding: 12px 15px;
-                font-size: 14px;
-                color: #ffffff;
-            }
-            
-            QLineEdit#searchInput:focus {
-                border-color: #e63946;
-                background-color: #4a4a4a;
-            }
-            
-            QLineEdit#searchInput::placeholder {
-                color: #999999;
-            }
-            
-            QComboBox#filterCombo {
-                background-color: #404040;
-                border: 2px solid #505050;
-                border-radius: 8px;
-                padding: 12px 15px;
-                font-size: 14px;
-                color: #ffffff;
-            }
-            
-            QComboBox#filterCombo:hover {
-                border-color: #e63946;
-                background-color: #4a4a4a;
-            }
-            
-            QComboBox#filterCombo::drop-down {
-                border: none;
-                padding-right: 10px;
-            }
-            
-            QComboBox#filterCombo::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 8px solid #ffffff;
-                margin-right: 5px;
-            }
-            
-            QComboBox#filterCombo QAbstractItemView {
-                background-color: #404040;
-                border: 2px solid #e63946;
-                border-radius: 8px;
-                selection-background-color: #e63946;
-                color: #ffffff;
-            }
-            
-            /* Search and Clear Buttons */
-            QPushButton#searchButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e63946, stop:1 #c1121f);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 20px;
-            }
-            
-            QPushButton#searchButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff6b6b, stop:1 #e63946);
-            }
-            
-            QPushButton#clearButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #6c757d, stop:1 #495057);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 20px;
-            }
-            
-            QPushButton#clearButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #5a6268, stop:1 #343a40);
-            }
-            
-            /* Stats Frame - DARK seamless */
-            QFrame#statsFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-bottom: 1px solid #404040;
-            }
-            
-            QFrame#statCard {
-                background-color: #404040;
-                border: 2px solid #505050;
-                border-radius: 10px;
-            }
-            
-            QFrame#statCard:hover {
-                border-color: #e63946;
-                background-color: #4a4a4a;
-            }
-            
-            QLabel#statIcon {
-                font-size: 20px;
-                background: transparent;
-            }
-            
-            QLabel#statValue {
-                background: transparent;
-            }
-            
-            QLabel#statLabel {
-                color: #cccccc;
-                font-size: 13px;
-                font-weight: 500;
-                background: transparent;
-            }
-            
-            /* Table Frame - DARK seamless */
-            QFrame#tableFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-bottom: 1px solid #404040;
-            }
-            
-            /* Section Titles */
-            QLabel#sectionTitle {
-                color: #ffffff;
-                font-size: 20px;
-                font-weight: bold;
-                background: transparent;
-                padding: 0px 0px 10px 0px;
-                border-bottom: 3px solid #e63946;
-            }
-            
-            /* Table Styling - DARK */
-            QTableWidget#clientsTable {
-                background-color: #404040;
-                alternate-background-color: #4a4a4a;
-                border: none;
-                gridline-color: #505050;
-                font-size: 13px;
-                selection-background-color: #e63946;
-                selection-color: white;
-            }
-            
-            QTableWidget#clientsTable::item {
-                padding: 12px 8px;
-                border-bottom: 1px solid #505050;
-            }
-            
-            QTableWidget#clientsTable::item:selected {
-                background-color: #e63946;
-                color: white;
-            }
-            
-            QTableWidget#clientsTable::item:hover {
-                background-color: #4a4a4a;
-            }
-            
-            QHeaderView::section {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e63946, stop:1 #c1121f);
-                color: white;
-                padding: 12px 8px;
-                border: none;
-                border-right: 1px solid #a00e1c;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            
-            QHeaderView::section:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff6b6b, stop:1 #e63946);
-            }
-            
-            /* Scrollbars - DARK */
-            QScrollBar:vertical {
-                background-color: #404040;
-                width: 12px;
-                border-radius: 6px;
-                margin: 0px;
-            }
-            
-            QScrollBar::handle:vertical {
-                background-color: #e63946;
-                border-radius: 6px;
-                min-height: 30px;
-            }
-            
-            QScrollBar::handle:vertical:hover {
-                background-color: #ff6b6b;
-            }
-            
-            /* Actions Frame - DARK seamless */
-            QFrame#actionsFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-top: 2px solid #e63946;
-            }
-            
-            QLabel#actionsTitle {
-                color: #e63946;
-                font-size: 18px;
-                font-weight: bold;
-                background: transparent;
-            }
-            
-            /* Action Buttons */
-            QPushButton#addButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #38b000, stop:1 #2d8000);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 15px;
-            }
-            
-            QPushButton#addButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4ade80, stop:1 #38b000);
-            }
-            
-            QPushButton#editButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e63946, stop:1 #c1121f);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 15px;
-            }
-            
-            QPushButton#editButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff6b6b, stop:1 #e63946);
-            }
-            
-            QPushButton#deleteButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #dc3545, stop:1 #a71e2a);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 15px;
-            }
-            
-            QPushButton#deleteButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e74c3c, stop:1 #dc3545);
-            }
-            
-            QPushButton#exportButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #17a2b8, stop:1 #0f7b8a);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 15px;
-            }
-            
-            QPushButton#exportButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #28a9c4, stop:1 #17a2b8);
-            }
-            
-            /* Message Boxes - DARK */
-            QMessageBox {
-                background-color: #2c2c2c;
-                color: #ffffff;
-            }
-            
-            QMessageBox QPushButton {
-                background-color: #e63946;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 20px;
-                font-weight: 600;
-                min-width: 80px;
-            }
-            
-            QMessageBox QPushButton:hover {
-                background-color: #ff6b6b;
-            }
-        """
-        self.setStyleSheet(style_sheet)
+        apply_theme(self, 'clients')
 
     def get_client_stats(self):
         """Get client statistics"""
         try:
-            clients = self.controller.load_all()
-            total = len(clients)
-            active = 0
-            expired = 0
-            ending_soon = 0
-            
-            today = datetime.now().date()
-            week_from_now = today + timedelta(days=7)
-            
-            for client in clients:
-                try:
-                    end_date = datetime.strptime(client[5], '%Y-%m-%d').date()
-                    if end_date >= today:
-                        active += 1
-                        if end_date <= week_from_now:
-                            ending_soon += 1
-                    else:
-                        expired += 1
-                except:
-                    pass
-            
-            return {
-                'total': total,
-                'active': active,
-                'expired': expired,
-                'ending_soon': ending_soon
-            }
+            return self.controller.get_status_counts()
         except:
             return {'total': 0, 'active': 0, 'expired': 0, 'ending_soon': 0}
 
     def load_clients(self):
         """Load clients into the table"""
-        clients = self.controller.load_all()
-        self.table.setRowCount(0)
-        
-        today = datetime.now().date()
-        week_from_now = today + timedelta(days=7)
-        
-        for row_data in clients:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            # Add regular data
-            for col, value in enumerate(row_data):
-                item = QTableWidgetItem(str(value))
-                item.setFlags(item.flags() & ~Qt.ItemIsEditable)  # Make read-only
-                item.setTextAlignment(Qt.AlignCenter)
-                self.table.setItem(row, col, item)
-            
-            # Add status column
-            try:
-                end_date = datetime.strptime(row_data[5], '%Y-%m-%d').date()
-                if end_date < today:
-                    status = "❌ Expired"
-                    status_color = "#dc3545"
-                elif end_date <= week_from_now:
-                    status = "⏰ Ending Soon"
-                    status_color = "#ffcc00"
-                else:
-                    status = "✅ Active"
-                    status_color = "#38b000"
-                
-                status_item = QTableWidgetItem(status)
-                status_item.setFlags(status_item.flags() & ~Qt.ItemIsEditable)
-                status_item.setTextAlignment(Qt.AlignCenter)
-                self.table.setItem(row, 6, status_item)
-                
-                # Set row height
-                self.table.setRowHeight(row, 50)
-                
-            except:
-                status_item = QTableWidgetItem("❓ Unknown")
-                status_item.setFlags(status_item.flags() & ~Qt.ItemIsEditable)
-                status_item.setTextAlignment(Qt.AlignCenter)
-                self.table.setItem(row, 6, status_item)
+        self.apply_filter()
 
     def on_search_text_changed(self):
         """Handle real-time search as user types"""
@@ -729,75 +327,23 @@ class ClientsView(QWidget):
 
     def handle_search(self):
         """Handle search functionality"""
-        keyword = self.search_input.text().strip()
-        if keyword:
-            clients = self.controller.search(keyword)
-        else:
-            clients = self.controller.load_all()
-        
-        self.populate_table(clients)
         self.apply_filter()
 
     def apply_filter(self):
-        """Apply filter based on status"""
-        filter_text = self.filter_combo.currentText()
-        
-        for row in range(self.table.rowCount()):
-            show_row = True
-            
-            if filter_text != self.tr('All Clients'):
-                status_item = self.table.item(row, 6)
-                if status_item:
-                    status = status_item.text()
-                    
-                    if filter_text == self.tr('Active') and '✅' not in status:
-                        show_row = False
-                    elif filter_text == self.tr('Expired') and '❌' not in status:
-                        show_row = False
-                    elif filter_text == self.tr('Ending Soon') and '⏰' not in status:
-                        show_row = False
-            
-            self.table.setRowHidden(row, not show_row)
+        """Query the clients matching the search keyword and status filter"""
+        index = self.filter_combo.currentIndex()
+        status = self.STATUS_FILTERS[index] if 0 <= index < len(self.STATUS_FILTERS) else None
+        self.table_model.set_filter(self.search_input.text().strip(), status)
+
+    def set_loading(self, key, loading):
+        """Show a busy cursor over the table while a query is running"""
+        if loading:
+            self.table.setCursor(Qt.BusyCursor)
+        else:
+            self.table.unsetCursor()
 
-    def populate_table(self, clients):
-        """Populate table with client data"""
-        self.table.setRowCount(0)
-        
-        today = datetime.now().date()
-        week_from_now = today + timedelta(days=7)
-        
-        for row_data in clients:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            # Add regular data
-            for col, value in enumerate(row_data):
-                item = QTableWidgetItem(str(value))
-                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                item.setTextAlignment(Qt.AlignCenter)
-                self.table.setItem(row, col, item)
-            
-            # Add status column
-            try:
-                end_date = datetime.strptime(row_data[5], '%Y-%m-%d').date()
-                if end_date < today:
-                    status = '❌ Expired'
-                elif end_date <= week_from_now:
-                    status = '⏰ Ending Soon'
-                else:
-                    status = '✅ Active'
-                status_item = QTableWidgetItem(self.tr(status))
-                status_item.setFlags(status_item.flags() & ~Qt.ItemIsEditable)
-                status_item.setTextAlignment(Qt.AlignCenter)
-                self.table.setItem(row, 6, status_item)
-                
-                self.table.setRowHeight(row, 50)
-                
-            except:
-                status_item = QTableWidgetItem(self.tr("Unknown"))
-                status_item.setFlags(status_item.flags() & ~Qt.ItemIsEditable)
-                status_item.setTextAlignment(Qt.AlignCenter)
-                self.table.setItem(row, 6, status_item)
+    def show_load_error(self, error):
+        QMessageBox.critical(self, self.tr('Error'), self.tr(f'❌ Error: {str(error)}'))
 
     def clear_search(self):
         """Clear search and filters"""
@@ -832,18 +378,13 @@ class ClientsView(QWidget):
 
     def open_edit_dialog(self):
         """Open dialog to edit selected client"""
-        row = self.table.currentRow()
-        if row < 0:
+        client = self.table_model.client_at(self.table.currentIndex().row())
+        if client is None:
             QMessageBox.information(self, self.tr('No Selection'), 
                                 self.tr('Please select a client to edit.'))
             return
         
-        code = self.table.item(row, 0).text()
-        name = self.table.item(row, 1).text()
-        phone = self.table.item(row, 2).text()
-        sub_type = self.table.item(row, 3).text()
-        start = self.table.item(row, 4).text()
-        end = self.table.item(row, 5).text()
+        code, name, phone, sub_type, start, end = (str(value) for value in client)
         
         dlg = ClientProfileDialog(self.translator)
         dlg.code_input.setText(code)
@@ -873,14 +414,13 @@ class ClientsView(QWidget):
 
     def handle_delete(self):
         """Handle client deletion"""
-        row = self.table.currentRow()
-        if row < 0:
+        client = self.table_model.client_at(self.table.currentIndex().row())
+        if client is None:
             QMessageBox.information(self, self.tr('No Selection'), 
                                 self.tr('Please select a client to delete.'))
             return
         
-        code = self.table.item(row, 0).text()
-        name = self.table.item(row, 1).text()
+        code, name = client[0], client[1]
         
         reply = QMessageBox.question(
             self, 
@@ -963,6 +503,8 @@ class ClientsView(QWidget):
         if hasattr(self, 'search_input'):
             self.search_input.setPlaceholderText(self.tr('Search by name, code, or phone number...'))
         if hasattr(self, 'filter_combo'):
+            current = self.filter_combo.currentIndex()
+            self.filter_combo.blockSignals(True)
             self.filter_combo.clear()
             self.filter_combo.addItems([
                 self.tr('All Clients'),
@@ -970,6 +512,8 @@ class ClientsView(QWidget):
                 self.tr('Expired'),
                 self.tr('Ending Soon')
             ])
+            self.filter_combo.setCurrentIndex(max(current, 0))
+            self.filter_combo.blockSignals(False)
         if hasattr(self, 'search_btn'):
             self.search_btn.setText(self.tr('🔍 Search'))
         if hasattr(self, 'clear_btn'):
@@ -987,15 +531,7 @@ class ClientsView(QWidget):
                         label_widget.setText(f"{self.tr(label)} ({value})")
         # Update table headers
         if hasattr(self, 'table'):
-            self.table.setHorizontalHeaderLabels([
-                self.tr('Code'),
-                self.tr('Name'),
-                self.tr('Phone'),
-                self.tr('Subscription'),
-                self.tr('Start Date'),
-                self.tr('End Date'),
-                self.tr('Status')
-            ])
+            self.table_model.retranslate()
             self.table.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         # Update action buttons
         if hasattr(self, 'add_btn'):
@@ -3,19 +3,10 @@ from PyQt5.QtWidgets import (QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLay
                              QSizePolicy, QGraphicsDropShadowEffect, QApplication, QDesktopWidget)
 from PyQt5.QtCore import Qt, QPropertyAnimation, QRect, QEasingCurve, pyqtSignal
 from PyQt5.QtGui import QFont, QPixmap, QPainter, QColor, QIcon, QPalette
-from views.clients_view import ClientsView
-from views.attendance_view import AttendanceView
-from views.finance_view import FinanceView
-from views.sessions_view import SessionsView
-from views.invitations_view import InvitationsView
-from views.loans_view import LoansView
-from views.reports_view import ReportsView
-from views.user_management_view import UserManagementView
 from controllers.reports_controller import ReportsController
-from models.client_model import ClientModel
-from models.finance_model import FinanceModel
-from models.invitation_model import InvitationModel
+from i18n.translator import TranslatableBindings
 import sys
+from views.theme import apply_theme
 
 class DashboardWindow(QWidget):
     def __init__(self, user, translator, main_window=None):
@@ -23,12 +14,14 @@ class DashboardWindow(QWidget):
         self.user = user
         self.translator = translator
         self.main_window = main_window
+        # Every translated text, so retranslate_ui() can update it in place
+        self.bindings = TranslatableBindings(translator)
         self.init_ui()
         self.apply_styles()
         self.setup_animations()
 
     def init_ui(self):
-        self.setWindowTitle(self.tr('Gym Management Dashboard'))
+        self.bindings.bind(self.setWindowTitle, 'Gym Management Dashboard')
         
         # Make window fullscreen and fixed
         self.setWindowState(Qt.WindowMaximized)
@@ -88,12 +81,14 @@ class DashboardWindow(QWidget):
         logo_icon.setAlignment(Qt.AlignCenter)
         
         # App title
-        app_title = QLabel(self.tr('GYM\nMANAGEMENT'))
+        app_title = QLabel()
+        self.bindings.bind(app_title.setText, 'GYM\nMANAGEMENT')
         app_title.setObjectName("sidebarTitle")
         app_title.setAlignment(Qt.AlignCenter)
         
         # User info
-        user_info = QLabel(self.tr(f'{self.user[1]}\n{self.user[2].upper()}'))
+        user_info = QLabel()
+        self.bindings.bind(user_info.setText, f'{self.user[1]}\n{self.user[2].upper()}')
         user_info.setObjectName("sidebarUserInfo")
         user_info.setAlignment(Qt.AlignCenter)
         
@@ -113,7 +108,8 @@ class DashboardWindow(QWidget):
         nav_layout.setContentsMargins(20, 30, 20, 30)
         
         # Section title
-        nav_title = QLabel(self.tr('QUICK ACTIONS'))
+        nav_title = QLabel()
+        self.bindings.bind(nav_title.setText, 'QUICK ACTIONS')
         nav_title.setObjectName("sidebarNavTitle")
         nav_layout.addWidget(nav_title)
         
@@ -121,18 +117,19 @@ class DashboardWindow(QWidget):
         
         # Define navigation buttons
         nav_buttons = [
-            ('👥', self.tr('Clients'), self.open_clients),
-            ('📋', self.tr('Attendance'), self.open_attendance),
-            ('💰', self.tr('Finance'), self.open_finance),
-            ('🏃', self.tr('Sessions'), self.open_sessions),
-            ('📨', self.tr('Invitations'), self.open_invitations),
-            ('💳', self.tr('Loans'), self.open_loans),
-            ('📊', self.tr('Reports'), self.open_reports)
+            ('👥', 'Clients', self.open_clients),
+            ('📋', 'Attendance', self.open_attendance),
+            ('💰', 'Finance', self.open_finance),
+            ('🏃', 'Sessions', self.open_sessions),
+            ('📨', 'Invitations', self.open_invitations),
+            ('💳', 'Loans', self.open_loans),
+            ('📊', 'Reports', self.open_reports)
         ]
         
         # Add admin button if admin
         if self.user[2] == 'admin':
-            nav_buttons.append(('⚙️', self.tr('User Management'), self.open_user_management))
+            nav_buttons.append(('⚙️', 'User Management', self.open_user_management))
+            nav_buttons.append(('🩺', 'Diagnostics', self.open_diagnostics))
         
         # Create navigation buttons
         for icon, text, callback in nav_buttons:
@@ -150,7 +147,7 @@ class DashboardWindow(QWidget):
         button.setObjectName("sidebarButton")
         button.setFixedHeight(55)
         button.clicked.connect(callback)
-        button.setText(f"{icon}  {text}")
+        self.bindings.bind(button.setText, text, f"{icon}  {{}}")
         return button
 
     def create_main_content(self):
@@ -179,13 +176,15 @@ class DashboardWindow(QWidget):
 
         # Admin stats section (if admin)
         if self.user[2] == 'admin':
+            stats_data = self.get_admin_stats()
+
             # Warning section for missing payments
-            warning_section = self.create_warning_section()
+            warning_section = self.create_warning_section(stats_data)
             if warning_section:
                 content_layout.addWidget(warning_section)
             
             # Stats section
-            stats_section = self.create_stats_section()
+            stats_section = self.create_stats_section(stats_data)
             content_layout.addWidget(stats_section)
 
         # Add stretch to push content to top
@@ -211,10 +210,12 @@ class DashboardWindow(QWidget):
         welcome_layout.setSpacing(10)
         welcome_layout.setContentsMargins(40, 30, 40, 30)
         
-        welcome_title = QLabel(self.tr('Dashboard Overview'))
+        welcome_title = QLabel()
+        self.bindings.bind(welcome_title.setText, 'Dashboard Overview')
         welcome_title.setObjectName("welcomeTitle")
         
-        welcome_subtitle = QLabel(self.tr('Monitor your gym operations and performance'))
+        welcome_subtitle = QLabel()
+        self.bindings.bind(welcome_subtitle.setText, 'Monitor your gym operations and performance')
         welcome_subtitle.setObjectName("welcomeSubtitle")
         
         welcome_layout.addWidget(welcome_title)
@@ -232,12 +233,10 @@ class DashboardWindow(QWidget):
         
         return welcome_frame
 
-    def create_warning_section(self):
-        from models.db_manager import DBManager
-        db = DBManager()
-        missing_payments = db.fetchone("SELECT COUNT(*) FROM clients WHERE amount_remaining > 0 AND end_date >= DATE('now')")
+    def create_warning_section(self, stats_data):
+        missing_payments = stats_data.missing_payments
         
-        if missing_payments and missing_payments[0] > 0:
+        if missing_payments > 0:
             warning_frame = QFrame()
             warning_frame.setObjectName("warningFrame")
             warning_frame.setFixedHeight(80)
@@ -249,7 +248,8 @@ class DashboardWindow(QWidget):
             warning_icon.setObjectName("warningIcon")
             warning_icon.setAlignment(Qt.AlignCenter)
             
-            warning_text = QLabel(self.tr(f'Alert: {missing_payments[0]} clients have missing or unmatched payments!'))
+            warning_text = QLabel()
+            self.bindings.bind(warning_text.setText, f'Alert: {missing_payments} clients have missing or unmatched payments!')
             warning_text.setObjectName("warningText")
             
             warning_layout.addWidget(warning_icon)
@@ -269,7 +269,7 @@ class DashboardWindow(QWidget):
             return warning_frame
         return None
 
-    def create_stats_section(self):
+    def create_stats_section(self, stats_data):
         stats_frame = QFrame()
         stats_frame.setObjectName("statsFrame")
         
@@ -278,23 +278,21 @@ class DashboardWindow(QWidget):
         stats_layout.setContentsMargins(40, 30, 40, 30)
         
         # Section title
-        stats_title = QLabel(self.tr('Key Metrics'))
+        stats_title = QLabel()
+        self.bindings.bind(stats_title.setText, 'Key Metrics')
         stats_title.setObjectName("sectionTitle")
         stats_layout.addWidget(stats_title)
         
-        # Get stats data
-        stats_data = self.get_admin_stats()
-        
         # Create stats grid with proper sizing
         stats_grid = QGridLayout()
         stats_grid.setSpacing(15)  # Reduced spacing
         
         # First row of stats
         row1_stats = [
-            ('👥', self.tr('Total Clients'), str(stats_data['total_clients']), '#e63946'),
-            ('✅', self.tr('Active'), str(stats_data['active']), '#38b000'),
-            ('❄️', self.tr('Frozen'), str(stats_data['frozen']), '#6c757d'),
-            ('⏰', self.tr('Ending Soon'), str(stats_data['ending_soon']), '#ffcc00')
+            ('👥', 'Total Clients', str(stats_data.total_clients), '#e63946'),
+            ('✅', 'Active', str(stats_data.active), '#38b000'),
+            ('❄️', 'Frozen', str(stats_data.frozen), '#6c757d'),
+            ('⏰', 'Ending Soon', str(stats_data.ending_soon), '#ffcc00')
         ]
         
         for i, (icon, label, value, color) in enumerate(row1_stats):
@@ -303,10 +301,10 @@ class DashboardWindow(QWidget):
         
         # Second row of stats
         row2_stats = [
-            ('💰', self.tr('Total Revenue'), f"${stats_data['revenue']:.2f}", '#38b000'),
-            ('📊', self.tr('Invite Conversion'), stats_data['invite_conversion'], '#e63946'),
-            ('⚠️', self.tr('Missing Payments'), str(stats_data['missing_payments']), '#c1121f'),
-            ('💵', self.tr('Daily Cashier'), f"${stats_data['daily_cashier']:.2f}", '#6c757d')
+            ('💰', 'Total Revenue', f"${stats_data.revenue:.2f}", '#38b000'),
+            ('📊', 'Invite Conversion', stats_data.invite_conversion, '#e63946'),
+            ('⚠️', 'Missing Payments', str(stats_data.missing_payments), '#c1121f'),
+            ('💵', 'Daily Cashier', f"${stats_data.daily_cashier:.2f}", '#6c757d')
         ]
         
         for i, (icon, label, value, color) in enumerate(row2_stats):
@@ -351,7 +349,8 @@ class DashboardWindow(QWidget):
         value_label.setStyleSheet(f"color: {color}; font-size: 26px; font-weight: bold;")
         
         # Label
-        label_widget = QLabel(label)
+        label_widget = QLabel()
+        self.bindings.bind(label_widget.setText, label)
         label_widget.setObjectName("statLabel")
         label_widget.setAlignment(Qt.AlignCenter)
         label_widget.setWordWrap(True)
@@ -374,259 +373,10 @@ class DashboardWindow(QWidget):
 
     def get_admin_stats(self):
         """Get admin statistics data"""
-        # Total clients
-        client_model = ClientModel()
-        total_clients = len(client_model.get_all())
-        
-        # Active/frozen/ending soon
-        from models.db_manager import DBManager
-        db = DBManager()
-        active = db.fetchone("SELECT COUNT(*) FROM clients WHERE end_date >= DATE('now') AND freeze_days = 0")
-        frozen = db.fetchone("SELECT COUNT(*) FROM clients WHERE freeze_days > 0")
-        ending_soon = db.fetchone("SELECT COUNT(*) FROM clients WHERE end_date BETWEEN DATE('now') AND DATE('now', '+7 day')")
-        
-        # Revenue
-        finance_model = FinanceModel()
-        revenue = sum([float(row[3]) for row in finance_model.get_all() if row[2] == 'payment'])
-        
-        # Invite conversion
-        invitation_model = InvitationModel()
-        total_invites = len(invitation_model.get_all())
-        tagged_invites = len([i for i in invitation_model.get_all() if i[5]])
-        invite_conversion = f"{tagged_invites}/{total_invites}" if total_invites else "0/0"
-        
-        # Missing payment alerts
-        missing_payments = db.fetchone("SELECT COUNT(*) FROM clients WHERE amount_remaining > 0 AND end_date >= DATE('now')")
-        
-        # Daily cashier (sum of today's payments)
-        daily_cashier = db.fetchone("SELECT SUM(amount) FROM finances WHERE category='payment' AND DATE(created_at)=DATE('now')")
-        
-        return {
-            'total_clients': total_clients,
-            'active': active[0] if active else 0,
-            'frozen': frozen[0] if frozen else 0,
-            'ending_soon': ending_soon[0] if ending_soon else 0,
-            'revenue': revenue,
-            'invite_conversion': invite_conversion,
-            'missing_payments': missing_payments[0] if missing_payments else 0,
-            'daily_cashier': daily_cashier[0] if daily_cashier and daily_cashier[0] else 0
-        }
+        return ReportsController().get_admin_stats()
 
     def apply_styles(self):
-        style_sheet = """
-            /* Main Window Background */
-            QWidget {
-                background-color: #2c2c2c;
-                color: #ffffff;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            
-            /* Sidebar - Full Height */
-            QFrame#sidebar {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #1a1a1a, stop:0.3 #2c2c2c, stop:0.7 #1a1a1a, stop:1 #0d0d0d);
-                border-right: 3px solid #e63946;
-                min-height: 100vh;
-            }
-            
-            /* Sidebar Header */
-            QFrame#sidebarHeader {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e63946, stop:0.3 #dc2f3e, stop:0.7 #c1121f, stop:1 #a00e1c);
-                border: none;
-            }
-            
-            QLabel#sidebarLogo {
-                font-size: 40px;
-                color: white;
-                font-weight: bold;
-                background: transparent;
-                text-shadow: 2px 2px 5px rgba(0,0,0,0.4);
-            }
-            
-            QLabel#sidebarTitle {
-                color: white;
-                font-size: 18px;
-                font-weight: bold;
-                letter-spacing: 2px;
-                background: transparent;
-                text-shadow: 1px 1px 3px rgba(0,0,0,0.4);
-                line-height: 1.2;
-            }
-            
-            QLabel#sidebarUserInfo {
-                color: rgba(255, 255, 255, 0.9);
-                font-size: 14px;
-                font-weight: 500;
-                background: transparent;
-                text-shadow: 1px 1px 2px rgba(0,0,0,0.3);
-                line-height: 1.3;
-            }
-            
-            /* Sidebar Navigation - Fills remaining space */
-            QFrame#sidebarNav {
-                background: transparent;
-                border: none;
-            }
-            
-            QLabel#sidebarNavTitle {
-                color: #cccccc;
-                font-size: 12px;
-                font-weight: 600;
-                letter-spacing: 1px;
-                background: transparent;
-                padding: 0px 10px;
-            }
-            
-            /* Sidebar Buttons - Full Width */
-            QPushButton#sidebarButton {
-                background-color: rgba(255, 255, 255, 0.05);
-                color: #ffffff;
-                border: 2px solid transparent;
-                border-radius: 12px;
-                font-size: 16px;
-                font-weight: 500;
-                text-align: left;
-                padding: 0px 20px;
-                margin: 2px 0px;
-                min-width: 100%;
-            }
-            
-            QPushButton#sidebarButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e63946, stop:1 #c1121f);
-                border-color: #ff6b6b;
-                color: white;
-                font-weight: 600;
-            }
-            
-            QPushButton#sidebarButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #c1121f, stop:1 #a00e1c);
-            }
-            
-            /* Main Content Area */
-            QFrame#mainContent {
-                background-color: #2c2c2c;
-                border: none;
-            }
-            
-            /* Content Scroll Area */
-            QScrollArea#contentScrollArea {
-                border: none;
-                background: transparent;
-            }
-            
-            QScrollArea#contentScrollArea QScrollBar:vertical {
-                background-color: #404040;
-                width: 12px;
-                border-radius: 6px;
-                margin: 0px;
-            }
-            
-            QScrollArea#contentScrollArea QScrollBar::handle:vertical {
-                background-color: #e63946;
-                border-radius: 6px;
-                min-height: 30px;
-            }
-            
-            QScrollArea#contentScrollArea QScrollBar::handle:vertical:hover {
-                background-color: #ff6b6b;
-            }
-            
-            /* Content Widget */
-            QFrame#contentWidget {
-                background: transparent;
-                border: none;
-            }
-            
-            /* Welcome Section */
-            QFrame#welcomeFrame {
-                background-color: #3a3a3a;
-                border-radius: 15px;
-                border: 2px solid #4a4a4a;
-            }
-            
-            QLabel#welcomeTitle {
-                color: #ffffff;
-                font-size: 28px;
-                font-weight: bold;
-                background: transparent;
-            }
-            
-            QLabel#welcomeSubtitle {
-                color: #cccccc;
-                font-size: 16px;
-                font-weight: 400;
-                background: transparent;
-            }
-            
-            /* Warning Frame */
-            QFrame#warningFrame {
-                background-color: #fff3cd;
-                border: 2px solid #ffcc00;
-                border-radius: 15px;
-            }
-            
-            QLabel#warningIcon {
-                font-size: 30px;
-                background: transparent;
-            }
-            
-            QLabel#warningText {
-                color: #856404;
-                font-size: 16px;
-                font-weight: 600;
-                background: transparent;
-            }
-            
-            /* Stats Frame */
-            QFrame#statsFrame {
-                background-color: #3a3a3a;
-                border-radius: 15px;
-                border: 2px solid #4a4a4a;
-            }
-            
-            /* Section Titles */
-            QLabel#sectionTitle {
-                color: #ffffff;
-                font-size: 24px;
-                font-weight: bold;
-                background: transparent;
-                padding: 0px 0px 10px 0px;
-                border-bottom: 3px solid #e63946;
-            }
-            
-            /* Stat Cards - Expanded to fill grid */
-            QFrame#statCard {
-                background-color: #4a4a4a;
-                border: 2px solid #5a5a5a;
-                border-radius: 12px;
-            }
-            
-            QFrame#statCard:hover {
-                border-color: #e63946;
-                background-color: #525252;
-            }
-            
-            QLabel#statIcon {
-                font-size: 32px;
-                background: transparent;
-            }
-            
-            QLabel#statValue {
-                background: transparent;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            
-            QLabel#statLabel {
-                color: #cccccc;
-                font-size: 15px;
-                font-weight: 500;
-                background: transparent;
-            }
-        """
-        self.setStyleSheet(style_sheet)
+        apply_theme(self, 'dashboard')
 
     def setup_animations(self):
         """Setup animations for interactive elements"""
@@ -635,55 +385,52 @@ class DashboardWindow(QWidget):
     # Navigation methods
     def open_clients(self):
         from views.clients_view import ClientsView
-        widget = ClientsView(self.translator)
-        self.add_back_button(widget)
-        self.main_window.show_module(widget)
+        self.open_module('clients', ClientsView)
 
     def open_attendance(self):
         from views.attendance_view import AttendanceView
-        widget = AttendanceView(self.translator)
-        self.add_back_button(widget)
-        self.main_window.show_module(widget)
+        self.open_module('attendance', AttendanceView)
 
     def open_finance(self):
         from views.finance_view import FinanceView
-        widget = FinanceView(self.translator)
-        self.add_back_button(widget)
-        self.main_window.show_module(widget)
+        self.open_module('finance', FinanceView)
 
     def open_sessions(self):
         from views.sessions_view import SessionsView
-        widget = SessionsView(self.translator)
-        self.add_back_button(widget)
-        self.main_window.show_module(widget)
+        self.open_module('sessions', SessionsView)
 
     def open_invitations(self):
         from views.invitations_view import InvitationsView
-        widget = InvitationsView(self.translator)
-        self.add_back_button(widget)
-        self.main_window.show_module(widget)
+        self.open_module('invitations', InvitationsView)
 
     def open_loans(self):
         from views.loans_view import LoansView
-        widget = LoansView(self.translator)
-        self.add_back_button(widget)
-        self.main_window.show_module(widget)
+        self.open_module('loans', LoansView)
 
     def open_reports(self):
         from views.reports_view import ReportsView
-        widget = ReportsView(self.translator)
-        self.add_back_button(widget)
-        self.main_window.show_module(widget)
+        self.open_module('reports', ReportsView)
 
     def open_user_management(self):
         from views.user_management_view import UserManagementView
-        widget = UserManagementView(self.translator)
-        self.add_back_button(widget)
-        self.main_window.show_module(widget)
+        self.open_module('user_management', UserManagementView)
+
+    def open_diagnostics(self):
+        from views.diagnostics_view import DiagnosticsView
+        self.open_module('diagnostics', DiagnosticsView)
+
+    def open_module(self, name, view_class):
+        """Show a module view; MainWindow builds it once and reuses it afterwards"""
+        def create():
+            widget = view_class(self.translator)
+            self.add_back_button(widget)
+            return widget
+        self.main_window.show_module(name, create)
 
     def add_back_button(self, widget):
         from PyQt5.QtWidgets import QPushButton, QVBoxLayout
-        back_btn = QPushButton(self.tr('← Back to Dashboard'))
+        back_btn = QPushButton()
+        self.bindings.bind(back_btn.setText, '← Back to Dashboard')
         back_btn.setObjectName("backButton")
         back_btn.setFixedHeight(50)
         back_btn.setStyleSheet("""
@@ -724,36 +471,15 @@ class DashboardWindow(QWidget):
         return text
 
     def retranslate_ui(self):
-        self.setWindowTitle(self.tr('Gym Management Dashboard'))
+        """Switch texts and layout direction in place; nothing is rebuilt or re-queried"""
         if self.translator.get_language() == 'ar':
             self.setLayoutDirection(Qt.RightToLeft)
         else:
             self.setLayoutDirection(Qt.LeftToRight)
-        # Update sidebar header
-        sidebar_header = self.sidebar.findChild(QFrame, 'sidebarHeader')
-        if sidebar_header:
-            for widget in sidebar_header.findChildren(QLabel):
-                if widget.objectName() == 'sidebarTitle':
-                    widget.setText(self.tr('GYM\nMANAGEMENT'))
-                elif widget.objectName() == 'sidebarUserInfo':
-                    widget.setText(self.tr(f'{self.user[1]}\n{self.user[2].upper()}'))
-        # Update sidebar navigation
-        nav_frame = self.sidebar.findChild(QFrame, 'sidebarNav')
-        if nav_frame:
-            nav_title = nav_frame.findChild(QLabel, 'sidebarNavTitle')
-            if nav_title:
-                nav_title.setText(self.tr('QUICK ACTIONS'))
-            for btn in nav_frame.findChildren(QPushButton, 'sidebarButton'):
-                text = btn.text()
-                # Only update the text part, keep the icon
-                if '  ' in text:
-                    icon, label = text.split('  ', 1)
-                    btn.setText(f"{icon}  {self.tr(label)}")
-        # Rebuild main content area to update all dynamic content
-        self.reload_data()
+        self.bindings.retranslate()
 
     def reload_data(self):
-        # Remove and recreate the main content area to refresh all translated/dynamic content
+        # Remove and recreate the main content area to refresh the stats
         main_layout = self.layout()
         if self.main_content:
             main_layout.removeWidget(self.main_content)
@@ -768,7 +494,7 @@ if __name__ == '__main__':
             pass
     
     class MockMainWindow:
-        def show_module(self, widget):
+        def show_module(self, name, factory):
             pass
         def back_to_dashboard(self):
             pass
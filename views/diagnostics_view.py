@@ -0,0 +1,266 @@
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QTableWidget,
+                             QTableWidgetItem, QFrame, QHeaderView, QCheckBox, QSpinBox, QAbstractItemView)
+from PyQt5.QtCore import Qt, QTimer
+from controllers import instrumentation
+from i18n.translator import TranslatableBindings
+from models import db_manager, query_log
+from views.theme import apply_theme
+
+QUERY_COLUMNS = ('Statement', 'Calls', 'Total ms', 'Avg ms', 'Max ms', 'Rows', 'Called From')
+SLOW_COLUMNS = ('Time', 'ms', 'Rows', 'Called From', 'Statement')
+TIMING_COLUMNS = ('Operation', 'Calls', 'Errors', 'p50 ms', 'p95 ms', 'p99 ms', 'Max ms', 'Total ms')
+REFRESH_INTERVAL_MS = 2000
+
+
+class DiagnosticsView(QWidget):
+    """Admin screen: which statements take the most database time, recent slow queries,
+    controller call latencies, and the state of the connection pools and cached views.
+
+    The numbers refresh every few seconds while the screen is shown.
+    """
+
+    def __init__(self, translator):
+        super().__init__()
+        self.translator = translator
+        self.bindings = TranslatableBindings(translator)
+        self.init_ui()
+        self.apply_styles()
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(REFRESH_INTERVAL_MS)
+        self.refresh_timer.timeout.connect(self.load_stats)
+        self.load_stats()
+
+    def init_ui(self):
+        main_layout = QVBoxLayout()
+        main_layout.setContentsMargins(0, 0, 0, 0)
+        main_layout.setSpacing(0)
+        main_layout.addWidget(self.create_header_section())
+        main_layout.addWidget(self.create_controls_section())
+        main_layout.addWidget(self.create_table_section(), 1)
+        self.setLayout(main_layout)
+
+    def create_header_section(self):
+        header_frame = QFrame()
+        header_frame.setObjectName("headerFrame")
+        header_frame.setFixedHeight(120)
+        header_layout = QVBoxLayout()
+        header_layout.setContentsMargins(40, 30, 40, 30)
+        header_layout.setSpacing(10)
+
+        title_label = QLabel()
+        title_label.setObjectName("pageTitle")
+        self.bindings.bind(title_label.setText, 'Diagnostics', '🩺 {}')
+        subtitle_label = QLabel()
+        subtitle_label.setObjectName("pageSubtitle")
+        self.bindings.bind(subtitle_label.setText, 'Database queries, connection pools and cached views')
+
+        header_layout.addWidget(title_label)
+        header_layout.addWidget(subtitle_label)
+        header_layout.addStretch()
+        header_frame.setLayout(header_layout)
+        return header_frame
+
+    def create_controls_section(self):
+        controls_frame = QFrame()
+        controls_frame.setObjectName("controlsFrame")
+        controls_layout = QVBoxLayout()
+        controls_layout.setContentsMargins(40, 15, 40, 15)
+        controls_layout.setSpacing(10)
+
+        self.record_check = QCheckBox()
+        self.record_check.setObjectName("recordCheck")
+        self.bindings.bind(self.record_check.setText, 'Record queries')
+        self.record_check.setChecked(query_log.QUERY_LOG_SETTINGS['enabled'])
+        self.record_check.toggled.connect(self.set_recording)
+
+        self.slow_check = QCheckBox()
+        self.slow_check.setObjectName("recordCheck")
+        self.bindings.bind(self.slow_check.setText, 'Log queries slower than (ms)')
+        self.slow_input = QSpinBox()
+        self.slow_input.setObjectName("slowInput")
+        self.slow_input.setRange(1, 60000)
+        self.slow_input.setFixedHeight(40)
+        slow_ms = query_log.QUERY_LOG_SETTINGS['slow_ms']
+        self.slow_check.setChecked(slow_ms is not None)
+        self.slow_input.setValue(int(slow_ms) if slow_ms is not None else 200)
+        self.slow_check.toggled.connect(self.set_slow_threshold)
+        self.slow_input.valueChanged.connect(self.set_slow_threshold)
+
+        self.timing_check = QCheckBox()
+        self.timing_check.setObjectName("recordCheck")
+        self.bindings.bind(self.timing_check.setText, 'Time controller calls')
+        self.timing_check.setChecked(instrumentation.METRICS_SETTINGS['enabled'])
+        self.timing_check.toggled.connect(self.set_timing)
+
+        self.summary_label = QLabel()
+        self.summary_label.setObjectName("summaryLabel")
+
+        self.reset_btn = QPushButton()
+        self.reset_btn.setObjectName("resetButton")
+        self.reset_btn.setFixedHeight(40)
+        self.bindings.bind(self.reset_btn.setText, 'Reset', '✖ {}')
+        self.reset_btn.clicked.connect(self.reset_stats)
+        self.refresh_btn = QPushButton()
+        self.refresh_btn.setObjectName("refreshButton")
+        self.refresh_btn.setFixedHeight(40)
+        self.bindings.bind(self.refresh_btn.setText, '🔄 Refresh')
+        self.refresh_btn.clicked.connect(self.load_stats)
+
+        toggles_layout = QHBoxLayout()
+        toggles_layout.setSpacing(20)
+        toggles_layout.addWidget(self.record_check)
+        toggles_layout.addWidget(self.slow_check)
+        toggles_layout.addWidget(self.slow_input)
+        toggles_layout.addWidget(self.timing_check)
+        toggles_layout.addStretch()
+        actions_layout = QHBoxLayout()
+        actions_layout.setSpacing(20)
+        actions_layout.addWidget(self.summary_label, 1)
+        actions_layout.addWidget(self.reset_btn)
+        actions_layout.addWidget(self.refresh_btn)
+        controls_layout.addLayout(toggles_layout)
+        controls_layout.addLayout(actions_layout)
+        controls_frame.setLayout(controls_layout)
+        return controls_frame
+
+    def create_table_section(self):
+        table_frame = QFrame()
+        table_frame.setObjectName("tableFrame")
+        table_layout = QVBoxLayout()
+        table_layout.setContentsMargins(40, 20, 40, 20)
+        table_layout.setSpacing(15)
+
+        queries_title = QLabel()
+        queries_title.setObjectName("sectionTitle")
+        self.bindings.bind(queries_title.setText, 'Top Queries by Total Time')
+        self.queries_table = self.create_table(len(QUERY_COLUMNS))
+
+        slow_title = QLabel()
+        slow_title.setObjectName("sectionTitle")
+        self.bindings.bind(slow_title.setText, 'Recent Slow Queries')
+        self.slow_table = self.create_table(len(SLOW_COLUMNS))
+
+        timings_title = QLabel()
+        timings_title.setObjectName("sectionTitle")
+        self.bindings.bind(timings_title.setText, 'Controller Latency')
+        self.timings_table = self.create_table(len(TIMING_COLUMNS))
+
+        self.resources_label = QLabel()
+        self.resources_label.setObjectName("resourcesLabel")
+        self.resources_label.setWordWrap(True)
+
+        table_layout.addWidget(queries_title)
+        table_layout.addWidget(self.queries_table, 3)
+        table_layout.addWidget(slow_title)
+        table_layout.addWidget(self.slow_table, 2)
+        table_layout.addWidget(timings_title)
+        table_layout.addWidget(self.timings_table, 3)
+        table_layout.addWidget(self.resources_label)
+        table_frame.setLayout(table_layout)
+        self.set_headers()
+        return table_frame
+
+    def create_table(self, columns):
+        table = QTableWidget(0, columns)
+        table.setObjectName("diagnosticsTable")
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        table.setAlternatingRowColors(True)
+        table.verticalHeader().setVisible(False)
+        header = table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        return table
+
+    def set_headers(self):
+        self.queries_table.setHorizontalHeaderLabels([self.tr(text) for text in QUERY_COLUMNS])
+        self.queries_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.slow_table.setHorizontalHeaderLabels([self.tr(text) for text in SLOW_COLUMNS])
+        self.slow_table.horizontalHeader().setSectionResizeMode(len(SLOW_COLUMNS) - 1, QHeaderView.Stretch)
+        self.timings_table.setHorizontalHeaderLabels([self.tr(text) for text in TIMING_COLUMNS])
+        self.timings_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+
+    def fill_table(self, table, rows, numeric):
+        table.setRowCount(len(rows))
+        for row, values in enumerate(rows):
+            for col, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                item.setToolTip(value)
+                if col in numeric:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                table.setItem(row, col, item)
+
+    def load_stats(self):
+        stats = query_log.stats
+        self.fill_table(self.queries_table, [
+            (entry['sql'], f"{entry['calls']:,}", f"{entry['total_ms']:,.1f}", f"{entry['avg_ms']:.2f}",
+             f"{entry['max_ms']:.1f}", f"{entry['rows']:,}",
+             ', '.join(f'{caller} ({calls})' for caller, calls in entry['callers']))
+            for entry in stats.top(50)], numeric=(1, 2, 3, 4, 5))
+        self.fill_table(self.slow_table, [
+            (entry['at'], f"{entry['ms']:.1f}", f"{entry['rows']:,}", entry['caller'], entry['sql'])
+            for entry in stats.recent_slow()], numeric=(1, 2))
+        self.fill_table(self.timings_table, [
+            (name, f"{entry['count']:,}", f"{entry['errors']:,}", f"{entry['p50_ms']:.2f}", f"{entry['p95_ms']:.2f}",
+             f"{entry['p99_ms']:.2f}", f"{entry['max_ms']:.1f}", f"{entry['total_ms']:,.1f}")
+            for name, entry in instrumentation.metrics.summaries()], numeric=range(1, len(TIMING_COLUMNS)))
+
+        summary = stats.summary()
+        self.summary_label.setText(
+            f"{summary['calls']:,} {self.tr('queries')} · {summary['total_ms'] / 1000:,.2f} s · "
+            f"{summary['statements']} {self.tr('statements')}")
+
+        pools = [f"{self.tr('Connections')}: {pool['open']} {self.tr('open')}, {pool['idle']} {self.tr('idle')}, "
+                 f"{self.tr('max')} {pool['max_size']} ({pool['profile']})"
+                 for pool in db_manager.pool_stats().values()]
+        registry = getattr(self.window(), 'module_views', None)
+        if registry is not None:
+            view_stats = registry.stats()
+            pools.append(f"{self.tr('Cached views')}: {', '.join(view_stats['cached'])} · "
+                         f"{self.tr('created')} {view_stats['created']}, {self.tr('evicted')} "
+                         f"{view_stats['evicted']} · {view_stats['live_widgets']:,} {self.tr('widgets')}")
+        self.resources_label.setText('\n'.join(pools))
+
+    def set_recording(self, enabled):
+        query_log.configure_query_log(enabled=enabled)
+
+    def set_slow_threshold(self, *_):
+        slow_ms = self.slow_input.value() if self.slow_check.isChecked() else None
+        query_log.configure_query_log(slow_ms=slow_ms)
+
+    def set_timing(self, enabled):
+        instrumentation.configure_metrics(enabled=enabled)
+        if enabled:
+            instrumentation.start_snapshots()
+        else:
+            instrumentation.stop_snapshots()
+
+    def reset_stats(self):
+        query_log.stats.reset()
+        instrumentation.metrics.reset()
+        self.load_stats()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh_timer.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.refresh_timer.stop()
+
+    def apply_styles(self):
+        apply_theme(self, 'diagnostics')
+
+    def tr(self, text):
+        return self.translator.translate(text)
+
+    def retranslate_ui(self):
+        if self.translator.get_language() == 'ar':
+            self.setLayoutDirection(Qt.RightToLeft)
+        else:
+            self.setLayoutDirection(Qt.LeftToRight)
+        self.bindings.retranslate()
+        self.set_headers()
+        self.load_stats()
+
+    def reload_data(self):
+        self.load_stats()
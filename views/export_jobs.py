@@ -0,0 +1,238 @@
+import os
+import threading
+import weakref
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+from PyQt5.QtWidgets import QFrame, QHBoxLayout, QLabel, QProgressBar, QPushButton, QVBoxLayout
+
+# Exports get their own pool, so a long export never holds up the views' queries
+MAX_CONCURRENT_EXPORTS = 3
+_pool = None
+_queues = weakref.WeakSet()
+
+
+def export_pool():
+    global _pool
+    if _pool is None:
+        _pool = QThreadPool()
+        _pool.setMaxThreadCount(MAX_CONCURRENT_EXPORTS)
+    return _pool
+
+
+class ExportCancelled(Exception):
+    pass
+
+
+class _ExportSignals(QObject):
+    started = pyqtSignal(int)
+    progress = pyqtSignal(int, int, int)
+    finished = pyqtSignal(int, object)
+    failed = pyqtSignal(int, object)
+
+
+class _ExportTask(QRunnable):
+    def __init__(self, job_id, fn, args, kwargs, cancel_event):
+        super().__init__()
+        self.job_id = job_id
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.cancel_event = cancel_event
+        self.signals = _ExportSignals()
+
+    def report_progress(self, done, total=None):
+        """Passed to the export as progress(); raising here is how a cancel reaches it."""
+        if self.cancel_event.is_set() or not self._emit('progress', self.job_id, done, -1 if total is None else total):
+            raise ExportCancelled()
+
+    def _emit(self, name, *args):
+        """Emit one of the task's signals; False if they were already deleted, e.g. at exit."""
+        try:
+            getattr(self.signals, name).emit(*args)
+        except RuntimeError:
+            self.cancel_event.set()
+            return False
+        return True
+
+    def run(self):
+        try:
+            if self.cancel_event.is_set() or not self._emit('started', self.job_id):
+                raise ExportCancelled()
+            result = self.fn(*self.args, progress=self.report_progress, **self.kwargs)
+        except Exception as e:
+            self._emit('failed', self.job_id, e)
+            return
+        self._emit('finished', self.job_id, result)
+
+
+class ExportJobQueue(QObject):
+    """Runs export functions on worker threads, several at a time.
+
+    submit() queues fn(*args, progress=..., **kwargs). The export calls
+    progress(done, total) as it writes; a cancelled job's next progress call
+    raises ExportCancelled, so it stops at the next batch and cleans up.
+    Jobs still waiting in the queue when cancelled never start.
+    """
+
+    jobAdded = pyqtSignal(int, str)
+    jobStarted = pyqtSignal(int)
+    jobProgress = pyqtSignal(int, int, int)  # job_id, done, total (-1 if unknown)
+    jobFinished = pyqtSignal(int, object)
+    jobFailed = pyqtSignal(int, object)
+    jobCancelled = pyqtSignal(int)
+
+    def __init__(self, parent=None, pool=None):
+        super().__init__(parent)
+        self.pool = pool or export_pool()
+        self._next_id = 0
+        self._jobs = {}  # job_id -> (cancel_event, on_result, on_error)
+        # A queue deleted with its view cancels its jobs, so none keeps writing for nobody
+        jobs = self._jobs
+        self.destroyed.connect(lambda *_: [job[0].set() for job in list(jobs.values())])
+        _queues.add(self)
+
+    def submit(self, label, fn, *args, on_result=None, on_error=None, **kwargs):
+        self._next_id += 1
+        job_id = self._next_id
+        cancel_event = threading.Event()
+        self._jobs[job_id] = (cancel_event, on_result, on_error)
+
+        task = _ExportTask(job_id, fn, args, kwargs, cancel_event)
+        task.signals.started.connect(self.jobStarted)
+        task.signals.progress.connect(self.jobProgress)
+        task.signals.finished.connect(self._on_finished)
+        task.signals.failed.connect(self._on_failed)
+        self.jobAdded.emit(job_id, label)
+        self.pool.start(task)
+        return job_id
+
+    def cancel(self, job_id):
+        job = self._jobs.get(job_id)
+        if job is not None:
+            job[0].set()
+
+    def cancel_all(self):
+        for job_id in list(self._jobs):
+            self.cancel(job_id)
+
+    def is_busy(self):
+        return bool(self._jobs)
+
+    def wait(self, msecs=-1):
+        return self.pool.waitForDone(msecs)
+
+    @pyqtSlot(int, object)
+    def _on_finished(self, job_id, result):
+        _, on_result, _ = self._jobs.pop(job_id)
+        self.jobFinished.emit(job_id, result)
+        if on_result:
+            on_result(result)
+
+    @pyqtSlot(int, object)
+    def _on_failed(self, job_id, error):
+        _, _, on_error = self._jobs.pop(job_id)
+        if isinstance(error, ExportCancelled):
+            self.jobCancelled.emit(job_id)
+        else:
+            self.jobFailed.emit(job_id, error)
+            if on_error:
+                on_error(error)
+
+
+def shutdown_exports():
+    """Cancel every export and wait for the workers to stop; call before the database is closed.
+
+    Cancelled exports stop at their next progress() call and delete their
+    partial files before the wait returns.
+    """
+    queues = list(_queues)
+    for queue in queues:
+        queue.cancel_all()
+    for queue in queues:
+        queue.wait()
+
+
+def remove_partial(path):
+    """Delete what a cancelled or failed export left behind."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class ExportProgressPanel(QFrame):
+    """One row per running export: its label, a progress bar and a cancel button.
+
+    Hidden while the queue is idle.
+    """
+
+    def __init__(self, queue, translator, parent=None):
+        super().__init__(parent)
+        self.setObjectName('exportPanel')
+        self.queue = queue
+        self.translator = translator
+        self._rows = {}  # job_id -> (frame, label, bar, label text)
+        self.layout = QVBoxLayout()
+        self.layout.setContentsMargins(30, 10, 30, 10)
+        self.layout.setSpacing(6)
+        self.setLayout(self.layout)
+        self.hide()
+        queue.jobAdded.connect(self.add_job)
+        queue.jobStarted.connect(self.start_job)
+        queue.jobProgress.connect(self.update_job)
+        queue.jobFinished.connect(self.remove_job)
+        queue.jobFailed.connect(self.remove_job)
+        queue.jobCancelled.connect(self.remove_job)
+
+    def tr(self, text):
+        return self.translator.translate(text)
+
+    def add_job(self, job_id, text):
+        frame = QFrame()
+        row = QHBoxLayout()
+        row.setContentsMargins(0, 0, 0, 0)
+        label = QLabel(f"⏳ {text} - {self.tr('Queued')}")
+        label.setObjectName('exportLabel')
+        bar = QProgressBar()
+        bar.setFixedHeight(18)
+        bar.setRange(0, 0)
+        cancel = QPushButton(self.tr('Cancel'))
+        cancel.setObjectName('cancelExportButton')
+        cancel.setFixedHeight(28)
+        cancel.clicked.connect(lambda: self.cancel_job(job_id))
+        row.addWidget(label)
+        row.addWidget(bar, 1)
+        row.addWidget(cancel)
+        frame.setLayout(row)
+        self.layout.addWidget(frame)
+        self._rows[job_id] = (frame, label, bar, text)
+        self.show()
+
+    def start_job(self, job_id):
+        if job_id in self._rows:
+            _, label, _, text = self._rows[job_id]
+            label.setText(f"⏳ {text}")
+
+    def update_job(self, job_id, done, total):
+        if job_id not in self._rows:
+            return
+        _, label, bar, text = self._rows[job_id]
+        if total > 0:
+            bar.setRange(0, total)
+            bar.setValue(min(done, total))
+            label.setText(f"⏳ {text} - {done:,} / {total:,}")
+        else:
+            label.setText(f"⏳ {text} - {done:,}")
+
+    def cancel_job(self, job_id):
+        if job_id in self._rows:
+            _, label, _, text = self._rows[job_id]
+            label.setText(f"⏹ {text} - {self.tr('Cancelling...')}")
+        self.queue.cancel(job_id)
+
+    def remove_job(self, job_id, *_):
+        row = self._rows.pop(job_id, None)
+        if row is not None:
+            row[0].deleteLater()
+        if not self._rows:
+            self.hide()
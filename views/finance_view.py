@@ -1,4 +1,4 @@
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit, 
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                              QLabel, QTableWidget, QTableWidgetItem, QTabWidget, QDateEdit, 
                              QInputDialog, QMessageBox, QSizePolicy, QFrame, QHeaderView, 
                              QGraphicsDropShadowEffect, QSpacerItem)
@@ -6,11 +6,9 @@ from PyQt5.QtCore import QDate, Qt
 from PyQt5.QtGui import QFont, QColor
 from controllers.finance_controller import FinanceController
 from models.client_model import ClientModel
-from models.finance_model import FinanceModel
 from models.db_manager import DBManager
-import pandas as pd
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
+from views.query_worker import QueryRunner
+from views.theme import apply_theme
 
 class FinanceView(QWidget):
     def __init__(self, translator):
@@ -18,6 +16,8 @@ class FinanceView(QWidget):
         self.translator = translator
         self.controller = FinanceController()
         self.client_model = ClientModel()
+        self.runner = QueryRunner(self)
+        self.runner.loadingChanged.connect(self.set_loading)
         self.init_ui()
         self.apply_styles()
         self.load_payments()
@@ -447,397 +447,12 @@ class FinanceView(QWidget):
         return actions_frame
 
     def apply_styles(self):
-        style_sheet = """
-            /* Main Widget Background - DARK like Dashboard */
-            QWidget {
-                background-color: #2c2c2c;
-                color: #ffffff;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            
-            /* Header Frame - DARK seamless */
-            QFrame#headerFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-bottom: 1px solid #404040;
-            }
-            
-            QLabel#pageTitle {
-                color: #ffffff;
-                font-size: 28px;
-                font-weight: bold;
-                background: transparent;
-            }
-            
-            QLabel#pageSubtitle {
-                color: #cccccc;
-                font-size: 16px;
-                font-weight: 400;
-                background: transparent;
-            }
-            
-            /* Warning Frame */
-            QFrame#warningFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-bottom: 1px solid #404040;
-                border-top: 3px solid #ffcc00;
-            }
-            
-            QLabel#warningIcon {
-                font-size: 30px;
-                background: transparent;
-            }
-            
-            QLabel#warningText {
-                color: #ffcc00;
-                font-size: 16px;
-                font-weight: 600;
-                background: transparent;
-            }
-            
-            /* Stats Frame - DARK seamless */
-            QFrame#statsFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-bottom: 1px solid #404040;
-            }
-            
-            QFrame#statCard {
-                background-color: #404040;
-                border: 2px solid #505050;
-                border-radius: 10px;
-            }
-            
-            QFrame#statCard:hover {
-                border-color: #e63946;
-                background-color: #4a4a4a;
-            }
-            
-            QLabel#statIcon {
-                font-size: 20px;
-                background: transparent;
-            }
-            
-            QLabel#statValue {
-                background: transparent;
-            }
-            
-            QLabel#statLabel {
-                color: #cccccc;
-                font-size: 13px;
-                font-weight: 500;
-                background: transparent;
-            }
-            
-            /* Tabs Frame - DARK seamless */
-            QFrame#tabsFrame {
-                background-color: #2c2c2c;
-                border: none;
-            }
-            
-            /* Tab Widget - DARK style */
-            QTabWidget#financeTabWidget {
-                background-color: #2c2c2c;
-                border: none;
-            }
-            
-            QTabWidget#financeTabWidget::pane {
-                background-color: #2c2c2c;
-                border: none;
-            }
-            
-            QTabWidget#financeTabWidget::tab-bar {
-                alignment: left;
-            }
-            
-            QTabBar::tab {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #404040, stop:1 #353535);
-                color: #cccccc;
-                padding: 15px 25px;
-                margin-right: 2px;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                min-width: 120px;
-            }
-            
-            QTabBar::tab:selected {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e63946, stop:1 #c1121f);
-                color: white;
-            }
-            
-            QTabBar::tab:hover:!selected {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4a4a4a, stop:1 #404040);
-                color: #ffffff;
-            }
-            
-            /* Tab Content - DARK seamless */
-            QWidget#paymentsTab, QWidget#expensesTab {
-                background-color: #2c2c2c;
-                border: none;
-            }
-            
-            /* Controls Frame - DARK seamless */
-            QFrame#controlsFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-bottom: 1px solid #404040;
-            }
-            
-            QLabel#controlLabel {
-                color: #ffffff;
-                font-size: 16px;
-                font-weight: 600;
-                background: transparent;
-            }
-            
-            QLabel#statsLabel {
-                color: #e63946;
-                font-size: 16px;
-                font-weight: bold;
-                background: transparent;
-            }
-            
-            /* Date Picker - DARK style */
-            QDateEdit#datePicker {
-                background-color: #404040;
-                border: 2px solid #505050;
-                border-radius: 8px;
-                color: #ffffff;
-                font-size: 14px;
-                font-weight: 500;
-                padding: 8px 12px;
-            }
-            
-            QDateEdit#datePicker:focus {
-                border-color: #e63946;
-                background-color: #4a4a4a;
-            }
-            
-            QDateEdit#datePicker::drop-down {
-                border: none;
-                background-color: #e63946;
-                border-radius: 4px;
-                width: 30px;
-            }
-            
-            QDateEdit#datePicker::down-arrow {
-                image: none;
-                border: none;
-                width: 0px;
-                height: 0px;
-            }
-            
-            /* Search Button */
-            QPushButton#searchButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e63946, stop:1 #c1121f);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 15px;
-            }
-            
-            QPushButton#searchButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff6b6b, stop:1 #e63946);
-            }
-            
-            QPushButton#searchButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #c1121f, stop:1 #a00e1c);
-            }
-            
-            /* Table Frame - DARK seamless */
-            QFrame#tableFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-bottom: 1px solid #404040;
-            }
-            
-            /* Section Titles */
-            QLabel#sectionTitle {
-                color: #ffffff;
-                font-size: 20px;
-                font-weight: bold;
-                background: transparent;
-                padding: 0px 0px 10px 0px;
-                border-bottom: 3px solid #e63946;
-            }
-            
-            /* Tables - DARK style */
-            QTableWidget#paymentsTable, QTableWidget#expensesTable {
-                background-color: #404040;
-                alternate-background-color: #4a4a4a;
-                border: none;
-                gridline-color: #505050;
-                selection-background-color: #e63946;
-                selection-color: white;
-                font-size: 14px;
-            }
-            
-            QTableWidget#paymentsTable::item, QTableWidget#expensesTable::item {
-                padding: 12px 8px;
-                border-bottom: 1px solid #505050;
-            }
-            
-            QTableWidget#paymentsTable::item:selected, QTableWidget#expensesTable::item:selected {
-                background-color: #e63946;
-                color: white;
-            }
-            
-            QHeaderView::section {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e63946, stop:1 #c1121f);
-                color: white;
-                padding: 15px 8px;
-                border: none;
-                border-right: 1px solid #a00e1c;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            
-            QHeaderView::section:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff6b6b, stop:1 #e63946);
-            }
-            
-            /* Scrollbars - DARK */
-            QScrollBar:vertical {
-                background-color: #404040;
-                width: 12px;
-                border-radius: 6px;
-                margin: 0px;
-            }
-            
-            QScrollBar::handle:vertical {
-                background-color: #e63946;
-                border-radius: 6px;
-                min-height: 30px;
-            }
-            
-            QScrollBar::handle:vertical:hover {
-                background-color: #ff6b6b;
-            }
-            
-            /* Actions Frame - DARK seamless */
-            QFrame#actionsFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-top: 2px solid #e63946;
-            }
-            
-            QLabel#actionsTitle {
-                color: #e63946;
-                font-size: 18px;
-                font-weight: bold;
-                background: transparent;
-            }
-            
-            /* Add Buttons */
-            QPushButton#addButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #38b000, stop:1 #2d8f00);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 15px;
-            }
-            
-            QPushButton#addButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4ade80, stop:1 #38b000);
-            }
-            
-            QPushButton#addButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #2d8f00, stop:1 #1f6b00);
-            }
-            
-            /* Message Boxes - DARK */
-            QMessageBox {
-                background-color: #2c2c2c;
-                color: #ffffff;
-            }
-            
-            QMessageBox QPushButton {
-                background-color: #e63946;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 20px;
-                font-weight: 600;
-                min-width: 80px;
-            }
-            
-            QMessageBox QPushButton:hover {
-                background-color: #ff6b6b;
-            }
-            
-            /* Input Dialogs - DARK */
-            QInputDialog {
-                background-color: #2c2c2c;
-                color: #ffffff;
-            }
-            
-            QInputDialog QLineEdit {
-                background-color: #404040;
-                border: 2px solid #505050;
-                border-radius: 6px;
-                color: #ffffff;
-                padding: 8px;
-                font-size: 14px;
-            }
-            
-            QInputDialog QLineEdit:focus {
-                border-color: #e63946;
-                background-color: #4a4a4a;
-            }
-            
-            QInputDialog QLabel {
-                color: #ffffff;
-                font-size: 14px;
-            }
-        """
-        self.setStyleSheet(style_sheet)
+        apply_theme(self, 'finance')
 
     def get_financial_stats(self):
         """Get financial statistics"""
         try:
-            db = DBManager()
-            
-            # Today's revenue
-            today_revenue = db.fetchone("SELECT SUM(amount) FROM finances WHERE category='payment' AND DATE(created_at)=DATE('now')")
-            today_revenue = today_revenue[0] if today_revenue and today_revenue[0] else 0
-            
-            # Monthly revenue
-            monthly_revenue = db.fetchone("SELECT SUM(amount) FROM finances WHERE category='payment' AND strftime('%Y-%m', created_at) = strftime('%Y-%m', 'now')")
-            monthly_revenue = monthly_revenue[0] if monthly_revenue and monthly_revenue[0] else 0
-            
-            # Today's expenses
-            today_expenses = db.fetchone("SELECT SUM(amount) FROM finances WHERE category='expense' AND DATE(created_at)=DATE('now')")
-            today_expenses = today_expenses[0] if today_expenses and today_expenses[0] else 0
-            
-            # Net profit (monthly revenue - monthly expenses)
-            monthly_expenses = db.fetchone("SELECT SUM(amount) FROM finances WHERE category='expense' AND strftime('%Y-%m', created_at) = strftime('%Y-%m', 'now')")
-            monthly_expenses = monthly_expenses[0] if monthly_expenses and monthly_expenses[0] else 0
-            net_profit = monthly_revenue - monthly_expenses
-            
-            return {
-                'today_revenue': today_revenue,
-                'monthly_revenue': monthly_revenue,
-                'today_expenses': today_expenses,
-                'net_profit': net_profit
-            }
+            return self.controller.get_financial_stats()
         except:
             return {
                 'today_revenue': 0,
@@ -848,8 +463,11 @@ class FinanceView(QWidget):
 
     def load_payments(self):
         date = self.payments_date.date().toString('yyyy-MM-dd')
-        records = self.controller.get_payments_by_date(date)
-        
+        self.runner.submit('payments', self.controller.get_payments_by_date, date,
+                           on_result=self.populate_payments,
+                           on_error=lambda e: self.show_error_message(self.tr('Error loading payments.')))
+
+    def populate_payments(self, records):
         self.payments_table.setRowCount(0)
         total_amount = 0
         
@@ -880,8 +498,11 @@ class FinanceView(QWidget):
 
     def load_expenses(self):
         date = self.expenses_date.date().toString('yyyy-MM-dd')
-        records = self.controller.get_expenses_by_date(date)
-        
+        self.runner.submit('expenses', self.controller.get_expenses_by_date, date,
+                           on_result=lambda records: self.populate_expenses(records, date),
+                           on_error=lambda e: self.show_error_message(self.tr('Error loading expenses.')))
+
+    def populate_expenses(self, records, date):
         self.expenses_table.setRowCount(0)
         total_amount = 0
         
@@ -966,6 +587,16 @@ class FinanceView(QWidget):
         except Exception as e:
             self.show_error_message(str(e))
 
+    def set_loading(self, key, loading):
+        """Show that payments or expenses are being queried in the background"""
+        table = self.payments_table if key == 'payments' else self.expenses_table
+        label = self.payments_stats_label if key == 'payments' else self.expenses_stats_label
+        if loading:
+            table.setCursor(Qt.BusyCursor)
+            label.setText(self.tr('⏳ Loading...'))
+        else:
+            table.unsetCursor()
+
     def show_success_message(self, message):
         msg_box = QMessageBox(self)
         msg_box.setIcon(QMessageBox.Information)
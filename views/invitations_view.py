@@ -6,14 +6,27 @@ from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QColor, QFont, QPalette
 from controllers.invitation_controller import InvitationController
 from models.client_model import ClientModel
-from datetime import datetime, timedelta
+from datetime import datetime
+from views.theme import apply_theme
+from views.export_jobs import ExportJobQueue, ExportProgressPanel, remove_partial
+from views.query_worker import QueryRunner
 
 class InvitationsView(QWidget):
+    # tagged filter per status_combo index: All Status, Tagged, Not Tagged
+    TAGGED_FILTERS = [None, True, False]
+    PAGE_SIZE = 200
+
     def __init__(self, translator):
         super().__init__()
         self.translator = translator
         self.controller = InvitationController()
+        self.exports = ExportJobQueue(self)
+        self.runner = QueryRunner(self)
+        self.runner.loadingChanged.connect(self.set_loading)
         self.client_model = ClientModel()
+        self.invitation_filters = {}
+        self.loaded_count = 0
+        self.total_count = 0
         self.init_ui()
         self.apply_styles()
         self.load_invitations()
@@ -46,6 +59,10 @@ class InvitationsView(QWidget):
         actions_section = self.create_actions_section()
         main_layout.addWidget(actions_section)
 
+        # Running exports, shown only while there are any
+        self.export_panel = ExportProgressPanel(self.exports, self.translator)
+        main_layout.addWidget(self.export_panel)
+
         self.setLayout(main_layout)
 
     def create_header_section(self):
@@ -248,6 +265,8 @@ class InvitationsView(QWidget):
         
         # Connect double-click to edit
         self.table.doubleClicked.connect(self.open_edit_dialog)
+        # Fetch the next page when scrolled to the bottom
+        self.table.verticalScrollBar().valueChanged.connect(self.on_table_scrolled)
         
         table_layout.addWidget(table_title)
         table_layout.addWidget(self.table)
@@ -314,394 +333,14 @@ class InvitationsView(QWidget):
         return actions_frame
 
     def apply_styles(self):
-        style_sheet = """
-            /* Main Widget Background - DARK like Dashboard */
-            QWidget {
-                background-color: #2c2c2c;
-                color: #ffffff;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            
-            /* Header Frame - DARK seamless */
-            QFrame#headerFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-bottom: 1px solid #404040;
-            }
-            
-            QLabel#pageTitle {
-                color: #ffffff;
-                font-size: 28px;
-                font-weight: bold;
-                background: transparent;
-            }
-            
-            QLabel#pageSubtitle {
-                color: #cccccc;
-                font-size: 16px;
-                font-weight: 400;
-                background: transparent;
-            }
-            
-            /* Search Frame - DARK seamless */
-            QFrame#searchFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-bottom: 1px solid #404040;
-            }
-            
-            QLabel#searchIcon {
-                font-size: 18px;
-                background: transparent;
-                color: #e63946;
-            }
-            
-            QLineEdit#searchInput {
-                background-color: #404040;
-                border: 2px solid #505050;
-                border-radius: 8px;
-                padding: 12px 15px;
-                font-size: 14px;
-                color: #ffffff;
-            }
-            
-            QLineEdit#searchInput:focus {
-                border-color: #e63946;
-                background-color: #4a4a4a;
-            }
-            
-            QLineEdit#searchInput::placeholder {
-                color: #999999;
-            }
-            
-            QComboBox#filterCombo {
-                background-color: #404040;
-                border: 2px solid #505050;
-                border-radius: 8px;
-                padding: 12px 15px;
-                font-size: 14px;
-                color: #ffffff;
-            }
-            
-            QComboBox#filterCombo:hover {
-                border-color: #e63946;
-                background-color: #4a4a4a;
-            }
-            
-            QComboBox#filterCombo::drop-down {
-                border: none;
-                padding-right: 10px;
-            }
-            
-            QComboBox#filterCombo::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 8px solid #ffffff;
-                margin-right: 5px;
-            }
-            
-            QComboBox#filterCombo QAbstractItemView {
-                background-color: #404040;
-                border: 2px solid #e63946;
-                border-radius: 8px;
-                selection-background-color: #e63946;
-                color: #ffffff;
-            }
-            
-            /* Search and Clear Buttons */
-            QPushButton#searchButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e63946, stop:1 #c1121f);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 20px;
-            }
-            
-            QPushButton#searchButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff6b6b, stop:1 #e63946);
-            }
-            
-            QPushButton#clearButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #6c757d, stop:1 #495057);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 20px;
-            }
-            
-            QPushButton#clearButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #5a6268, stop:1 #343a40);
-            }
-            
-            /* Stats Frame - DARK seamless */
-            QFrame#statsFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-bottom: 1px solid #404040;
-            }
-            
-            QFrame#statCard {
-                background-color: #404040;
-                border: 2px solid #505050;
-                border-radius: 10px;
-            }
-            
-            QFrame#statCard:hover {
-                border-color: #e63946;
-                background-color: #4a4a4a;
-            }
-            
-            QLabel#statIcon {
-                font-size: 20px;
-                background: transparent;
-            }
-            
-            QLabel#statValue {
-                background: transparent;
-            }
-            
-            QLabel#statLabel {
-                color: #cccccc;
-                font-size: 13px;
-                font-weight: 500;
-                background: transparent;
-            }
-            
-            /* Table Frame - DARK seamless */
-            QFrame#tableFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-bottom: 1px solid #404040;
-            }
-            
-            /* Section Titles */
-            QLabel#sectionTitle {
-                color: #ffffff;
-                font-size: 20px;
-                font-weight: bold;
-                background: transparent;
-                padding: 0px 0px 10px 0px;
-                border-bottom: 3px solid #e63946;
-            }
-            
-            /* Table Styling - DARK */
-            QTableWidget#invitationsTable {
-                background-color: #404040;
-                alternate-background-color: #4a4a4a;
-                border: none;
-                gridline-color: #505050;
-                font-size: 13px;
-                selection-background-color: #e63946;
-                selection-color: white;
-            }
-            
-            QTableWidget#invitationsTable::item {
-                padding: 12px 8px;
-                border-bottom: 1px solid #505050;
-            }
-            
-            QTableWidget#invitationsTable::item:selected {
-                background-color: #e63946;
-                color: white;
-            }
-            
-            QTableWidget#invitationsTable::item:hover {
-                background-color: #4a4a4a;
-            }
-            
-            QHeaderView::section {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e63946, stop:1 #c1121f);
-                color: white;
-                padding: 12px 8px;
-                border: none;
-                border-right: 1px solid #a00e1c;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            
-            QHeaderView::section:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff6b6b, stop:1 #e63946);
-            }
-            
-            /* Scrollbars - DARK */
-            QScrollBar:vertical {
-                background-color: #404040;
-                width: 12px;
-                border-radius: 6px;
-                margin: 0px;
-            }
-            
-            QScrollBar::handle:vertical {
-                background-color: #e63946;
-                border-radius: 6px;
-                min-height: 30px;
-            }
-            
-            QScrollBar::handle:vertical:hover {
-                background-color: #ff6b6b;
-            }
-            
-            /* Actions Frame - DARK seamless */
-            QFrame#actionsFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-top: 2px solid #e63946;
-            }
-            
-            QLabel#actionsTitle {
-                color: #e63946;
-                font-size: 18px;
-                font-weight: bold;
-                background: transparent;
-            }
-            
-            /* Action Buttons */
-            QPushButton#addButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #38b000, stop:1 #2d8000);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 15px;
-            }
-            
-            QPushButton#addButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4ade80, stop:1 #38b000);
-            }
-            
-            QPushButton#editButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e63946, stop:1 #c1121f);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 15px;
-            }
-            
-            QPushButton#editButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff6b6b, stop:1 #e63946);
-            }
-            
-            QPushButton#deleteButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #dc3545, stop:1 #a71e2a);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 15px;
-            }
-            
-            QPushButton#deleteButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e74c3c, stop:1 #dc3545);
-            }
-            
-            QPushButton#exportButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #17a2b8, stop:1 #0f7b8a);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 15px;
-            }
-            
-            QPushButton#exportButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #28a9c4, stop:1 #17a2b8);
-            }
-            
-            /* Message Boxes - DARK */
-            QMessageBox {
-                background-color: #2c2c2c;
-                color: #ffffff;
-            }
-            
-            QMessageBox QPushButton {
-                background-color: #e63946;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 20px;
-                font-weight: 600;
-                min-width: 80px;
-            }
-            
-            QMessageBox QPushButton:hover {
-                background-color: #ff6b6b;
-            }
-            
-            /* Input Dialogs - DARK */
-            QInputDialog {
-                background-color: #2c2c2c;
-                color: #ffffff;
-            }
-            
-            QInputDialog QLineEdit {
-                background-color: #404040;
-                border: 2px solid #505050;
-                border-radius: 8px;
-                padding: 8px 12px;
-                font-size: 14px;
-                color: #ffffff;
-            }
-            
-            QInputDialog QLineEdit:focus {
-                border-color: #e63946;
-                background-color: #4a4a4a;
-            }
-        """
-        self.setStyleSheet(style_sheet)
+        apply_theme(self, 'invitations')
 
     def get_invitation_stats(self):
         """Get invitation statistics"""
         try:
-            invitations = self.controller.get_all()
-            total = len(invitations)
-            tagged = 0
-            pending = 0
-            this_month = 0
-            
-            current_month = datetime.now().strftime('%Y-%m')
-            
-            for invitation in invitations:
-                # invitation: id, client_id, friend_name, friend_phone, invited_at, tagged
-                if invitation[5]:  # tagged
-                    tagged += 1
-                else:
-                    pending += 1
-                
-                # Check if invitation is from this month
-                if invitation[4] and invitation[4].startswith(current_month):
-                    this_month += 1
-            
-            return {
-                'total': total,
-                'tagged': tagged,
-                'pending': pending,
-                'this_month': this_month
-            }
-        except:
+            stats = self.controller.get_stats()
+            return {key: stats[key] for key in ('total', 'tagged', 'pending', 'this_month')}
+        except Exception:
             return {'total': 0, 'tagged': 0, 'pending': 0, 'this_month': 0}
 
     def on_search_text_changed(self):
@@ -730,72 +369,73 @@ class InvitationsView(QWidget):
         self.load_invitations()
 
     def load_invitations(self):
-        """Load invitations with filters applied"""
-        client_filter = self.client_input.text().strip()
-        friend_filter = self.friend_input.text().strip()
-        status_filter = self.status_combo.currentText()
-        
-        invitations = self.controller.get_all()
-        filtered = []
-        
-        for inv in invitations:
-            # inv: id, client_id, friend_name, friend_phone, invited_at, tagged
-            show = True
-            
-            if client_filter:
-                client_name = self.get_client_name_by_id(inv[1])
-                client_code = self.get_client_code_by_id(inv[1])
-                if (client_filter.lower() not in (client_name or '').lower() and 
-                    client_filter.lower() not in (client_code or '').lower()):
-                    show = False
-            
-            if friend_filter:
-                if (friend_filter.lower() not in (inv[2] or '').lower() and 
-                    friend_filter.lower() not in (inv[3] or '').lower()):
-                    show = False
-            
-            if status_filter != self.tr('All Status'):
-                if status_filter == self.tr('Tagged') and not inv[5]:
-                    show = False
-                elif status_filter == self.tr('Not Tagged') and inv[5]:
-                    show = False
-            
-            if show:
-                filtered.append(inv)
-        
-        self.populate_table(filtered)
+        """Load the first page of invitations with filters applied"""
+        index = self.status_combo.currentIndex()
+        self.invitation_filters = {
+            'client_text': self.client_input.text().strip(),
+            'friend_text': self.friend_input.text().strip(),
+            'tagged': self.TAGGED_FILTERS[index] if 0 <= index < len(self.TAGGED_FILTERS) else None,
+        }
+        # Supersedes a load still in flight, e.g. from the previous keystroke
+        self.runner.submit('invitations', self._load_first_page, self.invitation_filters,
+                           on_result=self._on_first_page,
+                           on_error=lambda e: QMessageBox.critical(
+                               self, self.tr('Error'), self.tr(f'❌ Error loading invitations: {str(e)}')))
+
+    def _load_first_page(self, filters):
+        # Runs on a worker thread
+        total = self.controller.count(**filters)
+        invitations = self.controller.search(limit=self.PAGE_SIZE, offset=0, **filters)
+        return total, invitations
+
+    def _on_first_page(self, result):
+        self.total_count, invitations = result
+        self.table.setRowCount(0)
+        self.loaded_count = len(invitations)
+        self.populate_table(invitations)
+
+    def load_more_invitations(self):
+        """Append the next page of invitations to the table"""
+        # The loaded rows belong to the previous filter until the first page lands
+        if self.runner.is_loading('invitations') or self.loaded_count >= self.total_count:
+            return
+        # Follow-up pages are small index walks and stay on the GUI thread
+        # inv: id, client_id, client_code, client_name, friend_name, friend_phone,
+        #      invited_at, tagged
+        invitations = self.controller.search(limit=self.PAGE_SIZE, offset=self.loaded_count,
+                                             **self.invitation_filters)
+        if not invitations:
+            # Invitations were deleted since the count was taken
+            self.total_count = self.loaded_count
+            return
+        self.loaded_count += len(invitations)
+        self.populate_table(invitations)
+
+    def on_table_scrolled(self, value):
+        if value >= self.table.verticalScrollBar().maximum():
+            self.load_more_invitations()
 
     def populate_table(self, invitations):
-        """Populate table with invitation data"""
-        self.table.setRowCount(0)
-        
+        """Append invitation rows to the table"""
+        self.table.setUpdatesEnabled(False)
         for inv in invitations:
             row = self.table.rowCount()
             self.table.insertRow(row)
             
-            # Get client info
-            client_code = self.get_client_code_by_id(inv[1])
-            client_name = self.get_client_name_by_id(inv[1])
-            
-            # Format date
-            invited_date = inv[4] if inv[4] else 'Unknown'
-            if invited_date != 'Unknown':
-                try:
-                    # Try to format the date nicely
-                    date_obj = datetime.strptime(invited_date, '%Y-%m-%d %H:%M:%S')
-                    invited_date = date_obj.strftime('%Y-%m-%d')
-                except:
-                    pass
+            # Timestamps are stored as 'YYYY-MM-DD HH:MM:SS'; show the date
+            invited_date = inv[6][:10] if inv[6] else 'Unknown'
             
             # Add data to table
             items = [
-                QTableWidgetItem(str(client_code or '')),
-                QTableWidgetItem(str(client_name or '')),
-                QTableWidgetItem(str(inv[2] or '')),  # friend_name
-                QTableWidgetItem(str(inv[3] or '')),  # friend_phone
+                QTableWidgetItem(str(inv[2])),  # client_code
+                QTableWidgetItem(str(inv[3])),  # client_name
+                QTableWidgetItem(str(inv[4] or '')),  # friend_name
+                QTableWidgetItem(str(inv[5] or '')),  # friend_phone
                 QTableWidgetItem(str(invited_date)),  # invited_at
-                QTableWidgetItem(self.tr('✅ Tagged') if inv[5] else self.tr('⏳ Pending'))  # tagged
+                QTableWidgetItem(self.tr('✅ Tagged') if inv[7] else self.tr('⏳ Pending'))  # tagged
             ]
+            # Keep the invitation id with the row for tag/delete
+            items[0].setData(Qt.UserRole, inv[0])
             
             for col, item in enumerate(items):
                 item.setFlags(item.flags() & ~Qt.ItemIsEditable)  # Make read-only
@@ -804,6 +444,7 @@ class InvitationsView(QWidget):
             
             # Set row height
             self.table.setRowHeight(row, 50)
+        self.table.setUpdatesEnabled(True)
 
     def open_add_invitation(self):
         """Open dialog to add new invitation"""
@@ -880,8 +521,12 @@ class InvitationsView(QWidget):
         )
         
         if reply == QMessageBox.Yes:
-            QMessageBox.information(self, self.tr('Info'), 
-                                  self.tr('ℹ️ Tag marking feature needs to be implemented in the controller.'))
+            try:
+                self.controller.tag_invitation(self.table.item(row, 0).data(Qt.UserRole))
+                self.load_invitations()
+            except Exception as e:
+                QMessageBox.critical(self, self.tr('Error'), 
+                                   self.tr(f'❌ Error: {str(e)}'))
 
     def handle_delete(self):
         """Handle invitation deletion"""
@@ -908,71 +553,60 @@ class InvitationsView(QWidget):
         )
         
         if reply == QMessageBox.Yes:
-            QMessageBox.information(self, self.tr('Info'), 
-                                  self.tr('ℹ️ Invitation deletion feature needs to be implemented in the controller.'))
+            try:
+                self.controller.delete_invitation(self.table.item(row, 0).data(Qt.UserRole))
+                self.load_invitations()
+            except Exception as e:
+                QMessageBox.critical(self, self.tr('Error'), 
+                                   self.tr(f'❌ Error: {str(e)}'))
 
     def export_data(self):
-        """Export invitation data"""
-        try:
-            import csv
-            from PyQt5.QtWidgets import QFileDialog
-            
-            filename, _ = QFileDialog.getSaveFileName(
-                self, 
-                self.tr('Export Invitations Data'),
-                f'invitations_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv',
-                'CSV files (*.csv)'
-            )
-            
-            if filename:
-                invitations = self.controller.get_all()
-                with open(filename, 'w', newline='', encoding='utf-8') as file:
-                    writer = csv.writer(file)
-                    # Write header
-                    writer.writerow(['Client Code', 'Client Name', 'Friend Name', 'Friend Phone', 'Invited Date', 'Status'])
-                    
-                    # Write data
-                    for invitation in invitations:
-                        client_code = self.get_client_code_by_id(invitation[1])
-                        client_name = self.get_client_name_by_id(invitation[1])
-                        invited_date = invitation[4] if invitation[4] else 'Unknown'
-                        status = 'Tagged' if invitation[5] else 'Pending'
-                        
-                        row = [
-                            client_code,
-                            client_name,
-                            invitation[2],  # friend_name
-                            invitation[3],  # friend_phone
-                            invited_date,
-                            status
-                        ]
-                        writer.writerow(row)
-                
-                QMessageBox.information(self, self.tr('Export Complete'), 
-                                      self.tr(f'✅ Data exported successfully to:\n{filename}'))
-        except Exception as e:
-            QMessageBox.critical(self, self.tr('Export Error'), 
-                               self.tr(f'❌ Error exporting data: {str(e)}'))
-
-    def get_client_name_by_id(self, client_id):
-        """Get client name by ID"""
-        try:
-            from models.db_manager import DBManager
-            db = DBManager()
-            row = db.fetchone('SELECT name FROM clients WHERE id=?', (client_id,))
-            return row[0] if row else 'Unknown'
-        except:
-            return 'Unknown'
+        """Export invitations data in the background"""
+        from PyQt5.QtWidgets import QFileDialog
 
-    def get_client_code_by_id(self, client_id):
-        """Get client code by ID"""
+        filename, _ = QFileDialog.getSaveFileName(
+            self, 
+            self.tr('Export Invitations Data'),
+            f'invitations_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv',
+            'CSV files (*.csv)'
+        )
+        if not filename:
+            return
+        self.exports.submit(
+            self.tr('Export Invitations Data'), self.write_export, filename,
+            on_result=lambda count: QMessageBox.information(
+                self, self.tr('Export Complete'), self.tr(f'✅ Data exported successfully to:\n{filename}')),
+            on_error=lambda e: QMessageBox.critical(
+                self, self.tr('Export Error'), self.tr(f'❌ Error exporting data: {str(e)}')))
+
+    def write_export(self, filename, progress=None):
+        """Write all invitations to a CSV file; runs on an export worker thread"""
+        import csv
+
+        count = 0
         try:
-            from models.db_manager import DBManager
-            db = DBManager()
-            row = db.fetchone('SELECT client_code FROM clients WHERE id=?', (client_id,))
-            return row[0] if row else 'Unknown'
-        except:
-            return 'Unknown'
+            with open(filename, 'w', newline='', encoding='utf-8') as file:
+                writer = csv.writer(file)
+                writer.writerow(['Client Code', 'Client Name', 'Friend Name', 'Friend Phone', 'Invited Date', 'Status'])
+                # Streamed in batches; export_rows reports progress and raises on cancel
+                for invitation in self.controller.export_rows(progress):
+                    writer.writerow([
+                        invitation[2],  # client_code
+                        invitation[3],  # client_name
+                        invitation[4],  # friend_name
+                        invitation[5],  # friend_phone
+                        invitation[6] if invitation[6] else 'Unknown',
+                        'Tagged' if invitation[7] else 'Pending'
+                    ])
+                    count += 1
+        except Exception:
+            remove_partial(filename)
+            raise
+        return count
+
+    def is_busy(self):
+        """True while an export is still running"""
+        return self.exports.is_busy()
 
     def get_client_id_by_code(self, code):
         """Get client ID by code"""
@@ -988,6 +622,13 @@ class InvitationsView(QWidget):
         """Translation method placeholder"""
         return self.translator.translate(text)
 
+    def set_loading(self, key, loading):
+        """Show a busy cursor over the table while invitations are being queried"""
+        if loading:
+            self.table.setCursor(Qt.BusyCursor)
+        else:
+            self.table.unsetCursor()
+
     def retranslate_ui(self):
         if self.translator.get_language() == 'ar':
             self.setLayoutDirection(Qt.RightToLeft)
@@ -1001,12 +642,16 @@ class InvitationsView(QWidget):
         # Search section
         self.client_input.setPlaceholderText(self.tr('Search by client code/name...'))
         self.friend_input.setPlaceholderText(self.tr('Search by friend name/phone...'))
+        current = self.status_combo.currentIndex()
+        self.status_combo.blockSignals(True)
         self.status_combo.clear()
         self.status_combo.addItems([
             self.tr('All Status'),
             self.tr('Tagged'),
             self.tr('Not Tagged')
         ])
+        self.status_combo.setCurrentIndex(max(current, 0))
+        self.status_combo.blockSignals(False)
         self.filter_btn.setText(self.tr('🔍 Filter'))
         self.clear_btn.setText(self.tr('✖ Clear'))
         for widget in self.findChildren(QLabel):
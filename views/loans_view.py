@@ -6,13 +6,22 @@ from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QColor, QFont, QPalette
 from controllers.loans_controller import LoansController
 from models.client_model import ClientModel
-from datetime import datetime, timedelta
+from datetime import datetime
+from views.theme import apply_theme
+from views.export_jobs import ExportJobQueue, ExportProgressPanel, remove_partial
+from views.query_worker import QueryRunner
 
 class LoansView(QWidget):
+    # Amount range per amount_combo index: All Amounts, < 100, 100 - 500, > 500
+    AMOUNT_RANGES = [None, 'under_100', '100_500', 'over_500']
+
     def __init__(self, translator):
         super().__init__()
         self.translator = translator
         self.controller = LoansController()
+        self.exports = ExportJobQueue(self)
+        self.runner = QueryRunner(self)
+        self.runner.loadingChanged.connect(self.set_loading)
         self.client_model = ClientModel()
         self.init_ui()
         self.apply_styles()
@@ -46,6 +55,10 @@ class LoansView(QWidget):
         actions_section = self.create_actions_section()
         main_layout.addWidget(actions_section)
 
+        # Running exports, shown only while there are any
+        self.export_panel = ExportProgressPanel(self.exports, self.translator)
+        main_layout.addWidget(self.export_panel)
+
         self.setLayout(main_layout)
 
     def create_header_section(self):
@@ -324,401 +337,12 @@ class LoansView(QWidget):
         return actions_frame
 
     def apply_styles(self):
-        style_sheet = """
-            /* Main Widget Background - DARK like Dashboard */
-            QWidget {
-                background-color: #2c2c2c;
-                color: #ffffff;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            
-            /* Header Frame - DARK seamless */
-            QFrame#headerFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-bottom: 1px solid #404040;
-            }
-            
-            QLabel#pageTitle {
-                color: #ffffff;
-                font-size: 28px;
-                font-weight: bold;
-                background: transparent;
-            }
-            
-            QLabel#pageSubtitle {
-                color: #cccccc;
-                font-size: 16px;
-                font-weight: 400;
-                background: transparent;
-            }
-            
-            /* Search Frame - DARK seamless */
-            QFrame#searchFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-bottom: 1px solid #404040;
-            }
-            
-            QLabel#searchIcon {
-                font-size: 18px;
-                background: transparent;
-                color: #e63946;
-            }
-            
-            QLineEdit#searchInput {
-                background-color: #404040;
-                border: 2px solid #505050;
-                border-radius: 8px;
-                padding: 12px 15px;
-                font-size: 14px;
-                color: #ffffff;
-            }
-            
-            QLineEdit#searchInput:focus {
-                border-color: #e63946;
-                background-color: #4a4a4a;
-            }
-            
-            QLineEdit#searchInput::placeholder {
-                color: #999999;
-            }
-            
-            QComboBox#filterCombo {
-                background-color: #404040;
-                border: 2px solid #505050;
-                border-radius: 8px;
-                padding: 12px 15px;
-                font-size: 14px;
-                color: #ffffff;
-            }
-            
-            QComboBox#filterCombo:hover {
-                border-color: #e63946;
-                background-color: #4a4a4a;
-            }
-            
-            QComboBox#filterCombo::drop-down {
-                border: none;
-                padding-right: 10px;
-            }
-            
-            QComboBox#filterCombo::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 8px solid #ffffff;
-                margin-right: 5px;
-            }
-            
-            QComboBox#filterCombo QAbstractItemView {
-                background-color: #404040;
-                border: 2px solid #e63946;
-                border-radius: 8px;
-                selection-background-color: #e63946;
-                color: #ffffff;
-            }
-            
-            /* Search and Clear Buttons */
-            QPushButton#searchButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e63946, stop:1 #c1121f);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 20px;
-            }
-            
-            QPushButton#searchButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff6b6b, stop:1 #e63946);
-            }
-            
-            QPushButton#clearButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #6c757d, stop:1 #495057);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 20px;
-            }
-            
-            QPushButton#clearButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #5a6268, stop:1 #343a40);
-            }
-            
-            /* Stats Frame - DARK seamless */
-            QFrame#statsFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-bottom: 1px solid #404040;
-            }
-            
-            QFrame#statCard {
-                background-color: #404040;
-                border: 2px solid #505050;
-                border-radius: 10px;
-            }
-            
-            QFrame#statCard:hover {
-                border-color: #e63946;
-                background-color: #4a4a4a;
-            }
-            
-            QLabel#statIcon {
-                font-size: 20px;
-                background: transparent;
-            }
-            
-            QLabel#statValue {
-                background: transparent;
-            }
-            
-            QLabel#statLabel {
-                color: #cccccc;
-                font-size: 13px;
-                font-weight: 500;
-                background: transparent;
-            }
-            
-            /* Table Frame - DARK seamless */
-            QFrame#tableFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-bottom: 1px solid #404040;
-            }
-            
-            /* Section Titles */
-            QLabel#sectionTitle {
-                color: #ffffff;
-                font-size: 20px;
-                font-weight: bold;
-                background: transparent;
-                padding: 0px 0px 10px 0px;
-                border-bottom: 3px solid #e63946;
-            }
-            
-            QLabel#balanceLabel {
-                color: #38b000;
-                font-size: 18px;
-                font-weight: bold;
-                background: transparent;
-                padding: 10px 20px;
-                border: 2px solid #38b000;
-                border-radius: 8px;
-            }
-            
-            /* Table Styling - DARK */
-            QTableWidget#loansTable {
-                background-color: #404040;
-                alternate-background-color: #4a4a4a;
-                border: none;
-                gridline-color: #505050;
-                font-size: 13px;
-                selection-background-color: #e63946;
-                selection-color: white;
-            }
-            
-            QTableWidget#loansTable::item {
-                padding: 12px 8px;
-                border-bottom: 1px solid #505050;
-            }
-            
-            QTableWidget#loansTable::item:selected {
-                background-color: #e63946;
-                color: white;
-            }
-            
-            QTableWidget#loansTable::item:hover {
-                background-color: #4a4a4a;
-            }
-            
-            QHeaderView::section {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e63946, stop:1 #c1121f);
-                color: white;
-                padding: 12px 8px;
-                border: none;
-                border-right: 1px solid #a00e1c;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            
-            QHeaderView::section:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff6b6b, stop:1 #e63946);
-            }
-            
-            /* Scrollbars - DARK */
-            QScrollBar:vertical {
-                background-color: #404040;
-                width: 12px;
-                border-radius: 6px;
-                margin: 0px;
-            }
-            
-            QScrollBar::handle:vertical {
-                background-color: #e63946;
-                border-radius: 6px;
-                min-height: 30px;
-            }
-            
-            QScrollBar::handle:vertical:hover {
-                background-color: #ff6b6b;
-            }
-            
-            /* Actions Frame - DARK seamless */
-            QFrame#actionsFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-top: 2px solid #e63946;
-            }
-            
-            QLabel#actionsTitle {
-                color: #e63946;
-                font-size: 18px;
-                font-weight: bold;
-                background: transparent;
-            }
-            
-            /* Action Buttons */
-            QPushButton#addButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #38b000, stop:1 #2d8000);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 15px;
-            }
-            
-            QPushButton#addButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4ade80, stop:1 #38b000);
-            }
-            
-            QPushButton#editButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e63946, stop:1 #c1121f);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 15px;
-            }
-            
-            QPushButton#editButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff6b6b, stop:1 #e63946);
-            }
-            
-            QPushButton#deleteButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #dc3545, stop:1 #a71e2a);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 15px;
-            }
-            
-            QPushButton#deleteButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e74c3c, stop:1 #dc3545);
-            }
-            
-            QPushButton#exportButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #17a2b8, stop:1 #0f7b8a);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 15px;
-            }
-            
-            QPushButton#exportButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #28a9c4, stop:1 #17a2b8);
-            }
-            
-            /* Message Boxes - DARK */
-            QMessageBox {
-                background-color: #2c2c2c;
-                color: #ffffff;
-            }
-            
-            QMessageBox QPushButton {
-                background-color: #e63946;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 20px;
-                font-weight: 600;
-                min-width: 80px;
-            }
-            
-            QMessageBox QPushButton:hover {
-                background-color: #ff6b6b;
-            }
-            
-            /* Input Dialogs - DARK */
-            QInputDialog {
-                background-color: #2c2c2c;
-                color: #ffffff;
-            }
-            
-            QInputDialog QLineEdit {
-                background-color: #404040;
-                border: 2px solid #505050;
-                border-radius: 8px;
-                padding: 8px 12px;
-                font-size: 14px;
-                color: #ffffff;
-            }
-            
-            QInputDialog QLineEdit:focus {
-                border-color: #e63946;
-                background-color: #4a4a4a;
-            }
-        """
-        self.setStyleSheet(style_sheet)
+        apply_theme(self, 'loans')
 
     def get_loan_stats(self):
         """Get loan statistics"""
         try:
-            loans = self.controller.get_all()
-            total = len(loans)
-            total_amount = 0
-            this_month = 0
-            
-            current_month = datetime.now().strftime('%Y-%m')
-            
-            for loan in loans:
-                # loan: id, client_id, amount, description, created_at
-                total_amount += float(loan[2])
-                
-                # Check if loan is from this month
-                if loan[4] and loan[4].startswith(current_month):
-                    this_month += 1
-            
-            average = total_amount / total if total > 0 else 0
-            
-            return {
-                'total': total,
-                'total_amount': total_amount,
-                'average': average,
-                'this_month': this_month
-            }
+            return self.controller.get_stats()
         except:
             return {'total': 0, 'total_amount': 0, 'average': 0, 'this_month': 0}
 
@@ -751,46 +375,23 @@ class LoansView(QWidget):
         """Load loans with filters applied"""
         client_filter = self.client_input.text().strip()
         amount_filter = self.amount_input.text().strip()
-        amount_range = self.amount_combo.currentText()
-        
-        loans = self.controller.get_all()
-        filtered = []
-        client_id = None
-        
-        for loan in loans:
-            # loan: id, client_id, amount, description, created_at
-            show = True
-            
-            if client_filter:
-                client_name = self.get_client_name_by_id(loan[1])
-                client_code = self.get_client_code_by_id(loan[1])
-                if (client_filter.lower() not in (client_name or '').lower() and 
-                    client_filter.lower() not in (client_code or '').lower()):
-                    show = False
-                else:
-                    client_id = loan[1]
-            
-            if amount_filter:
-                if amount_filter not in str(loan[2]):
-                    show = False
-            
-            if amount_range != self.tr('All Amounts'):
-                amount = float(loan[2])
-                if amount_range == self.tr('< 100') and amount >= 100:
-                    show = False
-                elif amount_range == self.tr('100 - 500') and (amount < 100 or amount > 500):
-                    show = False
-                elif amount_range == self.tr('> 500') and amount <= 500:
-                    show = False
-            
-            if show:
-                filtered.append(loan)
+        index = self.amount_combo.currentIndex()
+        amount_range = self.AMOUNT_RANGES[index] if 0 <= index < len(self.AMOUNT_RANGES) else None
         
-        self.populate_table(filtered)
+        # Supersedes a load still in flight, e.g. from the previous keystroke
+        self.runner.submit('loans', self.controller.search, client_filter, amount_filter, amount_range,
+                           on_result=lambda loans: self.show_loans(loans, client_filter),
+                           on_error=lambda e: QMessageBox.critical(
+                               self, self.tr('Error'), self.tr(f'❌ Error loading loans: {str(e)}')))
+
+    def show_loans(self, loans, client_filter):
+        # loan: id, client_id, client_code, client_name, amount, description, created_at,
+        #       running_balance, client_balance
+        self.populate_table(loans)
         
         # Show running balance if filtered by client
-        if client_id:
-            balance = self.controller.get_running_balance(client_id)
+        if client_filter and loans:
+            balance = loans[-1][8]
             self.balance_label.setText(self.tr(f'Running Balance: ${balance:.2f}'))
         else:
             self.balance_label.setText(self.tr('Running Balance: $0.00'))
@@ -798,17 +399,11 @@ class LoansView(QWidget):
     def populate_table(self, loans):
         """Populate table with loan data"""
         self.table.setRowCount(0)
+        self.table.setRowCount(len(loans))
         
-        for loan in loans:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            # Get client info
-            client_code = self.get_client_code_by_id(loan[1])
-            client_name = self.get_client_name_by_id(loan[1])
-            
+        for row, loan in enumerate(loans):
             # Format date
-            loan_date = loan[4] if loan[4] else 'Unknown'
+            loan_date = loan[6] if loan[6] else 'Unknown'
             if loan_date != 'Unknown':
                 try:
                     # Try to format the date nicely
@@ -818,7 +413,7 @@ class LoansView(QWidget):
                     pass
             
             # Determine status based on amount
-            amount = float(loan[2])
+            amount = float(loan[4])
             if amount > 0:
                 status = '💰 Active'
             else:
@@ -826,10 +421,10 @@ class LoansView(QWidget):
             
             # Add data to table
             items = [
-                QTableWidgetItem(str(client_code or '')),
-                QTableWidgetItem(str(client_name or '')),
-                QTableWidgetItem(f"${loan[2]:.2f}"),  # amount
-                QTableWidgetItem(str(loan[3] or '')),  # description
+                QTableWidgetItem(str(loan[2])),  # client code
+                QTableWidgetItem(str(loan[3])),  # client name
+                QTableWidgetItem(f"${loan[4]:.2f}"),  # amount
+                QTableWidgetItem(str(loan[5] or '')),  # description
                 QTableWidgetItem(str(loan_date)),  # created_at
                 QTableWidgetItem(status)  # status
             ]
@@ -838,9 +433,9 @@ class LoansView(QWidget):
                 item.setFlags(item.flags() & ~Qt.ItemIsEditable)  # Make read-only
                 item.setTextAlignment(Qt.AlignCenter)
                 self.table.setItem(row, col, item)
-            
-            # Set row height
-            self.table.setRowHeight(row, 50)
+        
+        # One default height instead of a setRowHeight call per row
+        self.table.verticalHeader().setDefaultSectionSize(50)
 
     def open_add_loan(self):
         """Open dialog to add new loan"""
@@ -948,68 +543,55 @@ class LoansView(QWidget):
                                   self.tr('ℹ️ Loan deletion feature needs to be implemented in the controller.'))
 
     def export_data(self):
-        """Export loan data"""
-        try:
-            import csv
-            from PyQt5.QtWidgets import QFileDialog
-            
-            filename, _ = QFileDialog.getSaveFileName(
-                self, 
-                self.tr('Export Loans Data'),
-                f'loans_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv',
-                'CSV files (*.csv)'
-            )
-            
-            if filename:
-                loans = self.controller.get_all()
-                with open(filename, 'w', newline='', encoding='utf-8') as file:
-                    writer = csv.writer(file)
-                    # Write header
-                    writer.writerow(['Client Code', 'Client Name', 'Amount', 'Description', 'Date', 'Status'])
-                    
-                    # Write data
-                    for loan in loans:
-                        client_code = self.get_client_code_by_id(loan[1])
-                        client_name = self.get_client_name_by_id(loan[1])
-                        loan_date = loan[4] if loan[4] else 'Unknown'
-                        amount = float(loan[2])
-                        status = 'Active' if amount > 0 else 'Paid'
-                        
-                        row = [
-                            client_code,
-                            client_name,
-                            f"${loan[2]:.2f}",
-                            loan[3],  # description
-                            loan_date,
-                            status
-                        ]
-                        writer.writerow(row)
-                
-                QMessageBox.information(self, self.tr('Export Complete'), 
-                                      self.tr(f'✅ Data exported successfully to:\n{filename}'))
-        except Exception as e:
-            QMessageBox.critical(self, self.tr('Export Error'), 
-                               self.tr(f'❌ Error exporting data: {str(e)}'))
+        """Export loans data in the background"""
+        from PyQt5.QtWidgets import QFileDialog
 
-    def get_client_name_by_id(self, client_id):
-        """Get client name by ID"""
-        try:
-            from models.db_manager import DBManager
-            db = DBManager()
-            row = db.fetchone('SELECT name FROM clients WHERE id=?', (client_id,))
-            return row[0] if row else 'Unknown'
-        except:
-            return 'Unknown'
-
-    def get_client_code_by_id(self, client_id):
-        """Get client code by ID"""
+        filename, _ = QFileDialog.getSaveFileName(
+            self, 
+            self.tr('Export Loans Data'),
+            f'loans_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv',
+            'CSV files (*.csv)'
+        )
+        if not filename:
+            return
+        self.exports.submit(
+            self.tr('Export Loans Data'), self.write_export, filename,
+            on_result=lambda count: QMessageBox.information(
+                self, self.tr('Export Complete'), self.tr(f'✅ Data exported successfully to:\n{filename}')),
+            on_error=lambda e: QMessageBox.critical(
+                self, self.tr('Export Error'), self.tr(f'❌ Error exporting data: {str(e)}')))
+
+    def write_export(self, filename, progress=None):
+        """Write all loans to a CSV file; runs on an export worker thread"""
+        import csv
+
+        count = 0
         try:
-            from models.db_manager import DBManager
-            db = DBManager()
-            row = db.fetchone('SELECT client_code FROM clients WHERE id=?', (client_id,))
-            return row[0] if row else 'Unknown'
-        except:
-            return 'Unknown'
+            with open(filename, 'w', newline='', encoding='utf-8') as file:
+                writer = csv.writer(file)
+                writer.writerow(['Client Code', 'Client Name', 'Amount', 'Description', 'Date', 'Status'])
+                # Streamed in batches; export_rows reports progress and raises on cancel
+                for loan in self.controller.export_rows(progress):
+                    loan_date = loan[6] if loan[6] else 'Unknown'
+                    amount = float(loan[4])
+                    status = 'Active' if amount > 0 else 'Paid'
+                    writer.writerow([
+                        loan[2],  # client code
+                        loan[3],  # client name
+                        f"${loan[4]:.2f}",
+                        loan[5],  # description
+                        loan_date,
+                        status
+                    ])
+                    count += 1
+        except Exception:
+            remove_partial(filename)
+            raise
+        return count
+
+    def is_busy(self):
+        """True while an export is still running"""
+        return self.exports.is_busy()
 
     def get_client_id_by_code(self, code):
         """Get client ID by code"""
@@ -1025,6 +607,14 @@ class LoansView(QWidget):
         """Translation method placeholder"""
         return self.translator.translate(text)
 
+    def set_loading(self, key, loading):
+        """Show that loans are being queried in the background"""
+        if loading:
+            self.table.setCursor(Qt.BusyCursor)
+            self.balance_label.setText(self.tr('⏳ Loading...'))
+        else:
+            self.table.unsetCursor()
+
     def retranslate_ui(self):
         if self.translator.get_language() == 'ar':
             self.setLayoutDirection(Qt.RightToLeft)
@@ -1038,6 +628,8 @@ class LoansView(QWidget):
         # Search section
         self.client_input.setPlaceholderText(self.tr('Search by client code/name...'))
         self.amount_input.setPlaceholderText(self.tr('Search by amount...'))
+        current = self.amount_combo.currentIndex()
+        self.amount_combo.blockSignals(True)
         self.amount_combo.clear()
         self.amount_combo.addItems([
             self.tr('All Amounts'),
@@ -1045,6 +637,8 @@ class LoansView(QWidget):
             self.tr('100 - 500'),
             self.tr('> 500')
         ])
+        self.amount_combo.setCurrentIndex(max(current, 0))
+        self.amount_combo.blockSignals(False)
         self.filter_btn.setText(self.tr('🔍 Filter'))
         self.clear_btn.setText(self.tr('✖ Clear'))
         for widget in self.findChildren(QLabel):
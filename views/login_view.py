@@ -5,6 +5,7 @@ from PyQt5.QtCore import Qt, QPropertyAnimation, QRect, QEasingCurve, pyqtSignal
 from PyQt5.QtGui import QFont, QPixmap, QPainter, QColor, QIcon, QPalette
 from controllers.auth_controller import AuthController
 import sys
+from views.theme import apply_theme
 
 class LoginWindow(QWidget):
     def __init__(self, translator):
@@ -169,186 +170,7 @@ class LoginWindow(QWidget):
         self.login_card.setGraphicsEffect(shadow_effect)
 
     def apply_styles(self):
-        style_sheet = """
-            /* Main Background - Dark like Dashboard */
-            QFrame#mainBackground {
-                background-color: #1a1a1a;
-            }
-            
-            /* Login Card */
-            QFrame#loginCard {
-                background-color: #2a2a2a;
-                border-radius: 30px;
-                border: 2px solid #3a3a3a;
-            }
-            
-            /* Header Section */
-            QFrame#headerSection {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e63946, stop:0.3 #dc2f3e, stop:0.7 #c1121f, stop:1 #a00e1c);
-                border-radius: 30px 30px 0px 0px;
-                border: none;
-            }
-            
-            /* Logo Icon */
-            QLabel#logoIcon {
-                font-size: 60px;
-                color: white;
-                font-weight: bold;
-                background: transparent;
-                text-shadow: 2px 2px 5px rgba(0,0,0,0.4);
-            }
-            
-            /* App Title */
-            QLabel#appTitle {
-                color: white;
-                font-size: 28px;
-                font-weight: bold;
-                letter-spacing: 4px;
-                background: transparent;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                text-shadow: 2px 2px 4px rgba(0,0,0,0.4);
-            }
-            
-            /* Welcome Text */
-            QLabel#welcomeText {
-                color: rgba(255, 255, 255, 0.95);
-                font-size: 17px;
-                font-weight: 500;
-                background: transparent;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                text-shadow: 1px 1px 3px rgba(0,0,0,0.3);
-            }
-            
-            /* Form Section */
-            QFrame#formSection {
-                background-color: #2a2a2a;
-                border-radius: 0px 0px 30px 30px;
-                border: none;
-            }
-            
-            /* Field Labels */
-            QLabel#fieldLabel {
-                color: #ffffff;
-                font-size: 17px;
-                font-weight: 600;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                background: transparent;
-                margin: 0px;
-                padding: 0px;
-            }
-            
-            /* Input Fields */
-            QLineEdit#inputField {
-                background-color: #3a3a3a;
-                border: 2px solid #4a4a4a;
-                border-radius: 15px;
-                padding: 0px 20px;
-                font-size: 16px;
-                color: #ffffff;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                selection-background-color: #e63946;
-            }
-            
-            QLineEdit#inputField:focus {
-                border-color: #e63946;
-                background-color: #424242;
-                outline: none;
-                box-shadow: 0 0 12px rgba(230, 57, 70, 0.2);
-            }
-            
-            QLineEdit#inputField:hover {
-                border-color: #ff6b6b;
-                background-color: #424242;
-            }
-            
-            QLineEdit#inputField::placeholder {
-                color: #999999;
-            }
-            
-            /* Role Combo Box */
-            QComboBox#roleCombo {
-                background-color: #3a3a3a;
-                border: 2px solid #4a4a4a;
-                border-radius: 15px;
-                padding: 0px 20px;
-                font-size: 16px;
-                color: #ffffff;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            
-            QComboBox#roleCombo:focus {
-                border-color: #e63946;
-                background-color: #424242;
-                box-shadow: 0 0 12px rgba(230, 57, 70, 0.2);
-            }
-            
-            QComboBox#roleCombo:hover {
-                border-color: #ff6b6b;
-                background-color: #424242;
-            }
-            
-            QComboBox#roleCombo::drop-down {
-                border: none;
-                width: 40px;
-                background: transparent;
-            }
-            
-            QComboBox#roleCombo::down-arrow {
-                image: none;
-                border-left: 8px solid transparent;
-                border-right: 8px solid transparent;
-                border-top: 8px solid #cccccc;
-                margin-right: 15px;
-            }
-            
-            QComboBox#roleCombo QAbstractItemView {
-                background-color: #3a3a3a;
-                border: 2px solid #e63946;
-                border-radius: 12px;
-                selection-background-color: #e63946;
-                selection-color: white;
-                color: #ffffff;
-                font-size: 16px;
-                padding: 10px;
-                outline: none;
-            }
-            
-            /* Login Button */
-            QPushButton#loginButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e63946, stop:0.3 #dc2f3e, stop:0.7 #c1121f, stop:1 #a00e1c);
-                color: white;
-                border: none;
-                border-radius: 18px;
-                font-size: 18px;
-                font-weight: bold;
-                letter-spacing: 3px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                text-shadow: 1px 1px 3px rgba(0,0,0,0.4);
-            }
-            
-            QPushButton#loginButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff6b6b, stop:0.3 #e63946, stop:0.7 #dc2f3e, stop:1 #c1121f);
-                transform: translateY(-2px);
-                box-shadow: 0 6px 20px rgba(230, 57, 70, 0.3);
-            }
-            
-            QPushButton#loginButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #c1121f, stop:0.3 #a00e1c, stop:0.7 #8b0000, stop:1 #660000);
-                transform: translateY(1px);
-            }
-            
-            QPushButton#loginButton:disabled {
-                background-color: #6c757d;
-                color: #f1f1f1;
-                transform: none;
-                box-shadow: none;
-            }
-        """
-        self.setStyleSheet(style_sheet)
+        apply_theme(self, 'login')
 
     def setup_animations(self):
         # Button animation setup
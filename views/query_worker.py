@@ -0,0 +1,108 @@
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+
+
+class _QuerySignals(QObject):
+    finished = pyqtSignal(int, object)
+    failed = pyqtSignal(int, object)
+
+
+class _QueryTask(QRunnable):
+    def __init__(self, request_id, fn, args, kwargs, is_current):
+        super().__init__()
+        self.request_id = request_id
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.is_current = is_current
+        # One signals object per task, so a runner deleted mid-query is simply disconnected
+        self.signals = _QuerySignals()
+
+    def run(self):
+        # Superseded while waiting in the queue: skip the query entirely
+        if not self.is_current(self.request_id):
+            return
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.failed.emit(self.request_id, e)
+            return
+        self.signals.finished.emit(self.request_id, result)
+
+
+class QueryRunner(QObject):
+    """Runs controller calls on a thread pool and hands results back on the GUI thread.
+
+    Every request is submitted under a key such as 'search'. A newer request
+    with the same key supersedes the older one: it is skipped if it has not
+    started yet, and its result is dropped if it has, so a late answer to an
+    old keystroke never overwrites a newer one. loadingChanged(key, loading)
+    lets views show that a key is busy.
+    """
+
+    loadingChanged = pyqtSignal(str, bool)
+
+    def __init__(self, parent=None, pool=None):
+        super().__init__(parent)
+        self.pool = pool or QThreadPool.globalInstance()
+        self._next_id = 0
+        self._current = {}    # key -> id of the newest request
+        self._callbacks = {}  # id -> (key, on_result, on_error)
+
+    def submit(self, key, fn, *args, on_result=None, on_error=None, **kwargs):
+        self._next_id += 1
+        request_id = self._next_id
+        previous = self._current.get(key)
+        if previous is not None:
+            self._callbacks.pop(previous, None)
+        self._current[key] = request_id
+        self._callbacks[request_id] = (key, on_result, on_error)
+
+        task = _QueryTask(request_id, fn, args, kwargs, self._is_current)
+        task.signals.finished.connect(self._on_finished)
+        task.signals.failed.connect(self._on_failed)
+        if previous is None:
+            self.loadingChanged.emit(key, True)
+        self.pool.start(task)
+        return request_id
+
+    def cancel(self, key):
+        request_id = self._current.pop(key, None)
+        if request_id is not None:
+            self._callbacks.pop(request_id, None)
+            self.loadingChanged.emit(key, False)
+
+    def cancel_all(self):
+        for key in list(self._current):
+            self.cancel(key)
+
+    def is_loading(self, key=None):
+        return key in self._current if key is not None else bool(self._current)
+
+    def wait(self, msecs=-1):
+        """Block until queued queries have run; results are still delivered through the event loop."""
+        return self.pool.waitForDone(msecs)
+
+    def _is_current(self, request_id):
+        # Called from worker threads; a single dict lookup is atomic under the GIL
+        return request_id in self._callbacks
+
+    def _finish(self, request_id):
+        callbacks = self._callbacks.pop(request_id, None)
+        if callbacks is None:
+            return None
+        key = callbacks[0]
+        del self._current[key]
+        self.loadingChanged.emit(key, False)
+        return callbacks
+
+    @pyqtSlot(int, object)
+    def _on_finished(self, request_id, result):
+        callbacks = self._finish(request_id)
+        if callbacks and callbacks[1]:
+            callbacks[1](result)
+
+    @pyqtSlot(int, object)
+    def _on_failed(self, request_id, error):
+        callbacks = self._finish(request_id)
+        if callbacks and callbacks[2]:
+            callbacks[2](error)
@@ -5,16 +5,21 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLi
 from PyQt5.QtCore import Qt, QTimer, QDate
 from PyQt5.QtGui import QColor, QFont, QPalette
 from controllers.reports_controller import ReportsController
-import pandas as pd
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
+from views.query_worker import QueryRunner
 from datetime import datetime, timedelta
+from views.theme import apply_theme
+from views.export_jobs import ExportJobQueue, ExportProgressPanel
 
 class ReportsView(QWidget):
     def __init__(self, translator):
         super().__init__()
         self.translator = translator
         self.controller = ReportsController()
+        self.runner = QueryRunner(self)
+        self.runner.loadingChanged.connect(self.set_loading)
+        self.exports = ExportJobQueue(self)
+        # Filled in from the report rows once load_all_reports() returns
+        self.report_stats = {'registered': 0, 'payments': 0, 'attendance': 0, 'total_reports': 5}
         self.init_ui()
         self.apply_styles()
         self.load_all_reports()
@@ -39,6 +44,10 @@ class ReportsView(QWidget):
         tabs_section = self.create_tabs_section()
         main_layout.addWidget(tabs_section)
 
+        # Running exports; several report tabs can export at once
+        self.export_panel = ExportProgressPanel(self.exports, self.translator)
+        main_layout.addWidget(self.export_panel)
+
         self.setLayout(main_layout)
 
     def create_header_section(self):
@@ -435,276 +444,63 @@ class ReportsView(QWidget):
         return tab
 
     def apply_styles(self):
-        style_sheet = """
-            /* Main Widget Background - DARK like Dashboard */
-            QWidget {
-                background-color: #2c2c2c;
-                color: #ffffff;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            
-            /* Header Frame - DARK seamless */
-            QFrame#headerFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-bottom: 1px solid #404040;
-            }
-            
-            QLabel#pageTitle {
-                color: #ffffff;
-                font-size: 28px;
-                font-weight: bold;
-                background: transparent;
-            }
-            
-            QLabel#pageSubtitle {
-                color: #cccccc;
-                font-size: 16px;
-                font-weight: 400;
-                background: transparent;
-            }
-            
-            /* Stats Frame - DARK seamless */
-            QFrame#statsFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-bottom: 1px solid #404040;
-            }
-            
-            QFrame#statCard {
-                background-color: #404040;
-                border: 2px solid #505050;
-                border-radius: 10px;
-            }
-            
-            QFrame#statCard:hover {
-                border-color: #e63946;
-                background-color: #4a4a4a;
-            }
-            
-            QLabel#statIcon {
-                font-size: 20px;
-                background: transparent;
-            }
-            
-            QLabel#statValue {
-                background: transparent;
-            }
-            
-            QLabel#statLabel {
-                color: #cccccc;
-                font-size: 13px;
-                font-weight: 500;
-                background: transparent;
-            }
-            
-            /* Tabs Frame - DARK seamless */
-            QFrame#tabsFrame {
-                background-color: #2c2c2c;
-                border: none;
-            }
-            
-            /* Section Titles */
-            QLabel#sectionTitle {
-                color: #ffffff;
-                font-size: 20px;
-                font-weight: bold;
-                background: transparent;
-                padding: 0px 0px 10px 0px;
-                border-bottom: 3px solid #e63946;
-            }
-            
-            /* Tab Widget Styling - DARK */
-            QTabWidget#reportTabs {
-                background-color: #2c2c2c;
-                border: none;
-            }
-            
-            QTabWidget#reportTabs::pane {
-                background-color: #404040;
-                border: 2px solid #505050;
-                border-radius: 8px;
-                margin-top: 5px;
-            }
-            
-            QTabWidget#reportTabs::tab-bar {
-                alignment: left;
-            }
-            
-            QTabBar::tab {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #505050, stop:1 #404040);
-                color: #cccccc;
-                padding: 12px 20px;
-                margin-right: 2px;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                min-width: 120px;
-            }
-            
-            QTabBar::tab:selected {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e63946, stop:1 #c1121f);
-                color: white;
-            }
-            
-            QTabBar::tab:hover:!selected {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #5a5a5a, stop:1 #4a4a4a);
-                color: #ffffff;
-            }
-            
-            /* Report Tab Content */
-            QWidget#reportTab {
-                background-color: #404040;
-                border-radius: 8px;
-            }
-            
-            /* Table Styling - DARK */
-            QTableWidget#reportTable {
-                background-color: #404040;
-                alternate-background-color: #4a4a4a;
-                border: none;
-                gridline-color: #505050;
-                font-size: 13px;
-                selection-background-color: #e63946;
-                selection-color: white;
-                border-radius: 8px;
-            }
-            
-            QTableWidget#reportTable::item {
-                padding: 12px 8px;
-                border-bottom: 1px solid #505050;
-            }
-            
-            QTableWidget#reportTable::item:selected {
-                background-color: #e63946;
-                color: white;
-            }
-            
-            QTableWidget#reportTable::item:hover {
-                background-color: #4a4a4a;
-            }
-            
-            QHeaderView::section {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e63946, stop:1 #c1121f);
-                color: white;
-                padding: 12px 8px;
-                border: none;
-                border-right: 1px solid #a00e1c;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            
-            QHeaderView::section:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff6b6b, stop:1 #e63946);
-            }
-            
-            /* Scrollbars - DARK */
-            QScrollBar:vertical {
-                background-color: #404040;
-                width: 12px;
-                border-radius: 6px;
-                margin: 0px;
-            }
-            
-            QScrollBar::handle:vertical {
-                background-color: #e63946;
-                border-radius: 6px;
-                min-height: 30px;
-            }
-            
-            QScrollBar::handle:vertical:hover {
-                background-color: #ff6b6b;
-            }
-            
-            /* Export Buttons */
-            QPushButton#addButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #38b000, stop:1 #2d8000);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 15px;
-            }
-            
-            QPushButton#addButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4ade80, stop:1 #38b000);
-            }
-            
-            QPushButton#exportButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #17a2b8, stop:1 #0f7b8a);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 15px;
-            }
-            
-            QPushButton#exportButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #28a9c4, stop:1 #17a2b8);
-            }
-            
-            /* Message Boxes - DARK */
-            QMessageBox {
-                background-color: #2c2c2c;
-                color: #ffffff;
-            }
-            
-            QMessageBox QPushButton {
-                background-color: #e63946;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 20px;
-                font-weight: 600;
-                min-width: 80px;
-            }
-            
-            QMessageBox QPushButton:hover {
-                background-color: #ff6b6b;
-            }
-        """
-        self.setStyleSheet(style_sheet)
+        apply_theme(self, 'reports')
 
     def get_report_stats(self):
-        """Get report statistics"""
-        try:
-            registered = len(self.controller.get_registered_today())
-            payments = len(self.controller.get_paid_today())
-            attendance = len(self.controller.get_attended_today())
-            total_reports = 5  # Number of report types
-            
-            return {
-                'registered': registered,
-                'payments': payments,
-                'attendance': attendance,
-                'total_reports': total_reports
-            }
-        except:
-            return {'registered': 0, 'payments': 0, 'attendance': 0, 'total_reports': 5}
+        """Report statistics, counted from the rows of the last load_all_reports()"""
+        return self.report_stats
+
+    def update_stat_cards(self):
+        stats = self.get_report_stats()
+        stat_labels = [self.tr('Registered Today'), self.tr('Payments Today'), self.tr('Attendance Today'), self.tr('Total Reports')]
+        stat_values = [stats['registered'], stats['payments'], stats['attendance'], stats['total_reports']]
+        for i, card in enumerate(self.findChildren(QFrame, 'statCard')):
+            for label in card.findChildren(QLabel):
+                if label.objectName() == 'statIcon':
+                    continue
+                if i < len(stat_labels):
+                    label.setText(f"{stat_labels[i]} ({stat_values[i]})")
 
     def load_all_reports(self):
-        """Load all report data"""
-        self.load_registered_today()
-        self.load_paid_today()
-        self.load_attended_today()
-        self.load_monthly_financials()
-        self.load_missing_payments()
+        """Load all report data in the background"""
+        self.runner.submit('reports', self.fetch_all_reports,
+                           on_result=self.populate_all_reports,
+                           on_error=lambda e: QMessageBox.critical(self, self.tr('Error'),
+                                                                   self.tr(f'❌ Error: {str(e)}')))
+
+    def fetch_all_reports(self):
+        """Query every report; runs on a worker thread"""
+        month = datetime.now().strftime('%Y-%m')
+        return {
+            'registered': self.controller.get_registered_today(),
+            'paid': self.controller.get_paid_today(),
+            'attended': self.controller.get_attended_today(),
+            'financials': self.controller.get_monthly_financials(month),
+            'missing': self.controller.get_missing_payments(),
+        }
+
+    def populate_all_reports(self, reports):
+        self.report_stats.update(registered=len(reports['registered']), payments=len(reports['paid']),
+                                 attendance=len(reports['attended']))
+        self.update_stat_cards()
+        self.populate_registered_today(reports['registered'])
+        self.populate_paid_today(reports['paid'])
+        self.populate_attended_today(reports['attended'])
+        self.populate_monthly_financials(reports['financials'])
+        self.populate_missing_payments(reports['missing'])
+
+    def set_loading(self, key, loading):
+        """Show a busy cursor over the report tabs while reports are queried"""
+        if loading:
+            self.tabs.setCursor(Qt.BusyCursor)
+        else:
+            self.tabs.unsetCursor()
 
     def load_registered_today(self):
         """Load registered today data"""
-        data = self.controller.get_registered_today()
+        self.populate_registered_today(self.controller.get_registered_today())
+
+    def populate_registered_today(self, data):
         self.reg_table.setRowCount(0)
         
         for row in data:
@@ -729,23 +525,19 @@ class ReportsView(QWidget):
 
     def load_paid_today(self):
         """Load paid today data"""
-        data = self.controller.get_paid_today()
+        self.populate_paid_today(self.controller.get_paid_today())
+
+    def populate_paid_today(self, data):
         self.paid_table.setRowCount(0)
         
         for row in data:
-            # id, client_id, category, amount, description, created_at, recorded_by
+            # id, client_id, category, amount, description, created_at, recorded_by, client_code, name
             row_idx = self.paid_table.rowCount()
             self.paid_table.insertRow(row_idx)
             
-            # Get client code/name
-            from models.db_manager import DBManager
-            db = DBManager()
-            client_code = db.fetchone('SELECT client_code FROM clients WHERE id=?', (row[1],))
-            client_name = db.fetchone('SELECT name FROM clients WHERE id=?', (row[1],))
-            
             items = [
-                QTableWidgetItem(str(client_code[0]) if client_code else ''),
-                QTableWidgetItem(str(client_name[0]) if client_name else ''),
+                QTableWidgetItem(str(row[-2]) if row[-2] is not None else ''),
+                QTableWidgetItem(str(row[-1]) if row[-1] is not None else ''),
                 QTableWidgetItem(f"${row[3]:.2f}"),  # amount
                 QTableWidgetItem(str(row[4]))        # description
             ]
@@ -759,22 +551,19 @@ class ReportsView(QWidget):
 
     def load_attended_today(self):
         """Load attended today data"""
-        data = self.controller.get_attended_today()
+        self.populate_attended_today(self.controller.get_attended_today())
+
+    def populate_attended_today(self, data):
         self.att_table.setRowCount(0)
         
         for row in data:
-            # id, client_id, checkin_time, ...
+            # id, client_id, checkin_time, ..., client_code, name
             row_idx = self.att_table.rowCount()
             self.att_table.insertRow(row_idx)
             
-            from models.db_manager import DBManager
-            db = DBManager()
-            client_code = db.fetchone('SELECT client_code FROM clients WHERE id=?', (row[1],))
-            client_name = db.fetchone('SELECT name FROM clients WHERE id=?', (row[1],))
-            
             items = [
-                QTableWidgetItem(str(client_code[0]) if client_code else ''),
-                QTableWidgetItem(str(client_name[0]) if client_name else ''),
+                QTableWidgetItem(str(row[-2]) if row[-2] is not None else ''),
+                QTableWidgetItem(str(row[-1]) if row[-1] is not None else ''),
                 QTableWidgetItem(str(row[2]))  # checkin_time
             ]
             
@@ -787,9 +576,10 @@ class ReportsView(QWidget):
 
     def load_monthly_financials(self):
         """Load monthly financials data"""
-        from datetime import datetime
         month = datetime.now().strftime('%Y-%m')
-        data = self.controller.get_monthly_financials(month)
+        self.populate_monthly_financials(self.controller.get_monthly_financials(month))
+
+    def populate_monthly_financials(self, data):
         self.fin_table.setRowCount(0)
         
         for row in data:
@@ -814,7 +604,9 @@ class ReportsView(QWidget):
 
     def load_missing_payments(self):
         """Load missing payments data"""
-        data = self.controller.get_missing_payments()
+        self.populate_missing_payments(self.controller.get_missing_payments())
+
+    def populate_missing_payments(self, data):
         self.miss_table.setRowCount(0)
         
         for row in data:
@@ -839,46 +631,49 @@ class ReportsView(QWidget):
 
     def export_reg_pdf(self):
         """Export registered today report as PDF"""
-        self._export_table_pdf(self.reg_table, 'Registered Today Report')
+        self._export_pdf('registered', self.reg_table, 'Registered Today Report')
 
     def export_reg_excel(self):
         """Export registered today report as Excel"""
-        self._export_table_excel(self.reg_table, 'registered_today')
+        self._export_excel('registered', self.reg_table, 'registered_today')
 
     def export_paid_pdf(self):
         """Export paid today report as PDF"""
-        self._export_table_pdf(self.paid_table, 'Paid Today Report')
+        self._export_pdf('paid', self.paid_table, 'Paid Today Report')
 
     def export_paid_excel(self):
         """Export paid today report as Excel"""
-        self._export_table_excel(self.paid_table, 'paid_today')
+        self._export_excel('paid', self.paid_table, 'paid_today')
 
     def export_att_pdf(self):
         """Export attended today report as PDF"""
-        self._export_table_pdf(self.att_table, 'Attended Today Report')
+        self._export_pdf('attended', self.att_table, 'Attended Today Report')
 
     def export_att_excel(self):
         """Export attended today report as Excel"""
-        self._export_table_excel(self.att_table, 'attended_today')
+        self._export_excel('attended', self.att_table, 'attended_today')
 
     def export_fin_pdf(self):
         """Export monthly financials report as PDF"""
-        self._export_table_pdf(self.fin_table, 'Monthly Financials Report')
+        self._export_pdf('financials', self.fin_table, 'Monthly Financials Report')
 
     def export_fin_excel(self):
         """Export monthly financials report as Excel"""
-        self._export_table_excel(self.fin_table, 'monthly_financials')
+        self._export_excel('financials', self.fin_table, 'monthly_financials')
 
     def export_miss_pdf(self):
         """Export missing payments report as PDF"""
-        self._export_table_pdf(self.miss_table, 'Missing Payments Report')
+        self._export_pdf('missing', self.miss_table, 'Missing Payments Report')
 
     def export_miss_excel(self):
         """Export missing payments report as Excel"""
-        self._export_table_excel(self.miss_table, 'missing_payments')
+        self._export_excel('missing', self.miss_table, 'missing_payments')
+
+    def table_headers(self, table):
+        return [table.horizontalHeaderItem(i).text() for i in range(table.columnCount())]
 
-    def _export_table_pdf(self, table, title):
-        """Export table data as PDF"""
+    def _export_pdf(self, report, table, title):
+        """Export a report as PDF in the background, streamed from the database"""
         path, _ = QFileDialog.getSaveFileName(
             self, 
             self.tr('Export PDF'), 
@@ -888,45 +683,16 @@ class ReportsView(QWidget):
         if not path:
             return
         
-        try:
-            c = canvas.Canvas(path, pagesize=letter)
-            width, height = letter
-            
-            # Title
-            c.setFont('Helvetica-Bold', 16)
-            c.drawString(30, height - 40, title)
-            c.drawString(30, height - 60, f'Generated on: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
-            
-            # Headers
-            c.setFont('Helvetica-Bold', 12)
-            y = height - 100
-            headers = [table.horizontalHeaderItem(i).text() for i in range(table.columnCount())]
-            header_text = ' | '.join(headers)
-            c.drawString(30, y, header_text)
-            
-            # Data
-            c.setFont('Helvetica', 10)
-            y -= 25
-            for row in range(table.rowCount()):
-                row_data = [table.item(row, col).text() if table.item(row, col) else '' 
-                           for col in range(table.columnCount())]
-                row_text = ' | '.join(row_data)
-                c.drawString(30, y, row_text)
-                y -= 20
-                
-                if y < 50:
-                    c.showPage()
-                    y = height - 50
-            
-            c.save()
-            QMessageBox.information(self, self.tr('Success'), 
-                                  self.tr('✅ PDF exported successfully!'))
-        except Exception as e:
-            QMessageBox.critical(self, self.tr('Error'), 
-                               self.tr(f'❌ Error exporting PDF: {str(e)}'))
+        self.exports.submit(
+            f'{title} (PDF)', self.controller.export_to_pdf, report, path,
+            headers=self.table_headers(table), title=title,
+            on_result=lambda count: QMessageBox.information(self, self.tr('Success'), 
+                                                            self.tr('✅ PDF exported successfully!')),
+            on_error=lambda e: QMessageBox.critical(self, self.tr('Error'), 
+                                                    self.tr(f'❌ Error exporting PDF: {str(e)}')))
 
-    def _export_table_excel(self, table, filename_prefix):
-        """Export table data as Excel"""
+    def _export_excel(self, report, table, filename_prefix):
+        """Export a report as Excel in the background, streamed from the database"""
         path, _ = QFileDialog.getSaveFileName(
             self, 
             self.tr('Export Excel'), 
@@ -936,23 +702,17 @@ class ReportsView(QWidget):
         if not path:
             return
         
-        try:
-            data = []
-            headers = [table.horizontalHeaderItem(i).text() for i in range(table.columnCount())]
-            
-            for row in range(table.rowCount()):
-                row_data = [table.item(row, col).text() if table.item(row, col) else '' 
-                           for col in range(table.columnCount())]
-                data.append(row_data)
-            
-            df = pd.DataFrame(data, columns=headers)
-            df.to_excel(path, index=False)
-            
-            QMessageBox.information(self, self.tr('Success'), 
-                                  self.tr('✅ Excel exported successfully!'))
-        except Exception as e:
-            QMessageBox.critical(self, self.tr('Error'), 
-                               self.tr(f'❌ Error exporting Excel: {str(e)}'))
+        self.exports.submit(
+            f'{filename_prefix}.xlsx', self.controller.export_to_excel, report, path,
+            headers=self.table_headers(table),
+            on_result=lambda count: QMessageBox.information(self, self.tr('Success'), 
+                                                            self.tr('✅ Excel exported successfully!')),
+            on_error=lambda e: QMessageBox.critical(self, self.tr('Error'), 
+                                                    self.tr(f'❌ Error exporting Excel: {str(e)}')))
+
+    def is_busy(self):
+        """True while an export is still running"""
+        return self.exports.is_busy()
 
     def tr(self, text):
         """Translation method placeholder"""
@@ -969,14 +729,7 @@ class ReportsView(QWidget):
         for widget in self.findChildren(QLabel, 'pageSubtitle'):
             widget.setText(self.tr('Generate comprehensive reports, track analytics, and export business insights'))
         # Stats section
-        stats = self.get_report_stats()
-        stat_labels = [self.tr('Registered Today'), self.tr('Payments Today'), self.tr('Attendance Today'), self.tr('Total Reports')]
-        for i, card in enumerate(self.findChildren(QFrame, 'statCard')):
-            for label in card.findChildren(QLabel):
-                if label.objectName() == 'statIcon':
-                    continue
-                if i < len(stat_labels):
-                    label.setText(f"{stat_labels[i]} ({stats[list(stats.keys())[i]] if i < 3 else stats['total_reports']})")
+        self.update_stat_cards()
         # Tabs section
         for widget in self.findChildren(QLabel, 'sectionTitle'):
             widget.setText(self.tr('📋 Report Categories'))
@@ -6,14 +6,27 @@ from PyQt5.QtCore import Qt, QTimer, QDate
 from PyQt5.QtGui import QColor, QFont, QPalette
 from controllers.session_controller import SessionController
 from models.client_model import ClientModel
-from datetime import datetime, timedelta
+from datetime import datetime
+from views.theme import apply_theme
+from views.export_jobs import ExportJobQueue, ExportProgressPanel, remove_partial
+from views.query_worker import QueryRunner
 
 class SessionsView(QWidget):
+    # is_group filter per type_combo index: All Types, Private, Group
+    SESSION_TYPES = [None, False, True]
+    PAGE_SIZE = 200
+
     def __init__(self, translator):
         super().__init__()
         self.translator = translator
         self.controller = SessionController()
+        self.exports = ExportJobQueue(self)
+        self.runner = QueryRunner(self)
+        self.runner.loadingChanged.connect(self.set_loading)
         self.client_model = ClientModel()
+        self.session_filters = {}
+        self.loaded_count = 0
+        self.total_count = 0
         self.init_ui()
         self.apply_styles()
         self.load_sessions()
@@ -46,6 +59,10 @@ class SessionsView(QWidget):
         actions_section = self.create_actions_section()
         main_layout.addWidget(actions_section)
 
+        # Running exports, shown only while there are any
+        self.export_panel = ExportProgressPanel(self.exports, self.translator)
+        main_layout.addWidget(self.export_panel)
+
         self.setLayout(main_layout)
 
     def create_header_section(self):
@@ -258,6 +275,8 @@ class SessionsView(QWidget):
         
         # Connect double-click to edit
         self.table.doubleClicked.connect(self.open_edit_dialog)
+        # Fetch the next page when scrolled to the bottom
+        self.table.verticalScrollBar().valueChanged.connect(self.on_table_scrolled)
         
         table_layout.addWidget(table_title)
         table_layout.addWidget(self.table)
@@ -324,434 +343,13 @@ class SessionsView(QWidget):
         return actions_frame
 
     def apply_styles(self):
-        style_sheet = """
-            /* Main Widget Background - DARK like Dashboard */
-            QWidget {
-                background-color: #2c2c2c;
-                color: #ffffff;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            
-            /* Header Frame - DARK seamless */
-            QFrame#headerFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-bottom: 1px solid #404040;
-            }
-            
-            QLabel#pageTitle {
-                color: #ffffff;
-                font-size: 28px;
-                font-weight: bold;
-                background: transparent;
-            }
-            
-            QLabel#pageSubtitle {
-                color: #cccccc;
-                font-size: 16px;
-                font-weight: 400;
-                background: transparent;
-            }
-            
-            /* Search Frame - DARK seamless */
-            QFrame#searchFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-bottom: 1px solid #404040;
-            }
-            
-            QLabel#searchIcon {
-                font-size: 18px;
-                background: transparent;
-                color: #e63946;
-            }
-            
-            QLineEdit#searchInput {
-                background-color: #404040;
-                border: 2px solid #505050;
-                border-radius: 8px;
-                padding: 12px 15px;
-                font-size: 14px;
-                color: #ffffff;
-            }
-            
-            QLineEdit#searchInput:focus {
-                border-color: #e63946;
-                background-color: #4a4a4a;
-            }
-            
-            QLineEdit#searchInput::placeholder {
-                color: #999999;
-            }
-            
-            QComboBox#filterCombo {
-                background-color: #404040;
-                border: 2px solid #505050;
-                border-radius: 8px;
-                padding: 12px 15px;
-                font-size: 14px;
-                color: #ffffff;
-            }
-            
-            QComboBox#filterCombo:hover {
-                border-color: #e63946;
-                background-color: #4a4a4a;
-            }
-            
-            QComboBox#filterCombo::drop-down {
-                border: none;
-                padding-right: 10px;
-            }
-            
-            QComboBox#filterCombo::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 8px solid #ffffff;
-                margin-right: 5px;
-            }
-            
-            QComboBox#filterCombo QAbstractItemView {
-                background-color: #404040;
-                border: 2px solid #e63946;
-                border-radius: 8px;
-                selection-background-color: #e63946;
-                color: #ffffff;
-            }
-            
-            QDateEdit#dateInput {
-                background-color: #404040;
-                border: 2px solid #505050;
-                border-radius: 8px;
-                padding: 12px 15px;
-                font-size: 14px;
-                color: #ffffff;
-            }
-            
-            QDateEdit#dateInput:hover {
-                border-color: #e63946;
-                background-color: #4a4a4a;
-            }
-            
-            QDateEdit#dateInput::drop-down {
-                border: none;
-                padding-right: 10px;
-            }
-            
-            QDateEdit#dateInput::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 8px solid #ffffff;
-                margin-right: 5px;
-            }
-            
-            /* Search and Clear Buttons */
-            QPushButton#searchButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e63946, stop:1 #c1121f);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 20px;
-            }
-            
-            QPushButton#searchButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff6b6b, stop:1 #e63946);
-            }
-            
-            QPushButton#clearButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #6c757d, stop:1 #495057);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 20px;
-            }
-            
-            QPushButton#clearButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #5a6268, stop:1 #343a40);
-            }
-            
-            /* Stats Frame - DARK seamless */
-            QFrame#statsFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-bottom: 1px solid #404040;
-            }
-            
-            QFrame#statCard {
-                background-color: #404040;
-                border: 2px solid #505050;
-                border-radius: 10px;
-            }
-            
-            QFrame#statCard:hover {
-                border-color: #e63946;
-                background-color: #4a4a4a;
-            }
-            
-            QLabel#statIcon {
-                font-size: 20px;
-                background: transparent;
-            }
-            
-            QLabel#statValue {
-                background: transparent;
-            }
-            
-            QLabel#statLabel {
-                color: #cccccc;
-                font-size: 13px;
-                font-weight: 500;
-                background: transparent;
-            }
-            
-            /* Table Frame - DARK seamless */
-            QFrame#tableFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-bottom: 1px solid #404040;
-            }
-            
-            /* Section Titles */
-            QLabel#sectionTitle {
-                color: #ffffff;
-                font-size: 20px;
-                font-weight: bold;
-                background: transparent;
-                padding: 0px 0px 10px 0px;
-                border-bottom: 3px solid #e63946;
-            }
-            
-            /* Table Styling - DARK */
-            QTableWidget#sessionsTable {
-                background-color: #404040;
-                alternate-background-color: #4a4a4a;
-                border: none;
-                gridline-color: #505050;
-                font-size: 13px;
-                selection-background-color: #e63946;
-                selection-color: white;
-            }
-            
-            QTableWidget#sessionsTable::item {
-                padding: 12px 8px;
-                border-bottom: 1px solid #505050;
-            }
-            
-            QTableWidget#sessionsTable::item:selected {
-                background-color: #e63946;
-                color: white;
-            }
-            
-            QTableWidget#sessionsTable::item:hover {
-                background-color: #4a4a4a;
-            }
-            
-            QHeaderView::section {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e63946, stop:1 #c1121f);
-                color: white;
-                padding: 12px 8px;
-                border: none;
-                border-right: 1px solid #a00e1c;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            
-            QHeaderView::section:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff6b6b, stop:1 #e63946);
-            }
-            
-            /* Scrollbars - DARK */
-            QScrollBar:vertical {
-                background-color: #404040;
-                width: 12px;
-                border-radius: 6px;
-                margin: 0px;
-            }
-            
-            QScrollBar::handle:vertical {
-                background-color: #e63946;
-                border-radius: 6px;
-                min-height: 30px;
-            }
-            
-            QScrollBar::handle:vertical:hover {
-                background-color: #ff6b6b;
-            }
-            
-            /* Actions Frame - DARK seamless */
-            QFrame#actionsFrame {
-                background-color: #2c2c2c;
-                border: none;
-                border-top: 2px solid #e63946;
-            }
-            
-            QLabel#actionsTitle {
-                color: #e63946;
-                font-size: 18px;
-                font-weight: bold;
-                background: transparent;
-            }
-            
-            /* Action Buttons */
-            QPushButton#addButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #38b000, stop:1 #2d8000);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 15px;
-            }
-            
-            QPushButton#addButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4ade80, stop:1 #38b000);
-            }
-            
-            QPushButton#editButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e63946, stop:1 #c1121f);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 15px;
-            }
-            
-            QPushButton#editButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff6b6b, stop:1 #e63946);
-            }
-            
-            QPushButton#deleteButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #dc3545, stop:1 #a71e2a);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 15px;
-            }
-            
-            QPushButton#deleteButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e74c3c, stop:1 #dc3545);
-            }
-            
-            QPushButton#exportButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #17a2b8, stop:1 #0f7b8a);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0px 15px;
-            }
-            
-            QPushButton#exportButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #28a9c4, stop:1 #17a2b8);
-            }
-            
-            /* Message Boxes - DARK */
-            QMessageBox {
-                background-color: #2c2c2c;
-                color: #ffffff;
-            }
-            
-            QMessageBox QPushButton {
-                background-color: #e63946;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 20px;
-                font-weight: 600;
-                min-width: 80px;
-            }
-            
-            QMessageBox QPushButton:hover {
-                background-color: #ff6b6b;
-            }
-            
-            /* Input Dialogs - DARK */
-            QInputDialog {
-                background-color: #2c2c2c;
-                color: #ffffff;
-            }
-            
-            QInputDialog QLineEdit {
-                background-color: #404040;
-                border: 2px solid #505050;
-                border-radius: 8px;
-                padding: 8px 12px;
-                font-size: 14px;
-                color: #ffffff;
-            }
-            
-            QInputDialog QLineEdit:focus {
-                border-color: #e63946;
-                background-color: #4a4a4a;
-            }
-            
-            QInputDialog QComboBox {
-                background-color: #404040;
-                border: 2px solid #505050;
-                border-radius: 8px;
-                padding: 8px 12px;
-                font-size: 14px;
-                color: #ffffff;
-            }
-            
-            QInputDialog QComboBox:hover {
-                border-color: #e63946;
-                background-color: #4a4a4a;
-            }
-        """
-        self.setStyleSheet(style_sheet)
+        apply_theme(self, 'sessions')
 
     def get_session_stats(self):
         """Get session statistics"""
         try:
-            sessions = self.controller.get_all()
-            total = len(sessions)
-            private = 0
-            group = 0
-            today = 0
-            
-            today_date = datetime.now().date().strftime('%Y-%m-%d')
-            
-            for session in sessions:
-                # session: id, client_id, trainer_name, session_date, session_type, is_group
-                if session[5]:  # is_group
-                    group += 1
-                else:
-                    private += 1
-                
-                if session[3] == today_date:  # session_date
-                    today += 1
-            
-            return {
-                'total': total,
-                'private': private,
-                'group': group,
-                'today': today
-            }
-        except:
+            return self.controller.get_stats()
+        except Exception:
             return {'total': 0, 'private': 0, 'group': 0, 'today': 0}
 
     def on_search_text_changed(self):
@@ -781,63 +379,70 @@ class SessionsView(QWidget):
         self.load_sessions()
 
     def load_sessions(self):
-        """Load sessions with filters applied"""
-        trainer = self.trainer_input.text().strip()
-        client = self.client_input.text().strip()
-        session_type = self.type_combo.currentText()
-        date = self.date_picker.date().toString('yyyy-MM-dd')
-        
-        sessions = self.controller.get_all()
-        filtered = []
-        
-        for s in sessions:
-            # s: id, client_id, trainer_name, session_date, session_type, is_group
-            show = True
-            
-            if trainer and trainer.lower() not in (s[2] or '').lower():
-                show = False
-            
-            if client:
-                client_name = self.get_client_name_by_id(s[1])
-                client_code = self.get_client_code_by_id(s[1])
-                if (client.lower() not in (client_name or '').lower() and 
-                    client.lower() not in (client_code or '').lower()):
-                    show = False
-            
-            if session_type != self.tr('All Types'):
-                if session_type.lower() not in (s[4] or '').lower():
-                    show = False
-            
-            # Only filter by date if it's not today's date
-            current_date = QDate.currentDate().toString('yyyy-MM-dd')
-            if date != current_date and date != (s[3] or ''):
-                show = False
-            
-            if show:
-                filtered.append(s)
-        
-        self.populate_table(filtered)
+        """Load the first page of sessions with filters applied"""
+        index = self.type_combo.currentIndex()
+        date = self.date_picker.date()
+        self.session_filters = {
+            'trainer': self.trainer_input.text().strip(),
+            'client_text': self.client_input.text().strip(),
+            'is_group': self.SESSION_TYPES[index] if 0 <= index < len(self.SESSION_TYPES) else None,
+            # Today's date (the picker default) means any date
+            'session_date': None if date == QDate.currentDate() else date.toString('yyyy-MM-dd'),
+        }
+        # Supersedes a load still in flight, e.g. from the previous keystroke
+        self.runner.submit('sessions', self._load_first_page, self.session_filters,
+                           on_result=self._on_first_page,
+                           on_error=lambda e: QMessageBox.critical(
+                               self, self.tr('Error'), self.tr(f'❌ Error loading sessions: {str(e)}')))
+
+    def _load_first_page(self, filters):
+        # Runs on a worker thread
+        total = self.controller.count(**filters)
+        sessions = self.controller.search(limit=self.PAGE_SIZE, offset=0, **filters)
+        return total, sessions
+
+    def _on_first_page(self, result):
+        self.total_count, sessions = result
+        self.table.setRowCount(0)
+        self.loaded_count = len(sessions)
+        self.populate_table(sessions)
+
+    def load_more_sessions(self):
+        """Append the next page of sessions to the table"""
+        # The loaded rows belong to the previous filter until the first page lands
+        if self.runner.is_loading('sessions') or self.loaded_count >= self.total_count:
+            return
+        # Follow-up pages are small index walks and stay on the GUI thread
+        # session: id, client_id, client_code, client_name, trainer_name, session_date,
+        #          session_type, is_group
+        sessions = self.controller.search(limit=self.PAGE_SIZE, offset=self.loaded_count,
+                                          **self.session_filters)
+        if not sessions:
+            # Sessions were deleted since the count was taken
+            self.total_count = self.loaded_count
+            return
+        self.loaded_count += len(sessions)
+        self.populate_table(sessions)
+
+    def on_table_scrolled(self, value):
+        if value >= self.table.verticalScrollBar().maximum():
+            self.load_more_sessions()
 
     def populate_table(self, sessions):
-        """Populate table with session data"""
-        self.table.setRowCount(0)
-        
+        """Append session rows to the table"""
+        self.table.setUpdatesEnabled(False)
         for s in sessions:
             row = self.table.rowCount()
             self.table.insertRow(row)
             
-            # Get client info
-            client_code = self.get_client_code_by_id(s[1])
-            client_name = self.get_client_name_by_id(s[1])
-            
             # Add data to table
             items = [
-                QTableWidgetItem(str(client_code or '')),
-                QTableWidgetItem(str(client_name or '')),
-                QTableWidgetItem(str(s[2] or '')),  # trainer_name
-                QTableWidgetItem(str(s[3] or '')),  # session_date
-                QTableWidgetItem(str(s[4] or '')),  # session_type
-                QTableWidgetItem(self.tr('Yes') if s[5] else self.tr('No'))  # is_group
+                QTableWidgetItem(str(s[2])),  # client_code
+                QTableWidgetItem(str(s[3])),  # client_name
+                QTableWidgetItem(str(s[4] or '')),  # trainer_name
+                QTableWidgetItem(str(s[5] or '')),  # session_date
+                QTableWidgetItem(str(s[6] or '')),  # session_type
+                QTableWidgetItem(self.tr('Yes') if s[7] else self.tr('No'))  # is_group
             ]
             
             for col, item in enumerate(items):
@@ -847,6 +452,7 @@ class SessionsView(QWidget):
             
             # Set row height
             self.table.setRowHeight(row, 50)
+        self.table.setUpdatesEnabled(True)
 
     def open_add_session(self):
         """Open dialog to add new session"""
@@ -982,66 +588,52 @@ class SessionsView(QWidget):
                                   self.tr('ℹ️ Session deletion feature needs to be implemented in the controller.'))
 
     def export_data(self):
-        """Export session data"""
-        try:
-            import csv
-            from PyQt5.QtWidgets import QFileDialog
-            
-            filename, _ = QFileDialog.getSaveFileName(
-                self, 
-                self.tr('Export Sessions Data'),
-                f'sessions_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv',
-                'CSV files (*.csv)'
-            )
-            
-            if filename:
-                sessions = self.controller.get_all()
-                with open(filename, 'w', newline='', encoding='utf-8') as file:
-                    writer = csv.writer(file)
-                    # Write header
-                    writer.writerow(['Client Code', 'Client Name', 'Trainer', 'Date', 'Type', 'Group Session'])
-                    
-                    # Write data
-                    for session in sessions:
-                        client_code = self.get_client_code_by_id(session[1])
-                        client_name = self.get_client_name_by_id(session[1])
-                        is_group = 'Yes' if session[5] else 'No'
-                        
-                        row = [
-                            client_code,
-                            client_name,
-                            session[2],  # trainer_name
-                            session[3],  # session_date
-                            session[4],  # session_type
-                            is_group
-                        ]
-                        writer.writerow(row)
-                
-                QMessageBox.information(self, self.tr('Export Complete'), 
-                                      self.tr(f'✅ Data exported successfully to:\n{filename}'))
-        except Exception as e:
-            QMessageBox.critical(self, self.tr('Export Error'), 
-                               self.tr(f'❌ Error exporting data: {str(e)}'))
-
-    def get_client_name_by_id(self, client_id):
-        """Get client name by ID"""
-        try:
-            from models.db_manager import DBManager
-            db = DBManager()
-            row = db.fetchone('SELECT name FROM clients WHERE id=?', (client_id,))
-            return row[0] if row else 'Unknown'
-        except:
-            return 'Unknown'
+        """Export sessions data in the background"""
+        from PyQt5.QtWidgets import QFileDialog
 
-    def get_client_code_by_id(self, client_id):
-        """Get client code by ID"""
+        filename, _ = QFileDialog.getSaveFileName(
+            self, 
+            self.tr('Export Sessions Data'),
+            f'sessions_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv',
+            'CSV files (*.csv)'
+        )
+        if not filename:
+            return
+        self.exports.submit(
+            self.tr('Export Sessions Data'), self.write_export, filename,
+            on_result=lambda count: QMessageBox.information(
+                self, self.tr('Export Complete'), self.tr(f'✅ Data exported successfully to:\n{filename}')),
+            on_error=lambda e: QMessageBox.critical(
+                self, self.tr('Export Error'), self.tr(f'❌ Error exporting data: {str(e)}')))
+
+    def write_export(self, filename, progress=None):
+        """Write all sessions to a CSV file; runs on an export worker thread"""
+        import csv
+
+        count = 0
         try:
-            from models.db_manager import DBManager
-            db = DBManager()
-            row = db.fetchone('SELECT client_code FROM clients WHERE id=?', (client_id,))
-            return row[0] if row else 'Unknown'
-        except:
-            return 'Unknown'
+            with open(filename, 'w', newline='', encoding='utf-8') as file:
+                writer = csv.writer(file)
+                writer.writerow(['Client Code', 'Client Name', 'Trainer', 'Date', 'Type', 'Group Session'])
+                # Streamed in batches; export_rows reports progress and raises on cancel
+                for session in self.controller.export_rows(progress):
+                    writer.writerow([
+                        session[2],  # client_code
+                        session[3],  # client_name
+                        session[4],  # trainer_name
+                        session[5],  # session_date
+                        session[6],  # session_type
+                        'Yes' if session[7] else 'No'
+                    ])
+                    count += 1
+        except Exception:
+            remove_partial(filename)
+            raise
+        return count
+
+    def is_busy(self):
+        """True while an export is still running"""
+        return self.exports.is_busy()
 
     def get_client_id_by_code(self, code):
         """Get client ID by code"""
@@ -1057,6 +649,13 @@ class SessionsView(QWidget):
         """Translation method placeholder"""
         return self.translator.translate(text)
 
+    def set_loading(self, key, loading):
+        """Show a busy cursor over the table while sessions are being queried"""
+        if loading:
+            self.table.setCursor(Qt.BusyCursor)
+        else:
+            self.table.unsetCursor()
+
     def retranslate_ui(self):
         if self.translator.get_language() == 'ar':
             self.setLayoutDirection(Qt.RightToLeft)
@@ -1076,12 +675,16 @@ class SessionsView(QWidget):
         if hasattr(self, 'client_input'):
             self.client_input.setPlaceholderText(self.tr('Search by client code/name...'))
         if hasattr(self, 'type_combo'):
+            current = self.type_combo.currentIndex()
+            self.type_combo.blockSignals(True)
             self.type_combo.clear()
             self.type_combo.addItems([
                 self.tr('All Types'),
                 self.tr('Private'),
                 self.tr('Group')
             ])
+            self.type_combo.setCurrentIndex(max(current, 0))
+            self.type_combo.blockSignals(False)
         if hasattr(self, 'filter_btn'):
             self.filter_btn.setText(self.tr('🔍 Filter'))
         if hasattr(self, 'clear_btn'):
@@ -0,0 +1,25 @@
+import os
+from functools import lru_cache
+
+STYLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'styles')
+
+# Module views share the base rules (background, header, titles, scrollbars, message boxes)
+MODULE_VIEWS = ('attendance', 'clients', 'diagnostics', 'finance', 'invitations', 'loans',
+                'reports', 'sessions', 'user_management')
+
+
+def _read(name):
+    with open(os.path.join(STYLES_DIR, f'{name}.qss'), encoding='utf-8') as f:
+        return f.read()
+
+
+@lru_cache(maxsize=None)
+def load_stylesheet(name):
+    """Return the stylesheet for a view, read from disk once per process."""
+    if name in MODULE_VIEWS:
+        return _read('base') + '\n' + _read(name)
+    return _read(name)
+
+
+def apply_theme(widget, name):
+    widget.setStyleSheet(load_stylesheet(name))
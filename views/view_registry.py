@@ -0,0 +1,65 @@
+from collections import OrderedDict
+from PyQt5.QtWidgets import QApplication
+
+
+class ViewRegistry:
+    """Module views kept in a QStackedWidget, created once and reused.
+
+    get() returns the cached view for a name, or builds it with the factory
+    and adds it to the stack. Beyond max_views the least recently shown view
+    is removed from the stack and deleted; it is rebuilt if opened again.
+    Views whose is_busy() is true, such as one with an export running, are
+    kept until they are idle.
+    """
+
+    def __init__(self, stack, max_views=4):
+        self.stack = stack
+        self.max_views = max_views
+        self._views = OrderedDict()  # name -> widget, least recently shown first
+        self.created = 0
+        self.evicted = 0
+
+    def get(self, name, factory):
+        """Return (widget, created) for the module view called name."""
+        widget = self._views.get(name)
+        if widget is not None:
+            self._views.move_to_end(name)
+            return widget, False
+        widget = factory()
+        self._views[name] = widget
+        self.stack.addWidget(widget)
+        self.created += 1
+        self._evict()
+        return widget, True
+
+    def _evict(self):
+        current = self.stack.currentWidget()
+        for name in list(self._views):
+            if len(self._views) <= self.max_views:
+                break
+            widget = self._views[name]
+            if widget is current or (hasattr(widget, 'is_busy') and widget.is_busy()):
+                continue
+            self._discard(name)
+            self.evicted += 1
+
+    def _discard(self, name):
+        widget = self._views.pop(name)
+        self.stack.removeWidget(widget)
+        widget.deleteLater()
+
+    def clear(self):
+        for name in list(self._views):
+            self._discard(name)
+
+    def views(self):
+        return list(self._views.values())
+
+    def stats(self):
+        return {
+            'cached': list(self._views),
+            'created': self.created,
+            'evicted': self.evicted,
+            'stack': self.stack.count(),
+            'live_widgets': len(QApplication.allWidgets()),
+        }